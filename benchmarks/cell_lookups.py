@@ -0,0 +1,89 @@
+"""Micro-benchmark for the cell link and passage lookups.
+
+Compares the current lookups against the former linear scans over the
+neighbors of the cell. Run it from the project root:
+
+    python benchmarks/cell_lookups.py --rows 1000 --cols 1000
+"""
+import random
+import time
+from argparse import ArgumentParser
+from typing import Callable
+
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.models.cell import Cell
+from mazy.models.maze import Maze
+from mazy.utils import consume_generator
+
+Lookup = Callable[[Cell, Cell], bool]
+
+
+def linear_is_linked_to(cell: Cell, other_cell: Cell) -> bool:
+    """Former implementation of Cell.is_linked_to."""
+    return other_cell in [neighbor.cell for neighbor in cell.neighbors.values()]
+
+
+def linear_has_passage_to_cell(cell: Cell, other_cell: Cell) -> bool:
+    """Former implementation of Cell.has_passage_to_cell."""
+    if linear_is_linked_to(cell, other_cell):
+        return [
+            neighbor.passage
+            for neighbor in cell.neighbors.values()
+            if neighbor.cell == other_cell
+        ].pop()
+
+    return False
+
+
+def sample_pairs(maze: Maze, size: int) -> list[tuple[Cell, Cell]]:
+    """Pick random pairs of cells, half of them adjacent."""
+    pairs = []
+    for _ in range(size):
+        cell = maze[random.randrange(maze.rows), random.randrange(maze.cols)]
+        if random.random() < 0.5:
+            other_cell = random.choice(list(cell.neighbors.values())).cell
+        else:
+            other_cell = maze[random.randrange(maze.rows), random.randrange(maze.cols)]
+        pairs.append((cell, other_cell))
+
+    return pairs
+
+
+def measure(lookup: Lookup, pairs: list[tuple[Cell, Cell]]) -> float:
+    """Seconds spent running a lookup over all the pairs."""
+    start = time.perf_counter()
+    for cell, other_cell in pairs:
+        lookup(cell, other_cell)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Build a maze and compare both lookup flavors on the same pairs."""
+    parser = ArgumentParser(description="Cell lookups benchmark")
+    parser.add_argument("-r", "--rows", type=int, default=1000)
+    parser.add_argument("-c", "--cols", type=int, default=1000)
+    parser.add_argument("-n", "--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Building a {args.rows}x{args.cols} maze...")
+    builder = BinaryTreeBuilder(args.rows, args.cols)
+    maze = consume_generator(builder.build_maze())
+    assert isinstance(maze, Maze)
+    pairs = sample_pairs(maze, args.lookups)
+
+    benchmarks: list[tuple[str, Lookup, Lookup]] = [
+        ("is_linked_to", linear_is_linked_to, Cell.is_linked_to),
+        ("has_passage_to_cell", linear_has_passage_to_cell, Cell.has_passage_to_cell),
+    ]
+    for name, linear_lookup, lookup in benchmarks:
+        linear_time = measure(linear_lookup, pairs)
+        current_time = measure(lookup, pairs)
+        print(
+            f"{name}: {linear_time:.3f}s -> {current_time:.3f}s "
+            f"({linear_time / current_time:.1f}x) for {len(pairs)} lookups"
+        )
+
+
+if __name__ == "__main__":
+    main()
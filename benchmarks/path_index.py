@@ -0,0 +1,65 @@
+"""Benchmark for the path index of perfect mazes.
+
+Builds the index once and answers path length queries between random
+cells, one at a time and in a single batch. Run it from the project
+root:
+
+    python benchmarks/path_index.py --rows 1000 --cols 1000
+"""
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.models.maze import MazeBackend
+from mazy.solvers.path_index import PathIndex
+
+
+def main() -> None:
+    """Build a maze, index it and time the queries."""
+    parser = ArgumentParser(description="Path index benchmark")
+    parser.add_argument("-r", "--rows", type=int, default=1000)
+    parser.add_argument("-c", "--cols", type=int, default=1000)
+    parser.add_argument("-n", "--queries", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Building a {args.rows}x{args.cols} maze...")
+    maze = KruskalBuilder(args.rows, args.cols, MazeBackend.COMPACT).build()
+
+    start = time.perf_counter()
+    index = PathIndex(maze)
+    print(
+        f"index: {time.perf_counter() - start:.3f}s to build, "
+        f"{len(index.ancestors)} levels, "
+        f"{sum(level.nbytes for level in index.ancestors) / 2**20:.0f}MB"
+    )
+
+    rng = np.random.default_rng()
+    cells = rng.integers(len(index), size=args.queries)
+    other_cells = rng.integers(len(index), size=args.queries)
+
+    start = time.perf_counter()
+    lengths = index.path_lengths(cells, other_cells)
+    batch_time = time.perf_counter() - start
+    print(
+        f"batch: {batch_time:.3f}s for {args.queries} queries "
+        f"({args.queries / batch_time:,.0f} queries/s)"
+    )
+
+    single_queries = min(args.queries, 100_000)
+    start = time.perf_counter()
+    for cell, other_cell in zip(
+        cells[:single_queries].tolist(), other_cells[:single_queries].tolist()
+    ):
+        index.path_length(cell, other_cell)
+    single_time = time.perf_counter() - start
+    print(
+        f"single: {single_time:.3f}s for {single_queries} queries "
+        f"({single_queries / single_time:,.0f} queries/s)"
+    )
+    print(f"mean path length: {lengths.mean():.0f} steps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark for the maze solvers.
+
+Solves the same maze with each solver, for mazes built with each of the
+chosen builders, reporting the effort of every solver. Then compares
+repeated queries between random cells on a reduced graph, built once,
+against the bidirectional search. Run it from the project root:
+
+    python benchmarks/solvers.py --rows 2000 --cols 2000
+"""
+import random
+import time
+from argparse import ArgumentParser
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.builders.vectorized_builder import (
+    VectorizedBinaryTreeBuilder,
+    VectorizedSidewinderBuilder,
+)
+from mazy.models.maze import MazeBackend
+from mazy.solvers.a_star_solver import AStarSolver
+from mazy.solvers.base_solver import MazeSolver
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.bidirectional_bfs_solver import BidirectionalBFSSolver
+from mazy.solvers.reduced_graph_solver import ReducedGraphSolver
+from mazy.solvers.reduction import ReducedGraph, fill_dead_ends
+
+BUILDERS: dict[str, type[MazeBuilder]] = {
+    "binary-tree-numpy": VectorizedBinaryTreeBuilder,
+    "sidewinder-numpy": VectorizedSidewinderBuilder,
+    "kruskal": KruskalBuilder,
+    "recursive-backtracker": RecursiveBacktrackerBuilder,
+}
+
+SOLVERS: list[MazeSolver] = [
+    BFSSolver(),
+    AStarSolver(),
+    BidirectionalBFSSolver(),
+    ReducedGraphSolver(),
+]
+
+
+def main() -> None:
+    """Build a maze per builder and solve it with every solver."""
+    parser = ArgumentParser(description="Maze solvers benchmark")
+    parser.add_argument("-r", "--rows", type=int, default=2000)
+    parser.add_argument("-c", "--cols", type=int, default=2000)
+    parser.add_argument(
+        "-b",
+        "--builders",
+        type=str,
+        nargs="+",
+        default=["binary-tree-numpy", "sidewinder-numpy", "kruskal"],
+        choices=list(BUILDERS),
+    )
+    parser.add_argument("-q", "--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    for builder_name in args.builders:
+        print(f"Building a {args.rows}x{args.cols} maze using {builder_name}...")
+        builder = BUILDERS[builder_name](args.rows, args.cols, MazeBackend.COMPACT)
+        maze = builder.build()
+
+        for solver in SOLVERS:
+            solution = solver.solve(maze)
+            stats = solution.stats
+            print(
+                f"  {solver.name}: {stats.elapsed:.3f}s, "
+                f"{stats.expanded} expanded, peak frontier of {stats.peak_frontier}, "
+                f"path of {solution.length} steps"
+            )
+
+        compare_queries(maze.passage_mask(), maze.cols, args.queries)
+
+
+def compare_queries(mask: bytearray, cols: int, queries: int) -> None:
+    """Time queries between random cells, with and without a reduced graph."""
+    pairs = [
+        (random.randrange(len(mask)), random.randrange(len(mask)))
+        for _ in range(queries)
+    ]
+    terminals = [index for pair in pairs for index in pair]
+
+    start = time.perf_counter()
+    graph = ReducedGraph(fill_dead_ends(mask, cols, terminals), cols, terminals)
+    reduction_time = time.perf_counter() - start
+    print(
+        f"  reduced graph: {len(graph)} nodes for {len(mask)} cells "
+        f"({len(mask) / len(graph):.0f}x fewer), built in {reduction_time:.3f}s"
+    )
+
+    start = time.perf_counter()
+    for start_index, end_index in pairs:
+        graph.shortest_path(start_index, end_index)
+    graph_time = time.perf_counter() - start
+
+    solver = BidirectionalBFSSolver()
+    start = time.perf_counter()
+    for start_index, end_index in pairs:
+        solver.search(mask, cols, start_index, end_index)
+    search_time = time.perf_counter() - start
+
+    print(
+        f"  {queries} queries: reduced graph {graph_time:.3f}s, "
+        f"{solver.name} {search_time:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
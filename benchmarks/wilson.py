@@ -0,0 +1,57 @@
+"""Benchmark for the Wilson builder against the Binary Tree builder.
+
+Wilson is expected to be slower, since it pays for the random walks
+that make its spanning trees uniform. Run it from the project root:
+
+    python benchmarks/wilson.py --rows 1000 --cols 1000
+"""
+import time
+from argparse import ArgumentParser
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.wilson import WilsonBuilder
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend
+
+
+def measure(builder: MazeBuilder) -> float:
+    """Seconds spent building a maze, without intermediate states."""
+    start = time.perf_counter()
+    maze = builder.build()
+    elapsed = time.perf_counter() - start
+
+    assert is_perfect(maze)
+    return elapsed
+
+
+def main() -> None:
+    """Build a maze of the same size with both builders."""
+    parser = ArgumentParser(description="Wilson builder benchmark")
+    parser.add_argument("-r", "--rows", type=int, default=1000)
+    parser.add_argument("-c", "--cols", type=int, default=1000)
+    parser.add_argument(
+        "-m",
+        "--backend",
+        type=str,
+        default=MazeBackend.COMPACT.value,
+        choices=[backend.value for backend in MazeBackend],
+    )
+    args = parser.parse_args()
+    backend = MazeBackend(args.backend)
+    cells = args.rows * args.cols
+
+    print(f"Building {args.rows}x{args.cols} mazes on the {backend.value} backend...")
+    binary_tree_time = measure(BinaryTreeBuilder(args.rows, args.cols, backend))
+    print(
+        f"binary-tree: {binary_tree_time:.3f}s ({cells / binary_tree_time:,.0f} cells/s)"
+    )
+    wilson_time = measure(WilsonBuilder(args.rows, args.cols, backend))
+    print(
+        f"wilson: {wilson_time:.3f}s ({cells / wilson_time:,.0f} cells/s), "
+        f"{wilson_time / binary_tree_time:.1f}x the binary-tree time"
+    )
+
+
+if __name__ == "__main__":
+    main()
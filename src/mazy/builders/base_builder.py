@@ -1,15 +1,68 @@
 """Contract for maze builders."""
+import random
 from abc import ABC, abstractmethod
-from typing import Generator
+from functools import cached_property
+from typing import Generator, Iterator, Optional, Union
 
-from mazy.models.maze import Maze
+import numpy as np
+
+from mazy.models.grid import MazeGrid, create_maze
+from mazy.models.maze import MazeBackend
+from mazy.utils import consume_generator
+
+Seed = Union[None, int, random.Random, np.random.Generator, np.random.SeedSequence]
+
+
+def random_streams(seed: Seed = None) -> tuple[random.Random, np.random.Generator]:
+    """Python and NumPy random generators of a builder, from a single seed.
+
+    A seed or a seed sequence makes both generators. A Python or NumPy
+    generator is used as given, seeding the other one from it. Without
+    a seed, both are seeded from the global random state, so seeding the
+    random module still makes builders reproducible.
+    """
+    match seed:
+        case random.Random():
+            return seed, np.random.default_rng(seed.getrandbits(128))
+        case np.random.Generator():
+            return random.Random(seed.bytes(32)), seed
+        case np.random.SeedSequence():
+            sequence = seed
+        case None:
+            sequence = np.random.SeedSequence(random.getrandbits(128))
+        case _:
+            if seed < 0:
+                raise ValueError(f"Seed must be a non-negative number, got {seed}.")
+            sequence = np.random.SeedSequence(seed)
+
+    python_seed = sequence.generate_state(8).tobytes()
+    return random.Random(python_seed), np.random.default_rng(sequence)
 
 
 class MazeBuilder(ABC):
-    """Abstraction for maze builders."""
+    """Abstraction for maze builders.
 
-    def __init__(self, rows: int, cols: int):
-        self.maze = Maze(rows, cols)
+    Builders draw every random choice from their own generators, made
+    from the given seed, so the same seed always builds the same maze.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        backend: MazeBackend = MazeBackend.OBJECTS,
+        seed: Seed = None,
+    ):
+        self.rows = rows
+        self.cols = cols
+        self.backend = backend
+        self.random, self.rng = random_streams(seed)
+        self.touched: Optional[list[tuple[int, int]]] = None
+
+    @cached_property
+    def maze(self) -> MazeGrid:
+        """Maze being built, allocated on the first access."""
+        return create_maze(self.rows, self.cols, self.backend)
 
     @property
     @abstractmethod
@@ -18,10 +71,67 @@ class MazeBuilder(ABC):
         ...
 
     @abstractmethod
-    def build_maze(self) -> Generator[Maze, None, Maze]:
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
         """Build a maze.
 
         Returns a Maze generator. This is useful to get each state of the
         maze during the building process.
         """
         ...
+
+    def build_steps(self) -> Generator[list[tuple[int, int]], None, MazeGrid]:
+        """Build a maze step by step, producing the cells touched by each step.
+
+        A cell is touched when a step visits it or carves a passage from
+        it: every passage carved has at least one touched end. Viewers
+        only need to refresh the touched cells and the neighbors sharing
+        their walls, instead of the whole maze.
+        """
+        touched: list[tuple[int, int]] = []
+        self.touched = touched
+        steps = self.build_maze()
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                maze: MazeGrid = stop.value
+                break
+
+            yield touched.copy()
+            touched.clear()
+
+        if touched:
+            yield touched.copy()
+
+        self.touched = None
+        return maze
+
+    def visit(self, row: int, col: int) -> None:
+        """Mark a cell as visited, reporting it as touched by the current step."""
+        self.maze[row, col].visited = True
+        self.touch(row, col)
+
+    def touch(self, row: int, col: int) -> None:
+        """Report a cell as touched by the current step, when steps are tracked."""
+        if self.touched is not None:
+            self.touched.append((row, col))
+
+    def build(self) -> MazeGrid:
+        """Build a maze at once, returning only the final result.
+
+        Builders should override it with a path free of intermediate
+        states and visited flags. By default, the generator is drained.
+        """
+        return consume_generator(self.build_maze())
+
+    def build_rows(self) -> Iterator[bytes]:
+        """Build a maze, producing the passage bitmasks row by row.
+
+        By default, the whole maze is built before the first row comes
+        out. Streaming builders override it to keep only a few rows in
+        memory, never allocating the maze.
+        """
+        maze = self.build()
+        mask = maze.passage_mask()
+        for start in range(0, len(mask), maze.cols):
+            yield bytes(mask[start : start + maze.cols])
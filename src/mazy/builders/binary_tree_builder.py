@@ -1,10 +1,10 @@
 """Binary Tree Maze builder."""
-import random
 from typing import Generator
 
 from mazy.builders.base_builder import MazeBuilder
 from mazy.models.cell import Direction
-from mazy.models.maze import Maze, MazeState
+from mazy.models.grid import GridCell, MazeGrid
+from mazy.models.maze import MazeState
 
 NAVIGATION_DIRECTIONS = [Direction.EAST, Direction.SOUTH]
 
@@ -17,21 +17,33 @@ class BinaryTreeBuilder(MazeBuilder):
         """Builder name."""
         return "binary-tree"
 
-    def build_maze(self) -> Generator[Maze, None, Maze]:
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
         """Build a maze using Binary Tree algorithm."""
         for cell in self.maze.traverse_by_cell():
-            choices = [
-                direction
-                for direction, neighbor in cell.neighbors.items()
-                if not neighbor.passage and direction in NAVIGATION_DIRECTIONS
-            ]
+            self.carve_from(cell)
+            self.visit(cell.row, cell.col)
+            yield self.maze
 
-            if choices:
-                target_direction: Direction = random.choice(choices)
-                cell.carve_passage_to_direction(target_direction)
+        self.maze.state = MazeState.READY
+        return self.maze
 
-            cell.visited = True
-            yield self.maze
+    def build(self) -> MazeGrid:
+        """Build a maze using Binary Tree algorithm, without intermediate states."""
+        for cell in self.maze.traverse_by_cell():
+            self.carve_from(cell)
 
         self.maze.state = MazeState.READY
         return self.maze
+
+    def carve_from(self, cell: GridCell) -> None:
+        """Carve a passage from the cell to one of the navigation directions."""
+        choices = [
+            direction
+            for direction in NAVIGATION_DIRECTIONS
+            if cell.has_link_to_direction(direction)
+            and not cell.has_passage_to_direction(direction)
+        ]
+
+        if choices:
+            target_direction: Direction = self.random.choice(choices)
+            cell.carve_passage_to_direction(target_direction)
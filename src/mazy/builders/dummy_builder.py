@@ -3,7 +3,8 @@ from typing import Generator
 
 from mazy.builders.base_builder import MazeBuilder
 from mazy.models.cell import Direction
-from mazy.models.maze import Maze, MazeState
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeState
 
 NAVIGATION_DIRECTIONS = [Direction.EAST, Direction.SOUTH]
 
@@ -16,11 +17,16 @@ class DummyBuilder(MazeBuilder):
         """Builder name."""
         return "dummy"
 
-    def build_maze(self) -> Generator[Maze, None, Maze]:
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
         """Build a maze without passages."""
         for cell in self.maze.traverse_by_cell():
-            cell.visited = True
+            self.visit(cell.row, cell.col)
             yield self.maze
 
         self.maze.state = MazeState.READY
         return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze without passages, without intermediate states."""
+        self.maze.state = MazeState.READY
+        return self.maze
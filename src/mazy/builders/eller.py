@@ -0,0 +1,117 @@
+"""Eller Maze builder."""
+from typing import Generator, Iterator
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.models.cell import EAST, NORTH, SOUTH, WEST, Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeState
+from mazy.utils import DisjointSet
+
+
+class EllerBuilder(MazeBuilder):
+    """Eller Maze builder.
+
+    Builds the maze one row at a time, only keeping track of which set
+    each column of the current row belongs to. Rows can be streamed
+    through build_rows with O(cols) memory, regardless of the number
+    of rows, without ever allocating the maze.
+    """
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "eller"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze using Eller algorithm, one row per step."""
+        for row, row_mask in enumerate(self.build_rows()):
+            self.write_row(row, row_mask)
+            for col in range(self.maze.cols):
+                self.visit(row, col)
+            yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Eller algorithm, without intermediate states."""
+        for row, row_mask in enumerate(self.build_rows()):
+            self.write_row(row, row_mask)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def write_row(self, row: int, row_mask: bytes) -> None:
+        """Carve the passages of a row into the maze."""
+        if isinstance(self.maze, CompactMaze):
+            start = row * self.maze.cols
+            self.maze.passages[start : start + self.maze.cols] = row_mask
+            return
+
+        for col, cell_mask in enumerate(row_mask):
+            if cell_mask & EAST:
+                self.maze.carve_passage(row, col, Direction.EAST)
+            if cell_mask & SOUTH:
+                self.maze.carve_passage(row, col, Direction.SOUTH)
+
+    def build_rows(self) -> Iterator[bytes]:
+        """Stream the passage bitmasks of the maze, row by row.
+
+        Set labels are always in [0, cols): each row gets a fresh
+        union-find over them, and the sets carried down to the next row
+        keep their root as label while the new cells take the free ones.
+        """
+        rows, cols = self.rows, self.cols
+        coin, randrange = self.random.random, self.random.randrange
+        labels = list(range(cols))
+        row_mask = bytearray(cols)
+
+        for row in range(rows):
+            last_row = row == rows - 1
+            sets = DisjointSet(cols)
+
+            for col in range(cols - 1):
+                if (last_row or coin() < 0.5) and sets.union(
+                    labels[col], labels[col + 1]
+                ):
+                    row_mask[col] |= EAST
+                    row_mask[col + 1] |= WEST
+
+            if last_row:
+                yield bytes(row_mask)
+                return
+
+            roots = [sets.find(label) for label in labels]
+            next_mask = bytearray(cols)
+            carried = bytearray(cols)
+            members = [0] * cols
+            candidates = [0] * cols
+
+            for col, root in enumerate(roots):
+                if coin() < 0.5:
+                    next_mask[col] = NORTH
+                    carried[root] = 1
+
+                # Reservoir sampling, in case the set carves no passage south.
+                members[root] += 1
+                if randrange(members[root]) == 0:
+                    candidates[root] = col
+
+            for root in range(cols):
+                if members[root] and not carried[root]:
+                    next_mask[candidates[root]] = NORTH
+                    carried[root] = 1
+
+            for col in range(cols):
+                if next_mask[col]:
+                    row_mask[col] |= SOUTH
+
+            yield bytes(row_mask)
+
+            free_labels = [label for label in range(cols) if not carried[label]]
+            labels = [
+                roots[col] if next_mask[col] else free_labels.pop()
+                for col in range(cols)
+            ]
+            row_mask = next_mask
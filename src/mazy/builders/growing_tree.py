@@ -0,0 +1,200 @@
+"""Growing Tree Maze builder."""
+from array import array
+from typing import Generator, Iterator, Optional
+
+from mazy.builders.base_builder import MazeBuilder, Seed
+from mazy.models.builder import CellSelection
+from mazy.models.cell import DIRECTION_OFFSETS
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import Bitmap
+
+
+# Slot of a cell removed from the middle of the active cells.
+REMOVED = -1
+
+
+class ActiveCells:
+    """Active cells of a Growing Tree, in the order they were added.
+
+    Cells are kept in an array, from a head position on, and positions
+    are the slots past the head. The newest and the oldest cells are
+    removed in O(1) by popping the tail or by moving the head. Any other
+    cell is removed in O(1) by marking its slot, which keeps the order
+    of the rest, so the tail always holds the newest cell and the head
+    the oldest one. Slots are compacted once removed cells outweigh the
+    active ones.
+    """
+
+    __slots__ = ("cells", "head", "removed")
+
+    def __init__(self) -> None:
+        self.cells = array("q")
+        self.head = 0
+        self.removed = 0
+
+    def __len__(self) -> int:
+        """Number of active cells."""
+        return len(self.cells) - self.head - self.removed
+
+    def __getitem__(self, position: int) -> int:
+        """Cell index on a given slot, from the oldest one, or REMOVED."""
+        return self.cells[self.head + position]
+
+    def __iter__(self) -> Iterator[int]:
+        """Active cells, from the oldest one."""
+        for index in self.cells[self.head :]:
+            if index != REMOVED:
+                yield index
+
+    @property
+    def slots(self) -> int:
+        """Number of slots, from the oldest to the newest cell."""
+        return len(self.cells) - self.head
+
+    def append(self, index: int) -> None:
+        """Add a cell as the newest one."""
+        self.cells.append(index)
+
+    def remove(self, position: int) -> None:
+        """Remove the cell on a given slot, from the oldest one."""
+        cells = self.cells
+        slot = self.head + position
+        if slot == len(cells) - 1:
+            cells.pop()
+            while len(cells) > self.head and cells[-1] == REMOVED:
+                cells.pop()
+                self.removed -= 1
+        elif slot == self.head:
+            self.head += 1
+            while self.head < len(cells) and cells[self.head] == REMOVED:
+                self.head += 1
+                self.removed -= 1
+        else:
+            cells[slot] = REMOVED
+            self.removed += 1
+
+        # Drop the removed cells once they outweigh the active ones.
+        if self.head + self.removed > len(cells) >> 1:
+            self.cells = array("q", iter(self))
+            self.head = 0
+            self.removed = 0
+
+
+class GrowingTreeBuilder(MazeBuilder):
+    """Growing Tree Maze builder.
+
+    Keeps a set of active cells, starting from a random one. At each step
+    a cell is picked from the set and a passage is carved to one of its
+    unvisited neighbors, which becomes active too. Cells left without
+    unvisited neighbors are removed from the set.
+
+    The selection policy shapes the maze: the newest cell behaves like
+    the Recursive Backtracker, the oldest one makes long straight
+    corridors and a random one behaves like Prim. The mixed policy picks
+    the newest cell with the given probability and a random one otherwise.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        backend: MazeBackend = MazeBackend.OBJECTS,
+        selection: CellSelection = CellSelection.NEWEST,
+        mix: float = 0.5,
+        seed: Seed = None,
+    ):
+        super().__init__(rows, cols, backend, seed)
+        if not 0 <= mix <= 1:
+            raise ValueError(f"Mix must be a ratio between 0 and 1, got {mix}.")
+
+        self.selection = selection
+        self.mix = mix
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "growing-tree"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze using Growing Tree algorithm."""
+        visited = Bitmap(self.maze.rows * self.maze.cols)
+        active = self.start(visited)
+        self.visit(*divmod(active[0], self.maze.cols))
+        yield self.maze
+
+        while active:
+            index = self.advance(active, visited)
+            if index is not None:
+                self.visit(*divmod(index, self.maze.cols))
+            yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Growing Tree, without intermediate states."""
+        visited = Bitmap(self.maze.rows * self.maze.cols)
+        active = self.start(visited)
+
+        while active:
+            self.advance(active, visited)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def start(self, visited: Bitmap) -> ActiveCells:
+        """Visit a random cell, returning the active cells with its index."""
+        index = self.random.randrange(self.maze.rows * self.maze.cols)
+        visited[index] = True
+        active = ActiveCells()
+        active.append(index)
+        return active
+
+    def select(self, active: ActiveCells) -> int:
+        """Position of the next active cell, according to the selection policy.
+
+        Random picks draw again on removed slots, which takes less than
+        two draws on average, as active cells fill most of the slots.
+        """
+        match self.selection:
+            case CellSelection.NEWEST:
+                return active.slots - 1
+            case CellSelection.OLDEST:
+                return 0
+            case CellSelection.MIXED if self.random.random() < self.mix:
+                return active.slots - 1
+
+        while True:
+            position = self.random.randrange(active.slots)
+            if active[position] != REMOVED:
+                return position
+
+    def advance(self, active: ActiveCells, visited: Bitmap) -> Optional[int]:
+        """Carve from the selected cell to an unvisited neighbor, or retire it.
+
+        Returns the index of the newly visited cell, if any.
+        """
+        rows, cols = self.maze.rows, self.maze.cols
+        position = self.select(active)
+        index = active[position]
+        row, col = divmod(index, cols)
+
+        choices = [
+            (direction, row_offset * cols + col_offset)
+            for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+            if 0 <= row + row_offset < rows
+            and 0 <= col + col_offset < cols
+            and not visited[index + row_offset * cols + col_offset]
+        ]
+
+        if not choices:
+            active.remove(position)
+            return None
+
+        direction, offset = self.random.choice(choices)
+        self.maze.carve_passage(row, col, direction)
+
+        visited[index + offset] = True
+        active.append(index + offset)
+        return index + offset
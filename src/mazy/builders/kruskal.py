@@ -0,0 +1,101 @@
+"""Kruskal Maze builder."""
+from typing import Generator, Iterator
+
+import numpy as np
+
+from mazy.builders.base_builder import MazeBuilder, Seed
+from mazy.models.cell import Direction
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import DisjointSet
+
+# Number of shuffled walls converted to Python ints at a time.
+CHUNK_SIZE = 1 << 20
+
+
+class KruskalBuilder(MazeBuilder):
+    """Randomized Kruskal Maze builder.
+
+    Walls between adjacent cells are shuffled at once and knocked down
+    in that order whenever they split two disjoint sets of cells. The
+    sets are kept in a union-find, so the whole build is near-linear.
+
+    Each wall is encoded as an integer: twice the index of the cell on
+    its west or north side, plus one for the walls on the south side.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        backend: MazeBackend = MazeBackend.OBJECTS,
+        seed: Seed = None,
+    ):
+        super().__init__(rows, cols, backend, seed)
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "kruskal"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze using Kruskal algorithm.
+
+        Yields the maze before carving anything and then after each
+        passage is carved. Viewers batch the steps as they need.
+        """
+        yield self.maze
+
+        for index, other_index in self.carve_passages():
+            self.visit(*divmod(index, self.maze.cols))
+            self.visit(*divmod(other_index, self.maze.cols))
+            yield self.maze
+
+        for cell in self.maze.traverse_by_cell():
+            if not cell.visited:
+                self.visit(cell.row, cell.col)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Kruskal algorithm, without intermediate states."""
+        for _ in self.carve_passages():
+            pass
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def shuffled_walls(self) -> Iterator[list[int]]:
+        """All the walls between adjacent cells, in chunks of random order."""
+        rows, cols = self.maze.rows, self.maze.cols
+        indexes = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+        walls = np.concatenate(
+            (indexes[:, :-1].ravel() * 2, indexes[:-1, :].ravel() * 2 + 1)
+        )
+        self.rng.shuffle(walls)
+
+        for start in range(0, len(walls), CHUNK_SIZE):
+            yield walls[start : start + CHUNK_SIZE].tolist()
+
+    def carve_passages(self) -> Iterator[tuple[int, int]]:
+        """Knock down the walls, yielding the indexes of each joined pair."""
+        cols = self.maze.cols
+        remaining = self.maze.rows * cols - 1
+        sets = DisjointSet(self.maze.rows * cols)
+
+        for walls in self.shuffled_walls():
+            for wall in walls:
+                if not remaining:
+                    return
+
+                index = wall >> 1
+                if wall & 1:
+                    other_index, direction = index + cols, Direction.SOUTH
+                else:
+                    other_index, direction = index + 1, Direction.EAST
+
+                if sets.union(index, other_index):
+                    self.maze.carve_passage(index // cols, index % cols, direction)
+                    remaining -= 1
+                    yield index, other_index
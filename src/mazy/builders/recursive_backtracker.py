@@ -0,0 +1,85 @@
+"""Recursive Backtracker Maze builder."""
+from array import array
+from typing import Generator, Optional
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.models.cell import DIRECTION_OFFSETS
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeState
+from mazy.utils import Bitmap
+
+
+class RecursiveBacktrackerBuilder(MazeBuilder):
+    """Recursive Backtracker Maze builder.
+
+    Depth-first walk carving passages to unvisited cells and backtracking
+    on dead ends. The recursion is replaced by an explicit stack of cell
+    indices and the visited cells are tracked in a bitmap, so it scales to
+    grids with millions of cells.
+    """
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "recursive-backtracker"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze using Recursive Backtracker algorithm."""
+        visited = Bitmap(self.maze.rows * self.maze.cols)
+        stack = self.start(visited)
+        self.visit(*divmod(stack[-1], self.maze.cols))
+        yield self.maze
+
+        while stack:
+            index = self.advance(stack, visited)
+            if index is not None:
+                self.visit(*divmod(index, self.maze.cols))
+            yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Recursive Backtracker, without intermediate states."""
+        visited = Bitmap(self.maze.rows * self.maze.cols)
+        stack = self.start(visited)
+
+        while stack:
+            self.advance(stack, visited)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def start(self, visited: Bitmap) -> "array[int]":
+        """Visit a random cell, returning the stack with its index."""
+        index = self.random.randrange(self.maze.rows * self.maze.cols)
+        visited[index] = True
+        return array("q", [index])
+
+    def advance(self, stack: "array[int]", visited: Bitmap) -> Optional[int]:
+        """Carve to an unvisited neighbor of the top cell, or backtrack.
+
+        Returns the index of the newly visited cell, if any.
+        """
+        rows, cols = self.maze.rows, self.maze.cols
+        index = stack[-1]
+        row, col = divmod(index, cols)
+
+        choices = [
+            (direction, row_offset * cols + col_offset)
+            for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+            if 0 <= row + row_offset < rows
+            and 0 <= col + col_offset < cols
+            and not visited[index + row_offset * cols + col_offset]
+        ]
+
+        if not choices:
+            stack.pop()
+            return None
+
+        direction, offset = self.random.choice(choices)
+        self.maze.carve_passage(row, col, direction)
+
+        visited[index + offset] = True
+        stack.append(index + offset)
+        return index + offset
@@ -1,10 +1,10 @@
 """Binary Tree Maze builder."""
-import random
 from typing import Generator
 
 from mazy.builders.base_builder import MazeBuilder
 from mazy.models.cell import Direction
-from mazy.models.maze import Maze, MazeState
+from mazy.models.grid import GridCell, MazeGrid
+from mazy.models.maze import MazeState
 
 NAVIGATION_DIRECTIONS = [Direction.EAST, Direction.SOUTH]
 
@@ -17,29 +17,49 @@ class SidewinderBuilder(MazeBuilder):
         """Builder name."""
         return "sidewinder"
 
-    def build_maze(self) -> Generator[Maze, None, Maze]:
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
         """Build a maze using Sidewinder algorithm."""
-        run = []
+        run: list[GridCell] = []
         for cell in self.maze.traverse_by_cell():
-            choices = [
-                direction
-                for direction, neighbor in cell.neighbors.items()
-                if not neighbor.passage and direction in NAVIGATION_DIRECTIONS
-            ]
-
-            if choices:
-                target_direction: Direction = random.choice(choices)
-
-                if target_direction == Direction.EAST:
-                    cell.carve_passage_to_direction(target_direction)
-                    run.append(cell)
-                else:
-                    cell_from_run = random.choice(run) if len(run) else cell
-                    cell_from_run.carve_passage_to_direction(target_direction)
-                    run = []
-
-            cell.visited = True
+            closed_run = run
+            run = self.carve_from(cell, run)
+            if run is not closed_run:
+                # The passage south may be carved from any cell of the run.
+                for run_cell in closed_run:
+                    self.touch(run_cell.row, run_cell.col)
+            self.visit(cell.row, cell.col)
             yield self.maze
 
         self.maze.state = MazeState.READY
         return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Sidewinder algorithm, without intermediate states."""
+        run: list[GridCell] = []
+        for cell in self.maze.traverse_by_cell():
+            run = self.carve_from(cell, run)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def carve_from(self, cell: GridCell, run: list[GridCell]) -> list[GridCell]:
+        """Carve a passage from the cell, returning the updated run of cells."""
+        choices = [
+            direction
+            for direction in NAVIGATION_DIRECTIONS
+            if cell.has_link_to_direction(direction)
+            and not cell.has_passage_to_direction(direction)
+        ]
+
+        if choices:
+            target_direction: Direction = self.random.choice(choices)
+
+            if target_direction == Direction.EAST:
+                cell.carve_passage_to_direction(target_direction)
+                run.append(cell)
+            else:
+                cell_from_run = self.random.choice(run) if len(run) else cell
+                cell_from_run.carve_passage_to_direction(target_direction)
+                run = []
+
+        return run
@@ -0,0 +1,164 @@
+"""Vectorized (NumPy) Maze builders."""
+from abc import abstractmethod
+from typing import Generator
+
+import numpy as np
+import numpy.typing as npt
+
+from mazy.builders.base_builder import MazeBuilder, Seed
+from mazy.models.cell import DIRECTION_MASKS, Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeBackend, MazeState
+
+# Upper bound of cells carved per vectorized step, bounding temporary arrays.
+CHUNK_SIZE = 1 << 20
+
+Passages = npt.NDArray[np.bool_]
+
+
+class VectorizedBuilder(MazeBuilder):
+    """Builder carving whole blocks of rows with array operations.
+
+    Subclasses decide the east and south passages of a block of rows at
+    once. On a compact maze they are written straight into the passage
+    buffer; other backends are carved cell by cell.
+
+    Random draws must not depend on how rows are grouped into blocks, so
+    the same seed builds the same maze at once or one row per step.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        backend: MazeBackend = MazeBackend.COMPACT,
+        seed: Seed = None,
+    ):
+        super().__init__(rows, cols, backend, seed)
+
+    @abstractmethod
+    def choose_passages(self, start: int, stop: int) -> tuple[Passages, Passages]:
+        """Decide the east and south passages for the rows in [start, stop)."""
+        ...
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze one row per step."""
+        for row in range(self.maze.rows):
+            self.carve_rows(row, row + 1)
+            for col in range(self.maze.cols):
+                self.visit(row, col)
+            yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze in blocks of rows, without intermediate states."""
+        block = max(1, CHUNK_SIZE // self.maze.cols)
+        for start in range(0, self.maze.rows, block):
+            self.carve_rows(start, min(start + block, self.maze.rows))
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def carve_rows(self, start: int, stop: int) -> None:
+        """Carve the passages chosen for the rows in [start, stop)."""
+        east, south = self.choose_passages(start, stop)
+
+        if isinstance(self.maze, CompactMaze):
+            grid = np.frombuffer(self.maze.passages, dtype=np.uint8).reshape(
+                self.maze.rows, self.maze.cols
+            )
+            grid[start:stop] |= east * np.uint8(DIRECTION_MASKS[Direction.EAST])
+            grid[start:stop, 1:] |= east[:, :-1] * np.uint8(
+                DIRECTION_MASKS[Direction.WEST]
+            )
+            grid[start:stop] |= south * np.uint8(DIRECTION_MASKS[Direction.SOUTH])
+            grid[start + 1 : stop + 1] |= south[: self.maze.rows - start - 1] * (
+                np.uint8(DIRECTION_MASKS[Direction.NORTH])
+            )
+            return
+
+        for direction, passages in ((Direction.EAST, east), (Direction.SOUTH, south)):
+            for row, col in np.argwhere(passages).tolist():
+                self.maze[start + row, col].carve_passage_to_direction(direction)
+
+
+class VectorizedBinaryTreeBuilder(VectorizedBuilder):
+    """Vectorized Binary Tree Maze builder."""
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "binary-tree-numpy"
+
+    def choose_passages(self, start: int, stop: int) -> tuple[Passages, Passages]:
+        """Flip one coin per cell between east and south.
+
+        Cells on the last column can only go south and cells on the
+        last row can only go east.
+        """
+        east = self.rng.random((stop - start, self.maze.cols)) < 0.5
+        east[:, -1] = False
+        south = ~east
+
+        if stop == self.maze.rows:
+            east[-1, :-1] = True
+            south[-1, :] = False
+
+        return east, south
+
+
+class VectorizedSidewinderBuilder(VectorizedBuilder):
+    """Vectorized Sidewinder Maze builder.
+
+    The coins and the cells carving south from each run are drawn from
+    separate generators, so each one is drawn in the order of the cells
+    whatever the size of the blocks.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        backend: MazeBackend = MazeBackend.COMPACT,
+        seed: Seed = None,
+    ):
+        super().__init__(rows, cols, backend, seed)
+        self.pick_rng = self.rng.spawn(1)[0]
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "sidewinder-numpy"
+
+    def choose_passages(self, start: int, stop: int) -> tuple[Passages, Passages]:
+        """Flip one coin per cell to extend the run east or to close it.
+
+        Every closed run carves south from one of its cells, picked at
+        random. The last column always closes the run and the last row
+        is a single run going east.
+        """
+        east = self.rng.random((stop - start, self.maze.cols)) < 0.5
+        east[:, -1] = False
+        south = np.zeros_like(east)
+
+        closing_rows = stop - start
+        if stop == self.maze.rows:
+            east[-1, :-1] = True
+            closing_rows -= 1
+
+        # Runs never cross rows, since the last column always closes them.
+        run_ends = np.flatnonzero(~east[:closing_rows])
+        if len(run_ends):
+            run_starts = np.empty_like(run_ends)
+            run_starts[0] = 0
+            run_starts[1:] = run_ends[:-1] + 1
+            run_sizes = run_ends - run_starts + 1
+            picks = run_starts + (
+                self.pick_rng.random(len(run_ends)) * run_sizes
+            ).astype(run_ends.dtype)
+            south.flat[picks] = True
+
+        return east, south
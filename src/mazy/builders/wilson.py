@@ -0,0 +1,106 @@
+"""Wilson Maze builder."""
+from typing import Generator
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.models.cell import DIRECTION_OFFSETS
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeState
+from mazy.utils import Bitmap
+
+# Directions indexed by the two random bits that pick them during a walk.
+WALK_DIRECTIONS = tuple(DIRECTION_OFFSETS)
+ROW_OFFSETS = tuple(row_offset for row_offset, _ in DIRECTION_OFFSETS.values())
+COL_OFFSETS = tuple(col_offset for _, col_offset in DIRECTION_OFFSETS.values())
+
+
+class WilsonBuilder(MazeBuilder):
+    """Wilson Maze builder.
+
+    Grows a uniform spanning tree out of loop-erased random walks: from
+    every cell out of the tree, walk at random until the tree is hit and
+    graft the walk, without its loops, as a new branch.
+
+    Loops are never erased explicitly. The walk only records the last
+    direction taken from each cell, overwriting the previous one when a
+    cell is revisited, so following those directions from the start of
+    the walk traces the loop-erased path. Each walk takes time linear in
+    its length, instead of quadratic.
+    """
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "wilson"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Build a maze using Wilson algorithm, one branch per step."""
+        cols = self.maze.cols
+        in_tree = Bitmap(self.maze.rows * cols)
+        walk = bytearray(self.maze.rows * cols)
+        self.visit(*divmod(self.plant(in_tree), cols))
+        yield self.maze
+
+        for index in range(self.maze.rows * cols):
+            branch = self.grow_branch(index, in_tree, walk)
+            if branch:
+                for branch_index in branch:
+                    self.visit(*divmod(branch_index, cols))
+                yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def build(self) -> MazeGrid:
+        """Build a maze using Wilson algorithm, without intermediate states."""
+        in_tree = Bitmap(self.maze.rows * self.maze.cols)
+        walk = bytearray(self.maze.rows * self.maze.cols)
+        self.plant(in_tree)
+
+        for index in range(self.maze.rows * self.maze.cols):
+            self.grow_branch(index, in_tree, walk)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+    def plant(self, in_tree: Bitmap) -> int:
+        """Add a random cell to the tree, returning its index."""
+        index = self.random.randrange(self.maze.rows * self.maze.cols)
+        in_tree[index] = True
+        return index
+
+    def grow_branch(self, start: int, in_tree: Bitmap, walk: bytearray) -> list[int]:
+        """Walk from a cell until the tree is hit and graft the loop-erased path.
+
+        The walk buffer keeps the last direction taken from each cell.
+        Returns the indexes of the cells added to the tree.
+        """
+        rows, cols = self.maze.rows, self.maze.cols
+        bits = in_tree.bits
+        getrandbits = self.random.getrandbits
+
+        row, col = divmod(start, cols)
+        index = start
+        # The bitmap is read inline: this loop runs once per step of the walk.
+        while not bits[index >> 3] >> (index & 7) & 1:
+            step = getrandbits(2)
+            next_row = row + ROW_OFFSETS[step]
+            next_col = col + COL_OFFSETS[step]
+            if 0 <= next_row < rows and 0 <= next_col < cols:
+                walk[index] = step
+                row, col = next_row, next_col
+                index = row * cols + col
+
+        branch = []
+        row, col = divmod(start, cols)
+        index = start
+        while not in_tree[index]:
+            in_tree[index] = True
+            branch.append(index)
+
+            step = walk[index]
+            self.maze.carve_passage(row, col, WALK_DIRECTIONS[step])
+            row += ROW_OFFSETS[step]
+            col += COL_OFFSETS[step]
+            index = row * cols + col
+
+        return branch
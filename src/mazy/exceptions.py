@@ -19,3 +19,7 @@ class InvalidBuilder(Exception):
 
 class InvalidViewer(Exception):
     """Invalid viewer name provided."""
+
+
+class ImperfectMaze(Exception):
+    """Raised when a maze with loops or unreachable cells is used as a tree."""
@@ -1,17 +1,41 @@
 """CLI for maze generation."""
+import json
 import logging
-from argparse import ArgumentParser, Namespace
-from typing import Optional, Sequence
+import os
+import time
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
 
 from mazy.builders.base_builder import MazeBuilder
 from mazy.builders.binary_tree_builder import BinaryTreeBuilder
 from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.eller import EllerBuilder
+from mazy.builders.growing_tree import GrowingTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
 from mazy.builders.sidewinder import SidewinderBuilder
+from mazy.builders.vectorized_builder import (
+    VectorizedBinaryTreeBuilder,
+    VectorizedSidewinderBuilder,
+)
+from mazy.builders.wilson import WilsonBuilder
 from mazy.exceptions import InvalidBuilder, InvalidViewer
-from mazy.models.builder import BuilderAlgorithm
+from mazy.models.builder import BuilderAlgorithm, CellSelection
+from mazy.models.maze import MazeBackend
+from mazy.models.viewer import BackpressurePolicy, TextStyle
 from mazy.viewers.ascii_viewer import MazeTextViewer
 from mazy.viewers.base_viewer import MazeViewer
+from mazy.viewers.build_worker import DEFAULT_QUEUE_SIZE
+from mazy.viewers.geometry import CELL_SIZE
 from mazy.viewers.graphical_viewer import MazeGraphicalViewer
+from mazy.viewers.raster_viewer import DEFAULT_RASTER_OUTPUT, MazeRasterViewer
+from mazy.viewers.svg_viewer import MazeSVGViewer
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +43,46 @@ DEFAULT_NUMBER_OF_ROWS = 3
 DEFAULT_NUMBER_OF_COLS = 4
 DEFAULT_MAZE_BUILDER = "binary-tree"
 DEFAULT_MAZE_VIEWER = "graphical"
+DEFAULT_TEXT_STYLE = TextStyle.ASCII.value
+DEFAULT_SELECTION = CellSelection.NEWEST.value
+DEFAULT_MIX = 0.5
+DEFAULT_STRIDE = 1
+DEFAULT_BACKPRESSURE = BackpressurePolicy.BLOCK.value
+DEFAULT_JOBS = os.cpu_count() or 1
+DEFAULT_OUTPUT_DIR = "mazes"
+
+# Extension of the files written by each viewer in batch mode.
+BATCH_EXTENSIONS = {"text": "txt", "svg": "svg", "raster": "png"}
+# Chunks of mazes handed out to each process, balancing load and overhead.
+BATCH_CHUNKS_PER_JOB = 4
+MANIFEST_FILE = "manifest.jsonl"
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Metadata of a maze written by a batch worker."""
+
+    index: int
+    file: str
+    seed: int
+    size: int
+    seconds: float
+
+
+def bounded_int(minimum: int, requirement: str) -> Callable[[str], int]:
+    """Argument type of integers from a minimum on, with the requirement to show."""
+
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise ArgumentTypeError(f"invalid int value: {value!r}") from None
+
+        if number < minimum:
+            raise ArgumentTypeError(f"must be {requirement}, got {number}")
+        return number
+
+    return parse
 
 
 def validate_args(args: Optional[Sequence[str]] = None) -> Namespace:
@@ -52,37 +116,216 @@ def validate_args(args: Optional[Sequence[str]] = None) -> Namespace:
         default=DEFAULT_MAZE_VIEWER,
         help=f"Maze Viewer (default: {DEFAULT_MAZE_VIEWER}",
     )
+    parser.add_argument(
+        "-m",
+        "--backend",
+        type=str,
+        default=None,
+        choices=[backend.value for backend in MazeBackend],
+        help=(
+            "Storage backend for the maze grid "
+            "(default: compact for numpy builders, objects for the others)"
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help=(
+            "File to write the maze to, as it is built "
+            f"(text, svg and raster viewers, default raster: {DEFAULT_RASTER_OUTPUT})"
+        ),
+    )
+    parser.add_argument(
+        "-t",
+        "--text-style",
+        type=str,
+        default=DEFAULT_TEXT_STYLE,
+        choices=[style.value for style in TextStyle],
+        help=f"Style of the text viewer (default: {DEFAULT_TEXT_STYLE})",
+    )
+    parser.add_argument(
+        "-z",
+        "--cell-size",
+        type=bounded_int(2, "at least 2 pixels"),
+        default=CELL_SIZE,
+        help=f"Pixels per cell of the raster viewer (default: {CELL_SIZE})",
+    )
+    parser.add_argument(
+        "-l",
+        "--selection",
+        type=str,
+        default=DEFAULT_SELECTION,
+        choices=[selection.value for selection in CellSelection],
+        help=(
+            "Cell selection of the growing-tree builder "
+            f"(default: {DEFAULT_SELECTION})"
+        ),
+    )
+    parser.add_argument(
+        "-x",
+        "--mix",
+        type=float,
+        default=DEFAULT_MIX,
+        help=(
+            "Ratio of newest cells picked by the mixed selection "
+            f"of the growing-tree builder (default: {DEFAULT_MIX})"
+        ),
+    )
+    parser.add_argument(
+        "-e",
+        "--seed",
+        type=bounded_int(0, "a non-negative number"),
+        default=None,
+        help="Seed of the random choices, to build the same maze again",
+    )
     parser.add_argument(
         "-a", "--animated", action="store_true", help="Step-by-step animated building"
     )
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument(
+        "-s",
+        "--stride",
+        type=int,
+        default=DEFAULT_STRIDE,
+        help=f"Building steps per animation frame (default: {DEFAULT_STRIDE})",
+    )
+    pacing.add_argument(
+        "-f",
+        "--frame-budget",
+        type=float,
+        default=None,
+        help="Milliseconds of building steps per animation frame, instead of a stride",
+    )
+    parser.add_argument(
+        "-w",
+        "--worker",
+        action="store_true",
+        help="Animate the building from a background thread, instead of the pacing",
+    )
+    parser.add_argument(
+        "-q",
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f"Steps queued by the background thread (default: {DEFAULT_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "-p",
+        "--backpressure",
+        type=str,
+        default=DEFAULT_BACKPRESSURE,
+        choices=[policy.value for policy in BackpressurePolicy],
+        help=(
+            "What the background thread does when the queue is full "
+            f"(default: {DEFAULT_BACKPRESSURE})"
+        ),
+    )
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument(
+        "-n",
+        "--count",
+        type=bounded_int(1, "a positive number"),
+        default=None,
+        help="Number of mazes to write to the output directory, instead of one",
+    )
+    batch.add_argument(
+        "-j",
+        "--jobs",
+        type=bounded_int(1, "a positive number"),
+        default=DEFAULT_JOBS,
+        help=f"Processes building the mazes in batch (default: {DEFAULT_JOBS})",
+    )
+    batch.add_argument(
+        "-d",
+        "--output-dir",
+        type=str,
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"Directory of the mazes built in batch (default: {DEFAULT_OUTPUT_DIR})",
+    )
     return parser.parse_args(args)
 
 
-def make_maze(args: Namespace) -> None:
-    """Make the maze and output results."""
-    builder: MazeBuilder
-    print(f"Loading {args.builder} builder...")
+def create_builder(args: Namespace, seed: Optional[int] = None) -> MazeBuilder:
+    """Create the maze builder for the given args, seeded with the given seed.
+
+    Without a backend in the args, each builder keeps its own default.
+    """
+    options: dict[str, Any] = {"seed": seed}
+    if args.backend is not None:
+        options["backend"] = MazeBackend(args.backend)
+
     match args.builder:
         case BuilderAlgorithm.BINARY_TREE.value:
-            builder = BinaryTreeBuilder(args.rows, args.cols)
+            return BinaryTreeBuilder(args.rows, args.cols, **options)
         case BuilderAlgorithm.SIDEWINDER.value:
-            builder = SidewinderBuilder(args.rows, args.cols)
+            return SidewinderBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.BINARY_TREE_NUMPY.value:
+            return VectorizedBinaryTreeBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.SIDEWINDER_NUMPY.value:
+            return VectorizedSidewinderBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.RECURSIVE_BACKTRACKER.value:
+            return RecursiveBacktrackerBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.KRUSKAL.value:
+            return KruskalBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.ELLER.value:
+            return EllerBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.WILSON.value:
+            return WilsonBuilder(args.rows, args.cols, **options)
+        case BuilderAlgorithm.GROWING_TREE.value:
+            return GrowingTreeBuilder(
+                args.rows,
+                args.cols,
+                selection=CellSelection(args.selection),
+                mix=args.mix,
+                **options,
+            )
         case BuilderAlgorithm.DUMMY.value:
-            builder = DummyBuilder(args.rows, args.cols)
+            return DummyBuilder(args.rows, args.cols, **options)
         case _:
             raise InvalidBuilder(f"Invalid builder: {args.builder}")
-    print(f"{builder.name.capitalize()} builder loaded.")
 
-    viewer: MazeViewer
-    print(f"Loading {args.viewer} viewer...")
+
+def create_viewer(
+    args: Namespace, builder: MazeBuilder, output: Optional[str]
+) -> MazeViewer:
+    """Create the maze viewer for the given args, writing to the output file."""
     match args.viewer:
         case "text":
-            viewer = MazeTextViewer(builder)
+            return MazeTextViewer(builder, output, TextStyle(args.text_style))
         case "graphical":
-            viewer = MazeGraphicalViewer(builder, args.animated)
+            return MazeGraphicalViewer(
+                builder,
+                args.animated,
+                args.stride,
+                args.frame_budget,
+                args.worker,
+                args.queue_size,
+                BackpressurePolicy(args.backpressure),
+            )
+        case "svg":
+            return MazeSVGViewer(builder, output)
+        case "raster":
+            return MazeRasterViewer(
+                builder, output or DEFAULT_RASTER_OUTPUT, args.cell_size
+            )
         case _:
             raise InvalidViewer(f"Invalid viewer: {args.viewer}")
 
+
+def make_maze(args: Namespace) -> None:
+    """Make the maze and output results."""
+    if args.count is not None:
+        make_batch(args)
+        return
+
+    print(f"Loading {args.builder} builder...")
+    builder = create_builder(args, args.seed)
+    print(f"{builder.name.capitalize()} builder loaded.")
+
+    print(f"Loading {args.viewer} viewer...")
+    viewer = create_viewer(args, builder, args.output)
     print(f"{args.viewer.capitalize()} viewer loaded.")
 
     print(
@@ -93,6 +336,72 @@ def make_maze(args: Namespace) -> None:
     viewer.show_maze()
 
 
+def make_batch(args: Namespace) -> None:
+    """Make many mazes at once, writing each one to the output directory.
+
+    Mazes are built by a pool of processes, each one writing its mazes
+    straight to their files and sending back only their metadata, which
+    is collected in a manifest along with the mazes.
+
+    Every maze gets its own seed, spawned from the seed of the batch, so
+    its random choices are independent from the others and don't depend
+    on the process building it. The seed in the manifest builds the same
+    maze again, and the same batch seed builds the same batch.
+    """
+    if args.viewer not in BATCH_EXTENSIONS:
+        raise InvalidViewer(f"Invalid batch viewer: {args.viewer}")
+    builder = create_builder(args)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(
+        f"Building {args.count} {args.rows}x{args.cols} mazes "
+        f"using {builder.name} algorithm on {args.jobs} processes..."
+    )
+
+    start = time.perf_counter()
+    with open(output_dir / MANIFEST_FILE, "w") as manifest:
+        for result in build_batch(args):
+            manifest.write(json.dumps(asdict(result)))
+            manifest.write("\n")
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Built {args.count} mazes in {elapsed:.2f}s "
+        f"({args.count / elapsed:,.0f} mazes/sec) into {output_dir}."
+    )
+
+
+def build_batch(args: Namespace) -> Iterator[BatchResult]:
+    """Build the mazes of a batch, producing their metadata in order.
+
+    A single job builds them in this process, sparing the pool.
+    """
+    build = partial(build_batch_maze, args)
+    seeds = [
+        int(sequence.generate_state(1, np.uint64)[0])
+        for sequence in np.random.SeedSequence(args.seed).spawn(args.count)
+    ]
+    if args.jobs == 1:
+        yield from map(build, range(args.count), seeds)
+        return
+
+    chunksize = max(1, args.count // (args.jobs * BATCH_CHUNKS_PER_JOB))
+    with ProcessPoolExecutor(args.jobs) as executor:
+        yield from executor.map(build, range(args.count), seeds, chunksize=chunksize)
+
+
+def build_batch_maze(args: Namespace, index: int, seed: int) -> BatchResult:
+    """Build a maze of a batch with its own seed and write it to its file."""
+    start = time.perf_counter()
+    digits = len(str(args.count - 1))
+    file = f"maze-{index:0{digits}d}.{BATCH_EXTENSIONS[args.viewer]}"
+    path = Path(args.output_dir) / file
+    create_viewer(args, create_builder(args, seed), str(path)).show_maze()
+    elapsed = time.perf_counter() - start
+    return BatchResult(index, file, seed, path.stat().st_size, elapsed)
+
+
 if __name__ == "__main__":
     args = validate_args()
     make_maze(args)
@@ -8,3 +8,19 @@ class BuilderAlgorithm(Enum):
     DUMMY = "dummy"
     BINARY_TREE = "binary-tree"
     SIDEWINDER = "sidewinder"
+    BINARY_TREE_NUMPY = "binary-tree-numpy"
+    SIDEWINDER_NUMPY = "sidewinder-numpy"
+    RECURSIVE_BACKTRACKER = "recursive-backtracker"
+    KRUSKAL = "kruskal"
+    ELLER = "eller"
+    WILSON = "wilson"
+    GROWING_TREE = "growing-tree"
+
+
+class CellSelection(Enum):
+    """Policies to pick the next active cell in a Growing Tree builder."""
+
+    NEWEST = "newest"
+    OLDEST = "oldest"
+    RANDOM = "random"
+    MIXED = "mixed"
@@ -1,9 +1,13 @@
 """Models related to a cell."""
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
+from typing import TYPE_CHECKING, Optional
 
 from mazy.exceptions import DuplicatedNeighbor, MissingLink, NeighborhoodError
 
+if TYPE_CHECKING:
+    from mazy.models.maze import Maze
+
 
 class Role(IntEnum):
     """Possible roles for a cell."""
@@ -37,7 +41,34 @@ class Direction(Enum):
         return direction
 
 
-@dataclass
+# Passage bit of each direction in a packed cell bitmask.
+DIRECTION_MASKS: dict[Direction, int] = {
+    Direction.NORTH: 1,
+    Direction.EAST: 2,
+    Direction.SOUTH: 4,
+    Direction.WEST: 8,
+}
+# Passage bits by name, for code working on the bitmasks themselves.
+NORTH = DIRECTION_MASKS[Direction.NORTH]
+EAST = DIRECTION_MASKS[Direction.EAST]
+SOUTH = DIRECTION_MASKS[Direction.SOUTH]
+WEST = DIRECTION_MASKS[Direction.WEST]
+
+# Row and col offsets to reach the neighbor on each direction.
+DIRECTION_OFFSETS: dict[Direction, tuple[int, int]] = {
+    Direction.NORTH: (-1, 0),
+    Direction.EAST: (0, 1),
+    Direction.SOUTH: (1, 0),
+    Direction.WEST: (0, -1),
+}
+
+# Direction pointing to the neighbor placed on each row and col offset.
+OFFSET_DIRECTIONS: dict[tuple[int, int], Direction] = {
+    offset: direction for direction, offset in DIRECTION_OFFSETS.items()
+}
+
+
+@dataclass(slots=True, eq=False)
 class Neighbor:
     """Cell linked to another cell in one direction.
 
@@ -48,10 +79,29 @@ class Neighbor:
     cell: "Cell"
     passage: bool
 
+    def __eq__(self, other: object) -> bool:
+        """Neighbors are equal when they have the same cell and passage."""
+        if not isinstance(other, Neighbor):
+            return NotImplemented
+
+        return self.cell == other.cell and self.passage == other.passage
+
+    def __hash__(self) -> int:
+        """Hash based on the position of the neighbor cell."""
+        return hash(self.cell)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Cell:
-    """Basic building block of a maze."""
+    """Basic building block of a maze.
+
+    Cells are compared and hashed by their position only, so they never
+    recurse into their neighbors and can be used in sets and as dict keys.
+
+    When the cell belongs to a lazy maze, the maze is kept as its topology:
+    neighbors are then resolved from the grid coordinates and only stored
+    once a passage is carved to them.
+    """
 
     row: int
     col: int
@@ -59,11 +109,23 @@ class Cell:
     role: Role = Role.NONE
     visited: bool = False
     neighbors: dict[Direction, Neighbor] = field(default_factory=dict)
+    topology: Optional["Maze"] = field(default=None, repr=False)
 
     def __repr__(self) -> str:
         """Text representation of a Cell object."""
         return f"Cell(row: {self.row}, col: {self.col})"
 
+    def __eq__(self, other: object) -> bool:
+        """Cells are equal when they are on the same position."""
+        if not isinstance(other, Cell):
+            return NotImplemented
+
+        return self.row == other.row and self.col == other.col
+
+    def __hash__(self) -> int:
+        """Hash based on the position of the cell."""
+        return hash((self.row, self.col))
+
     def link_to(
         self,
         other_cell: "Cell",
@@ -112,42 +174,73 @@ class Cell:
         if bidirectional and other_cell.neighbors[direction.opposite()].cell == self:
             del other_cell.neighbors[direction.opposite()]
 
+    def direction_to(self, other_cell: "Cell") -> Optional[Direction]:
+        """Direction where another cell would be a neighbor, if adjacent."""
+        return OFFSET_DIRECTIONS.get(
+            (other_cell.row - self.row, other_cell.col - self.col)
+        )
+
     def is_linked_to(self, other_cell: "Cell") -> bool:
-        """Inform if 2 cells are linked (one is neighbor of the other)."""
-        return other_cell in [neighbor.cell for neighbor in self.neighbors.values()]
+        """Inform if 2 cells are linked (one is neighbor of the other).
+
+        The only candidate neighbor is found from the cell coordinates, and
+        it's compared by identity, so no other neighbor is ever inspected.
+        """
+        direction = self.direction_to(other_cell)
+        if direction is None:
+            return False
+
+        if neighbor := self.neighbors.get(direction):
+            return neighbor.cell is other_cell
+
+        return (
+            self.topology is not None
+            and self.topology.neighbor_of(self, direction) is other_cell
+        )
 
     def has_passage_to_cell(self, other_cell: "Cell") -> bool:
         """Inform if there is a passage between 2 cells."""
-        if self.is_linked_to(other_cell):
-            return [
-                neighbor.passage
-                for neighbor in self.neighbors.values()
-                if neighbor.cell == other_cell
-            ].pop()
+        direction = self.direction_to(other_cell)
+        if direction is None:
+            return False
 
-        return False
+        neighbor = self.neighbors.get(direction)
+        return neighbor is not None and neighbor.cell is other_cell and neighbor.passage
 
     def has_link_to_direction(self, direction: Direction) -> bool:
         """Inform if there is a link from the current cell to a given direction."""
-        return self.neighbors.get(direction) is not None
+        if self.neighbors.get(direction) is not None:
+            return True
+
+        return (
+            self.topology is not None
+            and self.topology.neighbor_of(self, direction) is not None
+        )
 
     def has_passage_to_direction(self, direction: Direction) -> bool:
         """Inform if there is a passage from the current cell to a given direction."""
-        if self.has_link_to_direction(direction):
-            return self.neighbors[direction].passage
+        if neighbor := self.neighbors.get(direction):
+            return neighbor.passage
 
         return False
 
     def carve_passage_to_direction(self, direction: Direction) -> None:
         """Set the passage flag on a given direction.
 
-        This operation is bidirectional.
+        This operation is bidirectional. On a lazy maze, the neighbors
+        are materialized on both cells at this moment.
         """
         if not self.has_link_to_direction(direction):
             raise MissingLink(
                 f"There is no link from {self} to the {direction.value} direction."
             )
 
+        if direction not in self.neighbors and self.topology is not None:
+            other = self.topology.neighbor_of(self, direction)
+            if other is not None:
+                self.link_to(other, passage=True, direction=direction)
+                return
+
         neighbor = self.neighbors[direction]
         neighbor.passage = True
 
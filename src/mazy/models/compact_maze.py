@@ -0,0 +1,155 @@
+"""Models related to a compact (packed) maze."""
+from typing import Generator
+
+from mazy.exceptions import MissingLink
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS, Direction, Role
+from mazy.models.maze import MazeState
+from mazy.utils import Bitmap
+
+# Offsets and passage bits needed to carve each direction, in a single lookup.
+CARVING_STEPS: dict[Direction, tuple[int, int, int, int]] = {
+    direction: (
+        row_offset,
+        col_offset,
+        DIRECTION_MASKS[direction],
+        DIRECTION_MASKS[direction.opposite()],
+    )
+    for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+}
+
+
+class CompactCell:
+    """View over a single cell of a compact maze.
+
+    It has no state of its own: every read and write goes straight to
+    the buffers of the maze, so views can be created and dropped freely.
+    """
+
+    __slots__ = ("maze", "row", "col", "index")
+
+    def __init__(self, maze: "CompactMaze", row: int, col: int) -> None:
+        self.maze = maze
+        self.row = row
+        self.col = col
+        self.index = row * maze.cols + col
+
+    def __repr__(self) -> str:
+        """Text representation of a CompactCell object."""
+        return f"Cell(row: {self.row}, col: {self.col})"
+
+    def __eq__(self, other: object) -> bool:
+        """Views are equal when they are on the same position of the same maze."""
+        if not isinstance(other, CompactCell):
+            return NotImplemented
+
+        return self.maze is other.maze and self.index == other.index
+
+    def __hash__(self) -> int:
+        """Hash based on the position of the cell."""
+        return hash((self.row, self.col))
+
+    @property
+    def role(self) -> Role:
+        """Role of the cell."""
+        return Role(self.maze.roles[self.index])
+
+    @role.setter
+    def role(self, role: Role) -> None:
+        self.maze.roles[self.index] = role
+
+    @property
+    def visited(self) -> bool:
+        """Inform if the cell was already visited by a builder."""
+        return self.maze.visited[self.index]
+
+    @visited.setter
+    def visited(self, visited: bool) -> None:
+        self.maze.visited[self.index] = visited
+
+    def has_link_to_direction(self, direction: Direction) -> bool:
+        """Inform if there is a link from the current cell to a given direction."""
+        row_offset, col_offset = DIRECTION_OFFSETS[direction]
+        return (
+            0 <= self.row + row_offset < self.maze.rows
+            and 0 <= self.col + col_offset < self.maze.cols
+        )
+
+    def has_passage_to_direction(self, direction: Direction) -> bool:
+        """Inform if there is a passage from the current cell to a given direction."""
+        return bool(self.maze.passages[self.index] & DIRECTION_MASKS[direction])
+
+    def carve_passage_to_direction(self, direction: Direction) -> None:
+        """Set the passage flag on a given direction.
+
+        This operation is bidirectional.
+        """
+        self.maze.carve_passage(self.row, self.col, direction)
+
+    def passage_count(self) -> int:
+        """Return current the number of passages for this cell."""
+        return self.maze.passages[self.index].bit_count()
+
+
+class CompactMaze:
+    """Maze as a packed grid of cells.
+
+    Instead of one Cell object per position, the whole grid lives in flat
+    row-major buffers: a passage bitmask byte and a role byte per cell, plus
+    a visited bitmap. Cells are exposed on demand as CompactCell views.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.state = MazeState.BUILDING
+        self.rows = rows
+        self.cols = cols
+        self.passages = bytearray(rows * cols)
+        self.roles = bytearray(rows * cols)
+        self.visited = Bitmap(rows * cols)
+        self.registry_roles()
+
+    def __getitem__(self, index: tuple[int, int]) -> CompactCell:
+        i, j = index
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"Cell ({i}, {j}) is out of the maze.")
+
+        return CompactCell(self, i, j)
+
+    def registry_roles(self) -> None:
+        """Registry the entrance and the exit.
+
+        Neighbors are implicit in the grid coordinates, so there is
+        nothing else to registry.
+        """
+        self.roles[0] = Role.ENTRANCE
+        self.roles[-1] = Role.EXIT
+
+    def traverse_by_cell(self) -> Generator[CompactCell, None, None]:
+        """Traverse the maze cell by cell."""
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield CompactCell(self, row, col)
+
+    def carve_passage(self, row: int, col: int, direction: Direction) -> None:
+        """Carve a passage from the cell on a given position to a direction.
+
+        This operation is bidirectional.
+        """
+        row_offset, col_offset, mask, opposite_mask = CARVING_STEPS[direction]
+        if not (
+            0 <= row + row_offset < self.rows and 0 <= col + col_offset < self.cols
+        ):
+            raise MissingLink(
+                f"There is no link from Cell(row: {row}, col: {col}) "
+                f"to the {direction.value} direction."
+            )
+
+        index = row * self.cols + col
+        self.passages[index] |= mask
+        self.passages[index + row_offset * self.cols + col_offset] |= opposite_mask
+
+    def passage_mask(self) -> bytearray:
+        """Flat row-major passage bitmask, one byte per cell.
+
+        This is the live buffer of the maze, not a copy.
+        """
+        return self.passages
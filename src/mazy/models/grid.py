@@ -0,0 +1,112 @@
+"""Contracts shared by all maze backends."""
+import hashlib
+from typing import Iterator, Protocol, Union
+
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS, Direction, Role
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import Maze, MazeBackend, MazeState
+
+
+class GridCell(Protocol):
+    """Contract for the cells of a maze grid."""
+
+    row: int
+    col: int
+    role: Role
+    visited: bool
+
+    def has_link_to_direction(self, direction: Direction) -> bool:
+        """Inform if there is a link from the current cell to a given direction."""
+        ...
+
+    def has_passage_to_direction(self, direction: Direction) -> bool:
+        """Inform if there is a passage from the current cell to a given direction."""
+        ...
+
+    def carve_passage_to_direction(self, direction: Direction) -> None:
+        """Set the passage flag on a given direction."""
+        ...
+
+    def passage_count(self) -> int:
+        """Return current the number of passages for this cell."""
+        ...
+
+
+class MazeGrid(Protocol):
+    """Contract for maze grids, regardless of how cells are stored."""
+
+    state: MazeState
+    rows: int
+    cols: int
+
+    def __getitem__(self, index: tuple[int, int]) -> GridCell:
+        ...
+
+    def traverse_by_cell(self) -> Iterator[GridCell]:
+        """Traverse the maze cell by cell."""
+        ...
+
+    def carve_passage(self, row: int, col: int, direction: Direction) -> None:
+        """Carve a passage from the cell on a given position to a direction."""
+        ...
+
+    def passage_mask(self) -> bytearray:
+        """Flat row-major passage bitmask, one byte per cell."""
+        ...
+
+
+def create_maze(
+    rows: int, cols: int, backend: MazeBackend = MazeBackend.OBJECTS
+) -> MazeGrid:
+    """Create an empty maze using the given backend."""
+    match backend:
+        case MazeBackend.COMPACT:
+            return CompactMaze(rows, cols)
+        case MazeBackend.OBJECTS:
+            return Maze(rows, cols)
+        case MazeBackend.LAZY:
+            return Maze(rows, cols, lazy=True)
+
+
+def is_perfect(maze: MazeGrid) -> bool:
+    """Inform if the maze is perfect.
+
+    A perfect maze has exactly one path between any two cells: its
+    passages connect all cells without any loop (a spanning tree).
+    """
+    mask = maze.passage_mask()
+    size = maze.rows * maze.cols
+    if sum(cell_mask.bit_count() for cell_mask in mask) != 2 * (size - 1):
+        return False
+
+    offsets = {
+        DIRECTION_MASKS[direction]: row_offset * maze.cols + col_offset
+        for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+    }
+    reached = bytearray(size)
+    reached[0] = 1
+    stack = [0]
+    while stack:
+        index = stack.pop()
+        for direction_mask, offset in offsets.items():
+            if mask[index] & direction_mask and not reached[index + offset]:
+                reached[index + offset] = 1
+                stack.append(index + offset)
+
+    return all(reached)
+
+
+def fingerprint(maze: MazeGrid) -> str:
+    """Content hash of the layout of a maze: its dimensions and passages.
+
+    Mazes with the same layout share the fingerprint, regardless of the
+    backend storing them.
+    """
+    return mask_fingerprint(maze.passage_mask(), maze.cols)
+
+
+def mask_fingerprint(mask: Union[bytes, bytearray], cols: int) -> str:
+    """Content hash of a flat passage bitmask and the number of cols of its grid."""
+    digest = hashlib.blake2b(f"{len(mask)}:{cols}:".encode(), digest_size=16)
+    digest.update(mask)
+    return digest.hexdigest()
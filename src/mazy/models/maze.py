@@ -1,8 +1,8 @@
 """Models related to a maze."""
 from enum import Enum
-from typing import Generator, Sequence
+from typing import Generator, Optional, Sequence
 
-from mazy.models.cell import Cell, Direction, Role
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS, Cell, Direction, Role
 
 
 class MazeState(Enum):
@@ -12,15 +12,30 @@ class MazeState(Enum):
     READY = "ready"
 
 
+class MazeBackend(Enum):
+    """Storage strategies for the maze grid."""
+
+    OBJECTS = "objects"
+    COMPACT = "compact"
+    LAZY = "lazy"
+
+
 class Maze:
-    """Maze as a grid of cells."""
+    """Maze as a grid of cells.
 
-    def __init__(self, rows: int, cols: int):
+    A lazy maze doesn't registry neighbors upfront. Its cells resolve them
+    from the grid coordinates, storing only the ones with a carved passage.
+    """
+
+    def __init__(self, rows: int, cols: int, lazy: bool = False):
         self.state = MazeState.BUILDING
         self.rows = rows
         self.cols = cols
+        self.lazy = lazy
+        topology = self if lazy else None
         self.cells: Sequence[Sequence[Cell]] = [
-            [Cell(row, col) for col in range(cols)] for row in range(rows)
+            [Cell(row, col, topology=topology) for col in range(cols)]
+            for row in range(rows)
         ]
         self.registry_neighbors()
 
@@ -32,11 +47,15 @@ class Maze:
         """Registry all neighbors.
 
         The external cell have no neighbors at the maze frontiers.
-        The maze have no passages at this moment.
+        The maze have no passages at this moment. A lazy maze only
+        registries the entrance and the exit.
         """
         self[0, 0].role = Role.ENTRANCE
         self[self.rows - 1, self.cols - 1].role = Role.EXIT
 
+        if self.lazy:
+            return
+
         for row in range(self.rows):
             for col in range(self.cols):
                 cell = self[row, col]
@@ -51,8 +70,33 @@ class Maze:
                         self[row - 1, col], passage=False, direction=Direction.NORTH
                     )
 
+    def neighbor_of(self, cell: Cell, direction: Direction) -> Optional[Cell]:
+        """Find the cell next to a given cell in a direction, if any."""
+        row_offset, col_offset = DIRECTION_OFFSETS[direction]
+        row = cell.row + row_offset
+        col = cell.col + col_offset
+
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.cells[row][col]
+
+        return None
+
     def traverse_by_cell(self) -> Generator[Cell, None, None]:
         """Traverse the maze cell by cell."""
         for row in range(self.rows):
             for col in range(self.cols):
                 yield self[row, col]
+
+    def carve_passage(self, row: int, col: int, direction: Direction) -> None:
+        """Carve a passage from the cell on a given position to a direction."""
+        self.cells[row][col].carve_passage_to_direction(direction)
+
+    def passage_mask(self) -> bytearray:
+        """Flat row-major passage bitmask, one byte per cell."""
+        mask = bytearray(self.rows * self.cols)
+        for index, cell in enumerate(self.traverse_by_cell()):
+            for direction, neighbor in cell.neighbors.items():
+                if neighbor.passage:
+                    mask[index] |= DIRECTION_MASKS[direction]
+
+        return mask
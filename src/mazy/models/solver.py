@@ -0,0 +1,48 @@
+"""Models related to maze solvers."""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Sequence
+
+
+class SolverAlgorithm(Enum):
+    """Maze solver algorithms domain."""
+
+    BFS = "bfs"
+    A_STAR = "a-star"
+    BIDIRECTIONAL_BFS = "bidirectional-bfs"
+    REDUCED_GRAPH = "reduced-graph"
+    CACHED_BFS = "cached-bfs"
+
+
+@dataclass(slots=True)
+class SolverStats:
+    """Effort spent by a solver to find a path.
+
+    Expanded nodes are the cells whose neighbors were explored and the
+    peak frontier is the largest number of cells waiting to be expanded
+    at once. The elapsed time is the wall time of the whole solve.
+    """
+
+    expanded: int = 0
+    peak_frontier: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass(slots=True)
+class Solution:
+    """Shortest path from the entrance to the exit of a maze.
+
+    Cells are identified by their row-major index. The distance map
+    holds the number of steps from the entrance to the cells reached by
+    the solver, or -1 for the others. The path is empty when the exit
+    can't be reached.
+    """
+
+    path: list[int]
+    distances: Sequence[int]
+    stats: SolverStats = field(default_factory=SolverStats)
+
+    @property
+    def length(self) -> int:
+        """Number of steps from the entrance to the exit."""
+        return len(self.path) - 1
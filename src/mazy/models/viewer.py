@@ -0,0 +1,25 @@
+"""Models related to maze viewers."""
+from enum import Enum
+
+
+class TextStyle(Enum):
+    """Text representations of a maze."""
+
+    ASCII = "ascii"
+    UNICODE = "unicode"
+    COMPACT = "compact"
+    BLOCK = "block"
+
+
+class RasterFormat(Enum):
+    """Image formats of the raster viewer, named after their file extensions."""
+
+    PNG = "png"
+    PPM = "ppm"
+
+
+class BackpressurePolicy(Enum):
+    """What a background build does when the viewer falls behind."""
+
+    BLOCK = "block"
+    COALESCE = "coalesce"
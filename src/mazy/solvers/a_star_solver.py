@@ -0,0 +1,56 @@
+"""A* Maze solver."""
+import heapq
+
+from mazy.models.solver import Solution, SolverStats
+from mazy.solvers.base_solver import MazeSolver, passage_steps, trace_path
+
+
+class AStarSolver(MazeSolver):
+    """A* Maze solver with a Manhattan distance heuristic.
+
+    Cells are expanded in order of their distance from the entrance plus
+    the Manhattan distance to the exit, which never overestimates the
+    remaining steps on a grid. Ties are broken in favor of the cells
+    closer to the exit. The search stops as soon as the exit is expanded.
+    """
+
+    @property
+    def name(self) -> str:
+        """Solver name."""
+        return "a-star"
+
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        steps = passage_steps(cols)
+        end_row, end_col = divmod(end, cols)
+        distances = [-1] * len(mask)
+        distances[start] = 0
+        expanded = bytearray(len(mask))
+
+        start_row, start_col = divmod(start, cols)
+        estimate = abs(end_row - start_row) + abs(end_col - start_col)
+        frontier = [(estimate, estimate, start)]
+        push, pop = heapq.heappush, heapq.heappop
+        expanded_count = peak_frontier = 0
+        while frontier:
+            peak_frontier = max(peak_frontier, len(frontier))
+            _, _, index = pop(frontier)
+            if expanded[index]:
+                continue
+
+            expanded[index] = 1
+            expanded_count += 1
+            if index == end:
+                break
+
+            distance = distances[index] + 1
+            for neighbor in steps[mask[index]]:
+                neighbor += index
+                if distances[neighbor] < 0 or distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    row, col = divmod(neighbor, cols)
+                    estimate = abs(end_row - row) + abs(end_col - col)
+                    push(frontier, (distance + estimate, estimate, neighbor))
+
+        stats = SolverStats(expanded_count, peak_frontier)
+        return Solution(trace_path(mask, cols, distances, end), distances, stats)
@@ -0,0 +1,93 @@
+"""Contract for maze solvers."""
+import time
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS, Role
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import MazeGrid
+from mazy.models.solver import Solution
+
+
+def passage_steps(cols: int) -> list[tuple[int, ...]]:
+    """Index offsets to the cells reached by each passage bitmask.
+
+    The table is indexed by the 4-bit passage mask of a cell, so the
+    neighbors of a cell are found with a single lookup.
+    """
+    offsets = [
+        (DIRECTION_MASKS[direction], row_offset * cols + col_offset)
+        for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+    ]
+    return [
+        tuple(offset for direction_mask, offset in offsets if mask & direction_mask)
+        for mask in range(16)
+    ]
+
+
+def find_ends(maze: MazeGrid) -> tuple[int, int]:
+    """Indexes of the entrance and the exit of a maze.
+
+    A single cell maze has no entrance, the exit role takes over its
+    only cell.
+    """
+    if isinstance(maze, CompactMaze):
+        roles = bytes(maze.roles)
+    else:
+        roles = bytes(cell.role for cell in maze.traverse_by_cell())
+
+    end = roles.find(Role.EXIT)
+    start = roles.find(Role.ENTRANCE) if len(roles) > 1 else end
+    if start < 0 or end < 0:
+        raise ValueError("The maze must have an entrance and an exit.")
+
+    return start, end
+
+
+def trace_path(
+    mask: bytearray, cols: int, distances: Sequence[int], end: int
+) -> list[int]:
+    """Walk the distance map back from a cell to the start of the search.
+
+    Returns the path from the start to the given cell, or an empty path
+    when the cell was not reached.
+    """
+    if distances[end] < 0:
+        return []
+
+    steps = passage_steps(cols)
+    path = [end]
+    index = end
+    for distance in range(distances[end] - 1, -1, -1):
+        for offset in steps[mask[index]]:
+            if distances[index + offset] == distance:
+                index += offset
+                break
+        path.append(index)
+
+    path.reverse()
+    return path
+
+
+class MazeSolver(ABC):
+    """Abstraction for maze solvers."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Solver name."""
+        ...
+
+    def solve(self, maze: MazeGrid) -> Solution:
+        """Find the shortest path from the entrance to the exit of a maze."""
+        start_time = time.perf_counter()
+        start, end = find_ends(maze)
+        solution = self.search(maze.passage_mask(), maze.cols, start, end)
+        solution.stats.elapsed = time.perf_counter() - start_time
+
+        return solution
+
+    @abstractmethod
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        ...
@@ -0,0 +1,52 @@
+"""Breadth-first search Maze solver."""
+from mazy.models.solver import Solution, SolverStats
+from mazy.solvers.base_solver import MazeSolver, passage_steps, trace_path
+
+
+class BFSSolver(MazeSolver):
+    """Breadth-first search Maze solver.
+
+    Every passage has the same cost, so a breadth-first search finds the
+    same shortest paths as Dijkstra without a priority queue. The search
+    runs over cell indexes and the flat passage bitmask of the maze, one
+    level of distance at a time, and covers the whole maze to provide a
+    full distance map.
+    """
+
+    @property
+    def name(self) -> str:
+        """Solver name."""
+        return "bfs"
+
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        stats = SolverStats()
+        distances = self.distances_from(mask, cols, start, stats)
+
+        return Solution(trace_path(mask, cols, distances, end), distances, stats)
+
+    def distances_from(
+        self, mask: bytearray, cols: int, start: int, stats: SolverStats
+    ) -> list[int]:
+        """Number of steps from a cell to every cell, or -1 if not reachable."""
+        steps = passage_steps(cols)
+        distances = [-1] * len(mask)
+        distances[start] = 0
+
+        frontier = [start]
+        distance = 0
+        while frontier:
+            stats.expanded += len(frontier)
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+            distance += 1
+            next_frontier: list[int] = []
+            append = next_frontier.append
+            for index in frontier:
+                for neighbor in steps[mask[index]]:
+                    neighbor += index
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = distance
+                        append(neighbor)
+            frontier = next_frontier
+
+        return distances
@@ -0,0 +1,68 @@
+"""Bidirectional breadth-first search Maze solver."""
+from mazy.models.solver import Solution, SolverStats
+from mazy.solvers.base_solver import MazeSolver, passage_steps, trace_path
+
+
+class BidirectionalBFSSolver(MazeSolver):
+    """Bidirectional breadth-first search Maze solver.
+
+    Two breadth-first searches grow from the entrance and from the exit,
+    always expanding a whole level of the smallest frontier. Once a level
+    reaches cells seen by the other search, the meeting cell with the
+    shortest total distance joins both halves of the path.
+    """
+
+    @property
+    def name(self) -> str:
+        """Solver name."""
+        return "bidirectional-bfs"
+
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        stats = SolverStats()
+        steps = passage_steps(cols)
+        distances = [-1] * len(mask)
+        distances[start] = 0
+        end_distances = [-1] * len(mask)
+        end_distances[end] = 0
+
+        meeting = start if start == end else -1
+        frontier, end_frontier = [start], [end]
+        while meeting < 0 and frontier and end_frontier:
+            stats.peak_frontier = max(
+                stats.peak_frontier, len(frontier) + len(end_frontier)
+            )
+            if len(end_frontier) < len(frontier):
+                frontier, end_frontier = end_frontier, frontier
+                distances, end_distances = end_distances, distances
+
+            stats.expanded += len(frontier)
+            next_frontier: list[int] = []
+            shortest = len(mask)
+            for index in frontier:
+                distance = distances[index] + 1
+                for neighbor in steps[mask[index]]:
+                    neighbor += index
+                    if distances[neighbor] >= 0:
+                        continue
+
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+                    if 0 <= end_distances[neighbor] < shortest - distance:
+                        meeting = neighbor
+                        shortest = distance + end_distances[neighbor]
+            frontier = next_frontier
+
+        if distances[start] != 0:
+            distances, end_distances = end_distances, distances
+
+        if meeting < 0:
+            return Solution([], distances, stats)
+
+        path = trace_path(mask, cols, distances, meeting)
+        end_path = trace_path(mask, cols, end_distances, meeting)
+        path.extend(reversed(end_path[:-1]))
+        for steps_taken, index in enumerate(path):
+            distances[index] = steps_taken
+
+        return Solution(path, distances, stats)
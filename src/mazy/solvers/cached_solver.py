@@ -0,0 +1,100 @@
+"""Cached breadth-first search Maze solver."""
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from mazy.models.grid import mask_fingerprint
+from mazy.models.solver import Solution, SolverStats
+from mazy.solvers.base_solver import MazeSolver, trace_path
+from mazy.solvers.bfs_solver import BFSSolver
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+@dataclass(slots=True)
+class CachedDistances:
+    """Distance map from a source cell and the paths traced on it, by target."""
+
+    distances: "array[int]"
+    paths: dict[int, "array[int]"] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the distance map and the paths."""
+        return sum(
+            len(values) * values.itemsize
+            for values in (self.distances, *self.paths.values())
+        )
+
+
+class CachedSolver(MazeSolver):
+    """Breadth-first search solver keeping the distance maps of recent mazes.
+
+    Distance maps are keyed by the fingerprint of the maze layout and the
+    source cell, so solving the same layout again, with any backend, only
+    traces the path on the cached map. Paths are cached along with the
+    map they were traced on.
+
+    The least recently used maps are evicted to keep the cache within a
+    memory cap, in bytes. Maps too big for the cap are never cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError(f"Memory cap must not be negative, got {max_bytes}.")
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[tuple[str, int], CachedDistances] = OrderedDict()
+        self.solver = BFSSolver()
+
+    def __len__(self) -> int:
+        """Number of cached distance maps."""
+        return len(self.entries)
+
+    @property
+    def name(self) -> str:
+        """Solver name."""
+        return "cached-bfs"
+
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        stats = SolverStats()
+        key = (mask_fingerprint(mask, cols), start)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            distances = self.solver.distances_from(mask, cols, start, stats)
+            entry = CachedDistances(array("i", distances))
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            self.nbytes -= entry.nbytes
+
+        path = entry.paths.get(end)
+        if path is None:
+            path = entry.paths[end] = array(
+                "i", trace_path(mask, cols, entry.distances, end)
+            )
+
+        self.store(key, entry)
+        return Solution(path.tolist(), entry.distances[:], stats)
+
+    def store(self, key: tuple[str, int], entry: CachedDistances) -> None:
+        """Cache a distance map as the most recent one, evicting the oldest."""
+        if entry.nbytes > self.max_bytes:
+            self.entries.pop(key, None)
+            return
+
+        self.entries[key] = entry
+        self.nbytes += entry.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop every cached distance map, keeping the counters."""
+        self.entries.clear()
+        self.nbytes = 0
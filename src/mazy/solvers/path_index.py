@@ -0,0 +1,138 @@
+"""Path index for perfect mazes."""
+import numpy as np
+import numpy.typing as npt
+
+from mazy.exceptions import ImperfectMaze
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS
+from mazy.models.grid import MazeGrid
+from mazy.models.solver import SolverStats
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.reduction import DEGREES
+
+Cells = npt.NDArray[np.int64]
+
+
+class PathIndex:
+    """Index answering path queries between any two cells of a perfect maze.
+
+    A perfect maze is a tree, so the path between two cells is unique:
+    it goes up from both cells to their lowest common ancestor. The tree
+    is rooted at the first cell, and binary lifting keeps, for every
+    cell, its ancestors 1, 2, 4, ... levels up. Finding the common
+    ancestor takes O(log n) jumps.
+
+    Queries can be answered one at a time or in batches, with the jumps
+    of the whole batch done by array operations.
+    """
+
+    def __init__(self, maze: MazeGrid):
+        self.cols = maze.cols
+        mask = maze.passage_mask()
+        size = len(mask)
+        masks = np.frombuffer(mask, dtype=np.uint8)
+        passages = int(
+            np.frombuffer(DEGREES, dtype=np.uint8)[masks].sum(dtype=np.int64)
+        )
+        depths = BFSSolver().distances_from(mask, maze.cols, 0, SolverStats())
+        self.depths = np.array(depths, dtype=np.int64)
+        if passages != 2 * (size - 1) or self.depths.min() < 0:
+            raise ImperfectMaze("The path index requires a perfect maze.")
+
+        dtype = np.int32 if size < 2**31 else np.int64
+        parents = np.zeros(size, dtype=dtype)
+        cells = np.arange(size, dtype=np.int64)
+        for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items():
+            offset = row_offset * maze.cols + col_offset
+            has_passage = (masks & DIRECTION_MASKS[direction]) != 0
+            neighbors = np.where(has_passage, cells + offset, 0)
+            is_parent = has_passage & (self.depths[neighbors] == self.depths - 1)
+            parents[is_parent] = neighbors[is_parent]
+
+        self.ancestors = [parents]
+        for _ in range(1, max(1, int(self.depths.max()).bit_length())):
+            self.ancestors.append(self.ancestors[-1][self.ancestors[-1]])
+
+        # Plain views for single queries, much faster to index than arrays.
+        self.depth_view = self.depths.data
+        self.ancestor_views = [level.data for level in self.ancestors]
+
+    def __len__(self) -> int:
+        """Number of cells in the index."""
+        return len(self.depths)
+
+    def common_ancestor(self, cell: int, other_cell: int) -> int:
+        """Lowest common ancestor of two cells, on the tree rooted at cell 0."""
+        depths, ancestors = self.depth_view, self.ancestor_views
+        if depths[cell] < depths[other_cell]:
+            cell, other_cell = other_cell, cell
+
+        difference = depths[cell] - depths[other_cell]
+        level = 0
+        while difference:
+            if difference & 1:
+                cell = ancestors[level][cell]
+            difference >>= 1
+            level += 1
+
+        if cell == other_cell:
+            return cell
+
+        for level in reversed(range(len(ancestors))):
+            if ancestors[level][cell] != ancestors[level][other_cell]:
+                cell = ancestors[level][cell]
+                other_cell = ancestors[level][other_cell]
+
+        return ancestors[0][cell]
+
+    def path_length(self, cell: int, other_cell: int) -> int:
+        """Number of steps between two cells."""
+        ancestor = self.common_ancestor(cell, other_cell)
+        depths = self.depth_view
+        return depths[cell] + depths[other_cell] - 2 * depths[ancestor]
+
+    def path(self, cell: int, other_cell: int) -> list[int]:
+        """Cells on the path between two cells, both included."""
+        ancestor = self.common_ancestor(cell, other_cell)
+        parents = self.ancestor_views[0]
+
+        path = [cell]
+        while path[-1] != ancestor:
+            path.append(parents[path[-1]])
+
+        other_path = [other_cell]
+        while other_path[-1] != ancestor:
+            other_path.append(parents[other_path[-1]])
+
+        path.extend(reversed(other_path[:-1]))
+        return path
+
+    def common_ancestors(self, cells: Cells, other_cells: Cells) -> Cells:
+        """Lowest common ancestors of batches of pairs of cells."""
+        cells = np.asarray(cells, dtype=np.int64)
+        other_cells = np.asarray(other_cells, dtype=np.int64)
+        deeper = self.depths[cells] >= self.depths[other_cells]
+        cells, other_cells = (
+            np.where(deeper, cells, other_cells),
+            np.where(deeper, other_cells, cells),
+        )
+
+        differences = self.depths[cells] - self.depths[other_cells]
+        for level, ancestors in enumerate(self.ancestors):
+            jumps = ((differences >> level) & 1).astype(bool)
+            cells[jumps] = ancestors[cells[jumps]]
+
+        for ancestors in reversed(self.ancestors):
+            cell_ancestors = ancestors[cells]
+            other_ancestors = ancestors[other_cells]
+            apart = cell_ancestors != other_ancestors
+            cells[apart] = cell_ancestors[apart]
+            other_cells[apart] = other_ancestors[apart]
+
+        return np.where(cells == other_cells, cells, self.ancestors[0][cells])
+
+    def path_lengths(self, cells: Cells, other_cells: Cells) -> Cells:
+        """Number of steps between batches of pairs of cells."""
+        ancestors = self.common_ancestors(cells, other_cells)
+        return (
+            self.depths[cells] + self.depths[other_cells] - 2 * self.depths[ancestors]
+        )
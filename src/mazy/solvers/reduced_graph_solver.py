@@ -0,0 +1,32 @@
+"""Reduced graph Maze solver."""
+from mazy.models.solver import Solution
+from mazy.solvers.base_solver import MazeSolver
+from mazy.solvers.reduction import ReducedGraph, fill_dead_ends
+
+
+class ReducedGraphSolver(MazeSolver):
+    """Maze solver running Dijkstra on a reduced graph of the maze.
+
+    Dead ends are filled first, keeping the entrance and the exit, and
+    the corridors left are collapsed into weighted edges between the
+    junctions. On a perfect maze nothing but the path survives.
+
+    The distance map only covers the cells on the path.
+    """
+
+    @property
+    def name(self) -> str:
+        """Solver name."""
+        return "reduced-graph"
+
+    def search(self, mask: bytearray, cols: int, start: int, end: int) -> Solution:
+        """Find the shortest path between two cells of a passage bitmask."""
+        pruned = fill_dead_ends(mask, cols, keep=(start, end))
+        graph = ReducedGraph(pruned, cols, terminals=(start, end))
+        path, stats = graph.shortest_path(start, end)
+
+        distances = [-1] * len(mask)
+        for distance, index in enumerate(path):
+            distances[index] = distance
+
+        return Solution(path, distances, stats)
@@ -0,0 +1,154 @@
+"""Maze reductions to speed up solvers."""
+import heapq
+from typing import Iterable
+
+import numpy as np
+
+from mazy.models.cell import DIRECTION_MASKS, DIRECTION_OFFSETS
+from mazy.models.solver import SolverStats
+
+# Number of passages of each 4-bit passage mask.
+DEGREES = bytes(mask.bit_count() for mask in range(16))
+
+
+def single_passage_steps(cols: int) -> dict[int, tuple[int, int]]:
+    """Index offset and opposite passage bit for each single passage bit."""
+    return {
+        DIRECTION_MASKS[direction]: (
+            row_offset * cols + col_offset,
+            DIRECTION_MASKS[direction.opposite()],
+        )
+        for direction, (row_offset, col_offset) in DIRECTION_OFFSETS.items()
+    }
+
+
+def fill_dead_ends(mask: bytearray, cols: int, keep: Iterable[int]) -> bytearray:
+    """Wall up the dead ends of a maze, until none is left.
+
+    Dead ends are cells with a single passage. Filling one may turn its
+    neighbor into a new dead end, so the filling goes on from there. The
+    cells to keep are never filled: on a perfect maze, only the paths
+    between them are left.
+
+    Returns a pruned copy of the passage bitmask.
+    """
+    pruned = bytearray(mask)
+    keep = set(keep)
+    steps = single_passage_steps(cols)
+    degrees = np.frombuffer(DEGREES, dtype=np.uint8)[np.frombuffer(pruned, np.uint8)]
+    dead_ends = np.flatnonzero(degrees == 1).tolist()
+
+    while dead_ends:
+        index = dead_ends.pop()
+        cell_mask = pruned[index]
+        if index in keep or DEGREES[cell_mask] != 1:
+            continue
+
+        offset, opposite = steps[cell_mask]
+        pruned[index] = 0
+        index += offset
+        pruned[index] &= ~opposite
+        if DEGREES[pruned[index]] == 1:
+            dead_ends.append(index)
+
+    return pruned
+
+
+class ReducedGraph:
+    """Weighted graph of the junctions of a maze.
+
+    Every chain of cells with exactly two passages, a corridor, collapses
+    into a single edge weighted by its number of steps. Nodes are the
+    remaining cells with passages, plus the terminals: the cells to be
+    used as the ends of the queries, even if they lie on a corridor.
+
+    Each edge keeps the passage bit of its first step, so the corridor
+    can be walked again on the passage bitmask to expand the path found
+    between the nodes. Pruning the dead ends beforehand shrinks the graph
+    further.
+    """
+
+    def __init__(self, mask: bytearray, cols: int, terminals: Iterable[int] = ()):
+        self.mask = mask
+        self.cols = cols
+        self.edges: dict[int, list[tuple[int, int, int]]] = {}
+        self.connect(terminals)
+
+    def __len__(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.edges)
+
+    def connect(self, terminals: Iterable[int]) -> None:
+        """Find the nodes and walk the corridors between them."""
+        mask, cols = self.mask, self.cols
+        steps = single_passage_steps(cols)
+        degrees = np.frombuffer(DEGREES, dtype=np.uint8)[np.frombuffer(mask, np.uint8)]
+        node_flags = (degrees != 2) & (degrees != 0)
+        node_flags[list(terminals)] = True
+        nodes = np.flatnonzero(node_flags).tolist()
+        is_node = node_flags.tobytes()
+
+        for node in nodes:
+            node_edges = self.edges[node] = []
+            for first_bit, (first_offset, opposite) in steps.items():
+                if not mask[node] & first_bit:
+                    continue
+
+                index, weight = node + first_offset, 1
+                while not is_node[index]:
+                    offset, opposite = steps[mask[index] & ~opposite]
+                    index, weight = index + offset, weight + 1
+                node_edges.append((index, weight, first_bit))
+
+    def shortest_path(self, start: int, end: int) -> tuple[list[int], SolverStats]:
+        """Shortest path of cells between two nodes, using Dijkstra.
+
+        Returns an empty path when the end can't be reached.
+        """
+        stats = SolverStats()
+        distances = {start: 0}
+        previous: dict[int, tuple[int, int]] = {}
+        settled = set()
+        frontier = [(0, start)]
+
+        while frontier:
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+            distance, node = heapq.heappop(frontier)
+            if node in settled:
+                continue
+
+            settled.add(node)
+            stats.expanded += 1
+            if node == end:
+                return self.expand(start, end, previous), stats
+
+            for neighbor, weight, first_bit in self.edges[node]:
+                if distance + weight < distances.get(neighbor, distance + weight + 1):
+                    distances[neighbor] = distance + weight
+                    previous[neighbor] = (node, first_bit)
+                    heapq.heappush(frontier, (distance + weight, neighbor))
+
+        return [], stats
+
+    def expand(
+        self, start: int, end: int, previous: dict[int, tuple[int, int]]
+    ) -> list[int]:
+        """Walk the corridors between the nodes of a path, back from its end."""
+        steps = single_passage_steps(self.cols)
+        corridors = []
+        node = end
+        while node != start:
+            previous_node, first_bit = previous[node]
+            offset, opposite = steps[first_bit]
+            corridor = [previous_node]
+            index = previous_node + offset
+            while index != node:
+                corridor.append(index)
+                offset, opposite = steps[self.mask[index] & ~opposite]
+                index += offset
+            corridors.append(corridor)
+            node = previous_node
+
+        path = [index for corridor in reversed(corridors) for index in corridor]
+        path.append(end)
+        return path
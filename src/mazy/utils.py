@@ -1,4 +1,5 @@
 """Utility functions for general use."""
+from array import array
 from typing import Generator, Optional, TypeVar
 
 T = TypeVar("T")
@@ -11,3 +12,73 @@ def consume_generator(generator: Generator[T, None, Optional[T]]) -> T:
         item = sentinel
 
     return item
+
+
+class Bitmap:
+    """Fixed size sequence of flags packed as bits in a bytearray."""
+
+    __slots__ = ("size", "bits")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+
+    def __len__(self) -> int:
+        """Number of flags in the bitmap."""
+        return self.size
+
+    def __getitem__(self, index: int) -> bool:
+        """Read the flag on a given position."""
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        """Set or clear the flag on a given position."""
+        if value:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+class DisjointSet:
+    """Union-find over the integers in [0, size).
+
+    Uses union by rank and path compression, so any sequence of
+    operations runs in near-linear time.
+    """
+
+    __slots__ = ("parent", "rank")
+
+    def __init__(self, size: int) -> None:
+        self.parent = array("q", range(size))
+        self.rank = bytearray(size)
+
+    def find(self, item: int) -> int:
+        """Representative of the set containing the item."""
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+
+        return root
+
+    def union(self, item: int, other_item: int) -> bool:
+        """Merge the sets of both items.
+
+        Returns False when they were already in the same set.
+        """
+        root = self.find(item)
+        other_root = self.find(other_item)
+        if root == other_root:
+            return False
+
+        if self.rank[root] < self.rank[other_root]:
+            root, other_root = other_root, root
+
+        self.parent[other_root] = root
+        if self.rank[root] == self.rank[other_root]:
+            self.rank[root] += 1
+
+        return True
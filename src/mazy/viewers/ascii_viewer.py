@@ -1,51 +1,66 @@
 """Text viewer."""
+import sys
+from typing import Iterator, Optional, TextIO
+
+import numpy as np
+
 from mazy.builders.base_builder import MazeBuilder
-from mazy.models.cell import Direction, Role
-from mazy.utils import consume_generator
+from mazy.models.viewer import TextStyle
 from mazy.viewers.base_viewer import MazeViewer
+from mazy.viewers.geometry import wall_masks
+from mazy.viewers.text_renderers import create_renderer
 
 
 class MazeTextViewer(MazeViewer):
     """Text viewer."""
 
-    def __init__(self, maze_builder: MazeBuilder) -> None:
+    def __init__(
+        self,
+        maze_builder: MazeBuilder,
+        output: Optional[str] = None,
+        style: TextStyle = TextStyle.ASCII,
+    ):
         self.maze_builder = maze_builder
+        self.output = output
+        self.style = style
         self.name = "text"
 
     def show_maze(self) -> None:
-        """Print a text representation of the maze."""
-        print(self.maze_to_str())
+        """Print a text representation of the maze, row by row.
+
+        When an output file is set, the maze is written there instead.
+        """
+        if self.output:
+            with open(self.output, "w") as file:
+                self.write_maze(file)
+            return
+
+        self.write_maze(sys.stdout)
 
     def maze_to_str(self) -> str:
         """Create an ASCII representation for a given maze."""
-        maze = consume_generator(self.maze_builder.build_maze())
-        maze_str = ""
-        for row in range(maze.rows):
-            for col in range(maze.cols):
-                cell = maze[row, col]
-                maze_str += (
-                    "+    "
-                    if cell.has_passage_to_direction(Direction.NORTH)
-                    or cell.role == Role.ENTRANCE
-                    else "+----"
-                )
-                if col == maze.cols - 1:
-                    maze_str += "+"
-            maze_str += "\n"
-
-            for col in range(maze.cols):
-                cell = maze[row, col]
-                maze_str += (
-                    "     "
-                    if cell.has_passage_to_direction(Direction.WEST)
-                    else "|    "
-                )
-                if col == maze.cols - 1:
-                    maze_str += "|"
-
-            maze_str += "\n"
-            if row == maze.rows - 1:
-                maze_str += "+----" * (maze.cols - 1)
-                maze_str += "+    +"
-
-        return maze_str
+        return "\n".join(self.render_lines())
+
+    def write_maze(self, file: TextIO) -> None:
+        """Write the ASCII representation of the maze to a file, line by line."""
+        for line in self.render_lines():
+            file.write(line)
+            file.write("\n")
+
+    def render_lines(self) -> Iterator[str]:
+        """Render the text representation of the maze, one line at a time.
+
+        Each row of the maze is rendered as soon as the builder produces
+        it, so only a row is held in memory, and streaming builders never
+        hold the whole maze either. The wall masks of a row are computed
+        at once from its passage masks.
+        """
+        renderer = create_renderer(self.style)
+        rows, cols = self.maze_builder.rows, self.maze_builder.cols
+        walls = np.zeros(cols, dtype=np.uint8)
+
+        for row, row_mask in enumerate(self.maze_builder.build_rows()):
+            walls = wall_masks(row_mask, row, rows)
+            yield from renderer.render_row(walls)
+
+        yield from renderer.render_bottom(walls)
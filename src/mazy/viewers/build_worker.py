@@ -0,0 +1,114 @@
+"""Background building of a maze."""
+import queue
+import threading
+import time
+from typing import Iterator, Optional
+
+from mazy.models.viewer import BackpressurePolicy
+
+DEFAULT_QUEUE_SIZE = 64
+# Seconds between checks for a stop request, while waiting on the queue.
+STOP_CHECK_INTERVAL = 0.1
+
+Delta = set[tuple[int, int]]
+
+
+class BuildWorker:
+    """Runs the building steps of a maze on a background thread.
+
+    The cells touched by each step are pushed as deltas through a bounded
+    queue, which the viewer drains on its own pace. The maze is shared:
+    a delta is only pushed once its step is done, so the cells it names
+    can be read right away.
+
+    When the queue is full, the blocking policy waits for the viewer,
+    pacing the building to the rendering. The coalescing policy keeps
+    building, merging the touched cells into a pending delta until the
+    queue has room, so the building runs at full speed.
+    """
+
+    def __init__(
+        self,
+        steps: Iterator[list[tuple[int, int]]],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+    ):
+        if queue_size < 1:
+            raise ValueError(f"Queue size must be a positive number, got {queue_size}.")
+
+        self.steps = steps
+        self.policy = policy
+        self.deltas: queue.Queue[Optional[Delta]] = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.step_count = 0
+        self.building_time = 0.0
+
+    def start(self) -> None:
+        """Start building on the background thread."""
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Ask the building to stop and wait for the thread to finish."""
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def run(self) -> None:
+        """Take the building steps, pushing their deltas to the queue.
+
+        The end of the building is signaled by pushing None.
+        """
+        pending: Delta = set()
+        start = time.perf_counter()
+        for touched in self.steps:
+            if self.stopped.is_set():
+                return
+
+            pending.update(touched)
+            self.step_count += 1
+            self.building_time = time.perf_counter() - start
+            if self.policy == BackpressurePolicy.COALESCE:
+                try:
+                    self.deltas.put_nowait(pending)
+                    pending = set()
+                except queue.Full:
+                    pass
+            elif self.put(pending):
+                pending = set()
+            else:
+                return
+
+        if pending and not self.put(pending):
+            return
+        self.put(None)
+
+    def put(self, delta: Optional[Delta]) -> bool:
+        """Push a delta, waiting for room in the queue unless stopped.
+
+        Returns whether the delta was pushed.
+        """
+        while not self.stopped.is_set():
+            try:
+                self.deltas.put(delta, timeout=STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def drain(self) -> tuple[Delta, bool]:
+        """Take all the deltas in the queue, without waiting.
+
+        Returns the cells they touched and whether the building is over.
+        """
+        touched: Delta = set()
+        while True:
+            try:
+                delta = self.deltas.get_nowait()
+            except queue.Empty:
+                return touched, False
+
+            if delta is None:
+                return touched, True
+            touched |= delta
@@ -0,0 +1,177 @@
+"""Geometry of the maze shapes, shared by the graphical viewers.
+
+Coordinates have their origin on the lower-left corner, with the maze
+surrounded by an external margin. Nothing here depends on a GUI, so the
+same walls can be drawn on a window or written to a file.
+"""
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from mazy.models.cell import DIRECTION_MASKS, Direction, Role
+
+CELL_SIZE = 32
+EXTERNAL_SIZE = 32
+
+
+class Point(NamedTuple):
+    """Point on the maze canvas."""
+
+    x: int
+    y: int
+
+
+Segment = tuple[Point, Point]
+
+
+def wall_masks(row_mask: bytes, row: int, rows: int) -> npt.NDArray[np.uint8]:
+    """4-bit wall masks of a row of cells, with the entrance and exit open.
+
+    The entrance is on the north of the first cell and the exit on the
+    south of the last one. A single cell maze has no entrance, the exit
+    role takes over it.
+    """
+    walls = np.frombuffer(row_mask, dtype=np.uint8) ^ np.uint8(0b1111)
+    if row == 0 and rows * len(row_mask) > 1:
+        walls[0] &= ~np.uint8(DIRECTION_MASKS[Direction.NORTH])
+    if row == rows - 1:
+        walls[-1] &= ~np.uint8(DIRECTION_MASKS[Direction.SOUTH])
+    return walls
+
+
+class MazeGeometry:
+    """Coordinates of the walls of a maze."""
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+
+    @property
+    def delta_y(self) -> int:
+        """Transport origin y-axis from lower-corner to upper-corner."""
+        return self.rows * CELL_SIZE + EXTERNAL_SIZE
+
+    @property
+    def width(self) -> int:
+        """Width of the maze, with its margins."""
+        return self.cols * CELL_SIZE + 2 * EXTERNAL_SIZE
+
+    @property
+    def height(self) -> int:
+        """Height of the maze, with its margins."""
+        return self.rows * CELL_SIZE + 2 * EXTERNAL_SIZE
+
+    def cell_points(
+        self, row: int, col: int, passages: int, role: Role = Role.NONE
+    ) -> tuple[list[Point], Point]:
+        """Calculate the wall points and the center point of a cell.
+
+        Walls come as pairs of points, from the passage bitmask of the
+        cell. Each wall between two cells is drawn by only one of them:
+        the cell on its north or on its west.
+        """
+        start_x = EXTERNAL_SIZE + col * CELL_SIZE
+        start_y = self.delta_y - row * CELL_SIZE
+
+        end_x = EXTERNAL_SIZE + col * CELL_SIZE + CELL_SIZE
+        end_y = self.delta_y - row * CELL_SIZE - CELL_SIZE
+
+        center_point = Point(start_x + CELL_SIZE // 2, start_y - CELL_SIZE // 2)
+        border_points = []
+
+        # First horizontal line (frontier on NORTH)
+        if not role == Role.ENTRANCE and row == 0:
+            border_points.append(Point(start_x, self.delta_y))
+            border_points.append(Point(end_x, self.delta_y))
+
+        # First vertical line (frontier on WEST)
+        if col == 0:
+            border_points.append(Point(EXTERNAL_SIZE, start_y))
+            border_points.append(Point(EXTERNAL_SIZE, end_y))
+
+        # Internal lines (horizontal walls)
+        if not passages & DIRECTION_MASKS[Direction.SOUTH] and row < self.rows - 1:
+            border_points.append(Point(start_x, end_y))
+            border_points.append(Point(end_x, end_y))
+
+        # Internal lines (vertical wall)
+        if not passages & DIRECTION_MASKS[Direction.EAST] and col < self.cols - 1:
+            border_points.append(Point(end_x, start_y))
+            border_points.append(Point(end_x, end_y))
+
+        # Last horizontal line (frontier on SOUTH)
+        if not role == Role.EXIT and row == self.rows - 1:
+            border_points.append(Point(start_x, EXTERNAL_SIZE))
+            border_points.append(Point(end_x, EXTERNAL_SIZE))
+
+        # Last vertical line (frontier on EAST)
+        if col == self.cols - 1:
+            border_points.append(Point(end_x, start_y))
+            border_points.append(Point(end_x, end_y))
+
+        return border_points, center_point
+
+    def row_walls(self, row: int, row_mask: bytes) -> Iterator[Segment]:
+        """Wall segments drawn by the cells of a row, from their passages.
+
+        The entrance is on the first cell and the exit on the last one,
+        which takes over both roles in a single cell maze.
+        """
+        last = self.rows * self.cols - 1
+        for col, passages in enumerate(row_mask):
+            index = row * self.cols + col
+            role = Role.NONE
+            if index == last:
+                role = Role.EXIT
+            elif index == 0:
+                role = Role.ENTRANCE
+
+            points, _ = self.cell_points(row, col, passages, role)
+            for position in range(0, len(points), 2):
+                yield points[position], points[position + 1]
+
+
+def merge_segments(rows: Iterable[Iterable[Segment]]) -> Iterator[Segment]:
+    """Merge collinear adjacent segments into single long lines.
+
+    Segments come grouped by rows of cells, from top to bottom, as drawn
+    by `MazeGeometry.row_walls`. Horizontal lines never continue on the
+    next row, so they're done at the end of each row. Vertical lines are
+    kept open while the next rows continue them, which only holds a line
+    per column in memory.
+    """
+    verticals: dict[int, tuple[int, int]] = {}
+    for segments in rows:
+        horizontals: dict[int, tuple[int, int]] = {}
+        continued: dict[int, tuple[int, int]] = {}
+        for start, end in segments:
+            if start.y == end.y:
+                low, high = sorted((start.x, end.x))
+                line = horizontals.get(start.y)
+                if line is not None and line[1] == low:
+                    horizontals[start.y] = (line[0], high)
+                    continue
+
+                if line is not None:
+                    yield Point(line[0], start.y), Point(line[1], start.y)
+                horizontals[start.y] = (low, high)
+            else:
+                low, high = sorted((start.y, end.y))
+                line = verticals.pop(start.x, None)
+                if line is not None and line[0] == high:
+                    continued[start.x] = (low, line[1])
+                    continue
+
+                if line is not None:
+                    yield Point(start.x, line[1]), Point(start.x, line[0])
+                continued[start.x] = (low, high)
+
+        for y, (low, high) in horizontals.items():
+            yield Point(low, y), Point(high, y)
+        for x, (low, high) in verticals.items():
+            yield Point(x, high), Point(x, low)
+        verticals = continued
+
+    for x, (low, high) in verticals.items():
+        yield Point(x, high), Point(x, low)
@@ -1,48 +1,82 @@
 """Graphical viewer."""
+import time
 from collections import namedtuple
-from typing import Any, Generator
-
-from arcade import (
-    Shape,
-    ShapeElementList,
-    Window,
-    color,
-    create_lines,
-    create_rectangle,
-    set_background_color,
-)
+from typing import Generator, Iterable, Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+from arcade import Color, Window, color, get_four_byte_color, set_background_color
+from arcade.gl import Buffer, BufferDescription, Geometry
 
 from mazy.builders.base_builder import MazeBuilder
-from mazy.models.cell import Cell, Direction, Role
-from mazy.models.maze import Maze
-from mazy.utils import consume_generator
+from mazy.models.cell import DIRECTION_MASKS
+from mazy.models.grid import GridCell, MazeGrid
+from mazy.models.viewer import BackpressurePolicy
 from mazy.viewers.base_viewer import MazeViewer
+from mazy.viewers.build_worker import DEFAULT_QUEUE_SIZE, BuildWorker
+from mazy.viewers.geometry import CELL_SIZE, EXTERNAL_SIZE, MazeGeometry, Point
 
 SCREEN_TITLE = "Mazy"
 BACKGROUND_COLOR = color.BLACK
 BORDER_COLOR = color.GRAY
 UNVISITED_CELL_COLOR = color.GRAY
 
-CELL_SIZE = 32
 CELL_FILL_SIZE = 24
-EXTERNAL_SIZE = 32
+# Vertices of the walls a cell may draw: up to four lines.
+WALL_VERTICES = 8
+# Vertices of the two triangles filling an unvisited cell.
+FILL_VERTICES = 6
 
-Point = namedtuple("Point", ["x", "y"])
 Center = namedtuple("Center", ["center_x", "center_y"])
+Vertices = npt.NDArray[np.float32]
+
+
+def contiguous_runs(indexes: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """Group sorted indexes into runs of consecutive ones, as [start, stop)."""
+    start = stop = -1
+    for index in indexes:
+        if index != stop:
+            if start >= 0:
+                yield start, stop
+            start = index
+        stop = index + 1
+
+    if start >= 0:
+        yield start, stop
 
 
 class MazeGraphicalViewer(MazeViewer):
     """Graphical viewer."""
 
-    def __init__(self, maze_builder: MazeBuilder, animated: bool = False) -> None:
+    def __init__(
+        self,
+        maze_builder: MazeBuilder,
+        animated: bool = False,
+        stride: int = 1,
+        frame_budget: Optional[float] = None,
+        threaded: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+    ) -> None:
         self.maze_builder = maze_builder
         self.animated = animated
+        self.stride = stride
+        self.frame_budget = frame_budget
+        self.threaded = threaded
+        self.queue_size = queue_size
+        self.policy = policy
         self.name = "graphical"
 
     def show_maze(self) -> None:
         """Render and show the graphical representation of the maze."""
         processor = MazeGraphicalProcessor(
-            maze_builder=self.maze_builder, animated=self.animated
+            maze_builder=self.maze_builder,
+            animated=self.animated,
+            stride=self.stride,
+            frame_budget=self.frame_budget,
+            threaded=self.threaded,
+            queue_size=self.queue_size,
+            policy=self.policy,
         )
         gui = MazeGraphicalRenderer(
             rows=self.maze_builder.maze.rows,
@@ -53,87 +87,173 @@ class MazeGraphicalViewer(MazeViewer):
 
 
 class MazeGraphicalProcessor:
-    """Process graphical information of the maze."""
+    """Process graphical information of the maze.
+
+    The vertices of the whole maze live in two arrays with a fixed slot
+    per cell: one for its walls, drawn as lines, and one for its fill,
+    drawn as triangles while the cell is unvisited. Unused vertices
+    collapse on the center of the cell, drawing nothing. Each building
+    step only patches the slots of the cells it touched.
+
+    Animated builds advance a stride of steps per frame or, given a frame
+    budget in milliseconds, as many steps as fit in it. Threaded builds
+    run on a background worker instead, and each frame takes the cells
+    touched since the previous one.
+    """
+
+    def __init__(
+        self,
+        maze_builder: MazeBuilder,
+        animated: bool = False,
+        stride: int = 1,
+        frame_budget: Optional[float] = None,
+        threaded: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+    ):
+        if stride < 1:
+            raise ValueError(f"Stride must be a positive number, got {stride}.")
+        if frame_budget is not None and frame_budget <= 0:
+            raise ValueError(f"Frame budget must be positive, got {frame_budget}.")
 
-    def __init__(self, maze_builder: MazeBuilder, animated: bool = False):
         self.rows = maze_builder.maze.rows
         self.cols = maze_builder.maze.cols
-        self.maze_generator: Generator[Maze, None, Maze] = maze_builder.build_maze()
-        self.maze = (
-            maze_builder.maze if animated else consume_generator(self.maze_generator)
-        )
+        self.maze_steps: Generator[
+            list[tuple[int, int]], None, MazeGrid
+        ] = maze_builder.build_steps()
+        self.maze = maze_builder.maze if animated else maze_builder.build()
         self.animated = animated
+        self.stride = stride
+        self.frame_budget = frame_budget
+        self.finished = not animated
+        self.steps = 0
+        self.building_time = 0.0
+        self.geometry = MazeGeometry(self.rows, self.cols)
+
+        self.wall_vertices: Vertices = np.zeros(
+            (self.rows * self.cols, WALL_VERTICES, 2), dtype=np.float32
+        )
+        self.fill_vertices: Vertices = np.zeros(
+            (self.rows * self.cols, FILL_VERTICES, 2), dtype=np.float32
+        )
+        self.update_cells(range(self.rows * self.cols))
+
+        self.worker: Optional[BuildWorker] = None
+        if animated and threaded:
+            self.worker = BuildWorker(self.maze_steps, queue_size, policy)
+            self.worker.start()
 
     @property
     def delta_y(self) -> int:
         """Transport origin y-axis from lower-corner to upper-corner."""
-        return self.rows * CELL_SIZE + EXTERNAL_SIZE
+        return self.geometry.delta_y
 
-    def calculate_cell_points(self, cell: Cell) -> tuple[list[Point], Point]:
+    def calculate_cell_points(self, cell: GridCell) -> tuple[list[Point], Point]:
         """Calculate primitive coordinates of the maze shapes."""
-        start_x = EXTERNAL_SIZE + cell.col * CELL_SIZE
-        start_y = self.delta_y - cell.row * CELL_SIZE
-
-        end_x = EXTERNAL_SIZE + cell.col * CELL_SIZE + CELL_SIZE
-        end_y = self.delta_y - cell.row * CELL_SIZE - CELL_SIZE
-
-        center_point = Point(start_x + CELL_SIZE // 2, start_y - CELL_SIZE // 2)
-        border_points = []
-
-        # First horizontal line (frontier on NORTH)
-        if not cell.role == Role.ENTRANCE and cell.row == 0:
-            border_points.append(Point(start_x, self.delta_y))
-            border_points.append(Point(end_x, self.delta_y))
-
-        # First vertical line (frontier on WEST)
-        if cell.col == 0:
-            border_points.append(Point(EXTERNAL_SIZE, start_y))
-            border_points.append(Point(EXTERNAL_SIZE, end_y))
-
-        # Internal lines (horizontal walls)
-        if (
-            not cell.has_passage_to_direction(Direction.SOUTH)
-            and cell.row < self.rows - 1
-        ):
-            border_points.append(Point(start_x, end_y))
-            border_points.append(Point(end_x, end_y))
-
-        # Internal lines (vertical wall)
-        if (
-            not cell.has_passage_to_direction(Direction.EAST)
-            and cell.col < self.cols - 1
-        ):
-            border_points.append(Point(end_x, start_y))
-            border_points.append(Point(end_x, end_y))
-
-        # Last horizontal line (frontier on SOUTH)
-        if not cell.role == Role.EXIT and cell.row == self.rows - 1:
-            border_points.append(Point(start_x, EXTERNAL_SIZE))
-            border_points.append(Point(end_x, EXTERNAL_SIZE))
-
-        # Last vertical line (frontier on EAST)
-        if cell.col == self.cols - 1:
-            border_points.append(Point(end_x, self.delta_y))
-            border_points.append(Point(end_x, EXTERNAL_SIZE))
-
-        return border_points, center_point
-
-    def process_maze(self) -> tuple[list[Point], list[Point]]:
-        """Traverse the latest maze version processing graphical info."""
-        if self.animated:
-            next(self.maze_generator, None)
-
-        cell_border_points = []
-        cell_center_points = []
-
-        for cell in self.maze.traverse_by_cell():
-            border_points, center_point = self.calculate_cell_points(cell)
-            cell_border_points.extend(border_points)
+        passages = sum(
+            mask
+            for direction, mask in DIRECTION_MASKS.items()
+            if cell.has_passage_to_direction(direction)
+        )
+        return self.geometry.cell_points(cell.row, cell.col, passages, cell.role)
 
-            if not cell.visited:
-                cell_center_points.append(center_point)
+    @property
+    def steps_per_second(self) -> float:
+        """Building steps achieved per second of animation processing."""
+        return self.steps / self.building_time if self.building_time else 0.0
+
+    def process_changes(self) -> list[int]:
+        """Advance the building by a frame, updating the cells it changed.
+
+        A passage carved from a touched cell may change the walls drawn
+        by its neighbors on the north and on the west, so they're updated
+        too. Returns the sorted indexes of the updated cells.
+        """
+        if self.finished:
+            return []
+
+        touched = self.advance() if self.worker is None else self.receive(self.worker)
+        if not touched:
+            return []
+
+        changed = set()
+        for row, col in touched:
+            index = row * self.cols + col
+            changed.add(index)
+            if row > 0:
+                changed.add(index - self.cols)
+            if col > 0:
+                changed.add(index - 1)
+
+        indexes = sorted(changed)
+        self.update_cells(indexes)
+        return indexes
+
+    def advance(self) -> list[tuple[int, int]]:
+        """Advance the building steps of a frame, returning the touched cells.
+
+        Takes a stride of steps, or as many steps as fit in the frame
+        budget, with at least one.
+        """
+        touched = []
+        start = time.perf_counter()
+        deadline = start + self.frame_budget / 1000 if self.frame_budget else None
+        steps = 0
+        while True:
+            step = next(self.maze_steps, None)
+            if step is None:
+                self.finished = True
+                break
+
+            touched.extend(step)
+            steps += 1
+            if deadline is None and steps == self.stride:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        self.steps += steps
+        self.building_time += time.perf_counter() - start
+        return touched
+
+    def receive(self, worker: BuildWorker) -> set[tuple[int, int]]:
+        """Take the cells touched by the background worker since last frame."""
+        touched, self.finished = worker.drain()
+        self.steps = worker.step_count
+        self.building_time = worker.building_time
+        return touched
+
+    def stop(self) -> None:
+        """Stop the background worker, if any."""
+        if self.worker is not None:
+            self.worker.stop()
+
+    def update_cells(self, indexes: Iterable[int]) -> None:
+        """Update the vertices of the given cells from their current state."""
+        half_fill = CELL_FILL_SIZE // 2
+        for index in indexes:
+            cell = self.maze[divmod(index, self.cols)]
+            border_points, center_point = self.calculate_cell_points(cell)
 
-        return cell_border_points, cell_center_points
+            walls = self.wall_vertices[index]
+            walls[:] = center_point
+            if border_points:
+                walls[: len(border_points)] = border_points
+
+            fill = self.fill_vertices[index]
+            fill[:] = center_point
+            # Mazes built at once have no visited flags, only animated ones.
+            if self.animated and not cell.visited:
+                left, right = center_point.x - half_fill, center_point.x + half_fill
+                bottom, top = center_point.y - half_fill, center_point.y + half_fill
+                fill[:] = [
+                    (left, bottom),
+                    (right, bottom),
+                    (right, top),
+                    (left, bottom),
+                    (right, top),
+                    (left, top),
+                ]
 
 
 class MazeGraphicalRenderer(Window):
@@ -141,6 +261,10 @@ class MazeGraphicalRenderer(Window):
 
     Extends Arcade Window object, drawing a window with
     a canvas for the maze graphical representation.
+
+    The vertices of the maze are uploaded once to persistent buffers.
+    Each update only writes the slots of the changed cells, so a frame
+    costs the cells touched by a building step, not the whole maze.
     """
 
     def __init__(self, rows: int, cols: int, processor: MazeGraphicalProcessor):
@@ -152,30 +276,67 @@ class MazeGraphicalRenderer(Window):
 
         super().__init__(width=width, height=height, title=title)
         set_background_color(BACKGROUND_COLOR)
+        self.reported = processor.finished
+
+        self.program = self.ctx.line_vertex_shader
+        self.wall_buffer = self.ctx.buffer(
+            data=processor.wall_vertices.tobytes(), usage="dynamic"
+        )
+        self.fill_buffer = self.ctx.buffer(
+            data=processor.fill_vertices.tobytes(), usage="dynamic"
+        )
+        self.walls = self.create_geometry(
+            self.wall_buffer, processor.wall_vertices, BORDER_COLOR
+        )
+        self.fills = self.create_geometry(
+            self.fill_buffer, processor.fill_vertices, UNVISITED_CELL_COLOR
+        )
 
-        self.maze_shapes: ShapeElementList[Shape | Any] = ShapeElementList()  # type: ignore[no-untyped-call]
+    def create_geometry(
+        self, buffer: Buffer, vertices: Vertices, fill_color: Color
+    ) -> Geometry:
+        """Geometry of the vertices on a buffer, all painted with one color."""
+        colors = bytes(get_four_byte_color(fill_color)) * (vertices.size // 2)
+        geometry: Geometry = self.ctx.geometry(
+            [
+                BufferDescription(buffer, "2f", ["in_vert"]),
+                BufferDescription(
+                    self.ctx.buffer(data=colors),
+                    "4f1",
+                    ["in_color"],
+                    normalized=["in_color"],
+                ),
+            ]
+        )
+        return geometry
 
     def on_update(self, delta_time: float) -> None:
-        """Update objects before rendering."""
-        border_points, center_points = self.processor.process_maze()
-        self.maze_shapes = ShapeElementList()  # type: ignore[no-untyped-call]
-
-        for center in center_points:
-            self.maze_shapes.append(
-                create_rectangle(
-                    center_x=center.x,
-                    center_y=center.y,
-                    width=CELL_FILL_SIZE,
-                    height=CELL_FILL_SIZE,
-                    color=UNVISITED_CELL_COLOR,
-                )
+        """Write the vertices of the cells changed by the next building step."""
+        processor = self.processor
+        for start, stop in contiguous_runs(processor.process_changes()):
+            self.wall_buffer.write(
+                processor.wall_vertices[start:stop].tobytes(),
+                offset=start * processor.wall_vertices[0].nbytes,
+            )
+            self.fill_buffer.write(
+                processor.fill_vertices[start:stop].tobytes(),
+                offset=start * processor.fill_vertices[0].nbytes,
             )
 
-        self.maze_shapes.append(
-            create_lines(point_list=border_points, color=BORDER_COLOR)
-        )
+        if processor.finished and not self.reported:
+            self.reported = True
+            print(
+                f"Animated {processor.steps} steps "
+                f"at {processor.steps_per_second:,.0f} steps/sec."
+            )
+
+    def on_close(self) -> None:
+        """Stop the building before closing the window."""
+        self.processor.stop()
+        super().on_close()
 
     def on_draw(self) -> None:
         """Render all objects for the active window."""
         self.clear()
-        self.maze_shapes.draw()  # type: ignore[no-untyped-call]
+        self.fills.render(self.program, mode=self.ctx.TRIANGLES)
+        self.walls.render(self.program, mode=self.ctx.LINES)
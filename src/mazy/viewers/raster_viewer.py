@@ -0,0 +1,168 @@
+"""Raster viewer."""
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.models.cell import EAST, NORTH, SOUTH, WEST
+from mazy.models.viewer import RasterFormat
+from mazy.viewers.base_viewer import MazeViewer
+from mazy.viewers.geometry import CELL_SIZE, EXTERNAL_SIZE, wall_masks
+
+DEFAULT_RASTER_OUTPUT = "maze.png"
+# RGB colors of the pixels, indexed by their value: background and walls.
+PALETTE = np.array([[255, 255, 255], [0, 0, 0]], dtype=np.uint8)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+Pixels = npt.NDArray[np.uint8]
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """PNG chunk with its length and checksum."""
+    checksum = zlib.crc32(kind + data)
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", checksum)
+
+
+class MazeRasterViewer(MazeViewer):
+    """Raster viewer.
+
+    Paints the walls straight into a pixel buffer, without any GUI. Each
+    row of cells becomes a band of pixels as soon as the builder produces
+    it, and the band is written right away. Pixels hold palette indexes,
+    written as a 1-bit PNG with a palette or expanded to RGB for a PPM.
+    The image format follows the extension of the output file.
+
+    Cells and margins are scaled from the graphical viewer geometry, so
+    smaller cells make thumbnails.
+    """
+
+    def __init__(
+        self,
+        maze_builder: MazeBuilder,
+        output: str = DEFAULT_RASTER_OUTPUT,
+        cell_size: int = CELL_SIZE,
+    ):
+        if cell_size < 2:
+            raise ValueError(f"Cell size must be at least 2 pixels, got {cell_size}.")
+
+        self.maze_builder = maze_builder
+        self.output = output
+        self.cell_size = cell_size
+        self.margin = EXTERNAL_SIZE * cell_size // CELL_SIZE
+        self.wall_width = max(1, cell_size // 16)
+        self.name = "raster"
+
+    @property
+    def width(self) -> int:
+        """Width of the image, in pixels."""
+        cols = self.maze_builder.cols
+        return cols * self.cell_size + 2 * self.margin + self.wall_width
+
+    @property
+    def height(self) -> int:
+        """Height of the image, in pixels."""
+        rows = self.maze_builder.rows
+        return rows * self.cell_size + 2 * self.margin + self.wall_width
+
+    @property
+    def image_format(self) -> RasterFormat:
+        """Image format, from the extension of the output file."""
+        return RasterFormat(Path(self.output).suffix.lstrip(".").lower())
+
+    def show_maze(self) -> None:
+        """Write the image of the maze to the output file."""
+        image_format = self.image_format
+        with open(self.output, "wb") as file:
+            match image_format:
+                case RasterFormat.PNG:
+                    self.write_png(file)
+                case RasterFormat.PPM:
+                    self.write_ppm(file)
+
+    def write_ppm(self, file: BinaryIO) -> None:
+        """Write the image of the maze as a binary PPM, band by band."""
+        file.write(f"P6\n{self.width} {self.height}\n255\n".encode("ascii"))
+        for band in self.render_bands():
+            file.write(PALETTE[band].tobytes())
+
+    def write_png(self, file: BinaryIO) -> None:
+        """Write the image of the maze as a PNG, band by band.
+
+        Each band is packed to a bit per pixel, prefixed by the filter
+        type of each scanline, and compressed as a single zlib stream
+        spread over as many data chunks as needed.
+        """
+        header = struct.pack(">IIBBBBB", self.width, self.height, 1, 3, 0, 0, 0)
+        file.write(PNG_SIGNATURE)
+        file.write(png_chunk(b"IHDR", header))
+        file.write(png_chunk(b"PLTE", PALETTE.tobytes()))
+
+        compressor = zlib.compressobj()
+        for band in self.render_bands():
+            packed = np.packbits(band, axis=1)
+            scanlines = np.zeros((len(packed), packed.shape[1] + 1), dtype=np.uint8)
+            scanlines[:, 1:] = packed
+            data = compressor.compress(scanlines.tobytes())
+            if data:
+                file.write(png_chunk(b"IDAT", data))
+
+        file.write(png_chunk(b"IDAT", compressor.flush()))
+        file.write(png_chunk(b"IEND", b""))
+
+    def render_bands(self) -> Iterator[Pixels]:
+        """Paint the image of the maze, one band of pixel rows at a time.
+
+        A band is made of a cell row: its north walls on top and its west
+        walls along it. Vertical walls run over the corners below them,
+        into the top of the next band, so the corners are always joined.
+        """
+        rows = self.maze_builder.rows
+        cell_size, width = self.cell_size, self.width
+
+        yield np.zeros((self.margin, width), dtype=np.uint8)
+
+        verticals = np.zeros(width, dtype=np.uint8)
+        walls = np.zeros(self.maze_builder.cols, dtype=np.uint8)
+        for row, row_mask in enumerate(self.maze_builder.build_rows()):
+            walls = wall_masks(row_mask, row, rows)
+            band = np.zeros((cell_size, width), dtype=np.uint8)
+            band[: self.wall_width] = verticals | self.horizontal_line(
+                walls & np.uint8(NORTH)
+            )
+            verticals = self.vertical_lines(walls)
+            band |= verticals
+            yield band
+
+        band = np.zeros((self.wall_width + self.margin, width), dtype=np.uint8)
+        band[: self.wall_width] = verticals | self.horizontal_line(
+            walls & np.uint8(SOUTH)
+        )
+        yield band
+
+    def horizontal_line(self, walls: Pixels) -> Pixels:
+        """Pixels of the horizontal walls of a row, from the given wall bits.
+
+        Each wall spans its cell and the corner on its east.
+        """
+        cols, cell_size, margin = len(walls), self.cell_size, self.margin
+        flags = (walls != 0).astype(np.uint8)
+        line = np.zeros(self.width, dtype=np.uint8)
+        line[margin : margin + cols * cell_size] = np.repeat(flags, cell_size)
+        corners = margin + cell_size + np.arange(cols) * cell_size
+        for offset in range(self.wall_width):
+            line[corners + offset] |= flags
+        return line
+
+    def vertical_lines(self, walls: Pixels) -> Pixels:
+        """Pixels of the vertical walls crossing a row of cells."""
+        cols, cell_size, margin = len(walls), self.cell_size, self.margin
+        line = np.zeros(self.width, dtype=np.uint8)
+        starts = margin + np.arange(cols) * cell_size
+        for offset in range(self.wall_width):
+            line[starts + offset] = (walls & WEST) != 0
+            line[margin + cols * cell_size + offset] = (walls[-1] & EAST) != 0
+        return line
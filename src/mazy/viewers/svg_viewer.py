@@ -0,0 +1,95 @@
+"""SVG viewer."""
+import sys
+from typing import Iterator, Optional, TextIO
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.viewers.base_viewer import MazeViewer
+from mazy.viewers.geometry import MazeGeometry, Segment, merge_segments
+
+BACKGROUND_COLOR = "white"
+WALL_COLOR = "black"
+WALL_WIDTH = 2
+# Walls drawn by each path element, to keep lines of a reasonable size.
+PATH_SEGMENTS = 1024
+
+
+class MazeSVGViewer(MazeViewer):
+    """SVG viewer.
+
+    Draws the maze walls as SVG paths, using the same geometry as the
+    graphical viewer. Collinear adjacent walls are merged into single
+    lines, so long corridors take a single command. Each line is a move
+    followed by a relative horizontal or vertical line, and many lines
+    share the same path element, which keeps the file small and fast to
+    render.
+    """
+
+    def __init__(self, maze_builder: MazeBuilder, output: Optional[str] = None):
+        self.maze_builder = maze_builder
+        self.output = output
+        self.name = "svg"
+
+    def show_maze(self) -> None:
+        """Write the SVG representation of the maze to the output file.
+
+        Without an output file, the maze is printed instead.
+        """
+        if self.output:
+            with open(self.output, "w") as file:
+                self.write_maze(file)
+            return
+
+        self.write_maze(sys.stdout)
+
+    def maze_to_str(self) -> str:
+        """Create an SVG representation for a given maze."""
+        return "\n".join(self.render_lines())
+
+    def write_maze(self, file: TextIO) -> None:
+        """Write the SVG representation of the maze to a file, line by line."""
+        for line in self.render_lines():
+            file.write(line)
+            file.write("\n")
+
+    def render_lines(self) -> Iterator[str]:
+        """Render the SVG document, one element per line.
+
+        Walls are merged as the builder produces the rows, so only a row
+        and the vertical lines still open are held in memory.
+        """
+        geometry = MazeGeometry(self.maze_builder.rows, self.maze_builder.cols)
+        width, height = geometry.width, geometry.height
+        yield (
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        )
+        yield f'<rect width="100%" height="100%" fill="{BACKGROUND_COLOR}"/>'
+        yield (
+            f'<g fill="none" stroke="{WALL_COLOR}" stroke-width="{WALL_WIDTH}" '
+            f'stroke-linecap="square">'
+        )
+
+        rows = (
+            geometry.row_walls(row, row_mask)
+            for row, row_mask in enumerate(self.maze_builder.build_rows())
+        )
+        commands = []
+        for segment in merge_segments(rows):
+            commands.append(self.render_segment(segment, height))
+            if len(commands) == PATH_SEGMENTS:
+                yield f'<path d="{"".join(commands)}"/>'
+                commands.clear()
+
+        if commands:
+            yield f'<path d="{"".join(commands)}"/>'
+        yield "</g>"
+        yield "</svg>"
+
+    @staticmethod
+    def render_segment(segment: Segment, height: int) -> str:
+        """SVG path commands for a segment, flipping the y-axis downwards."""
+        start, end = segment
+        if start.y == end.y:
+            return f"M{start.x} {height - start.y}h{end.x - start.x}"
+
+        return f"M{start.x} {height - start.y}v{start.y - end.y}"
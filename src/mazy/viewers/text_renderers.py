@@ -0,0 +1,183 @@
+"""Text renderers for each style of the text viewer."""
+from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from mazy.models.cell import EAST, NORTH, SOUTH, WEST
+from mazy.models.viewer import TextStyle
+
+# Box drawing character joining the lines going to each direction in the mask.
+BOX_DRAWINGS = " ╵╶└╷│┌├╴┘─┴┐┤┬┼"
+
+Walls = npt.NDArray[np.uint8]
+GlyphTable = npt.NDArray[np.uint8] | npt.NDArray[np.uint16]
+
+
+def glyph_table(glyphs: Sequence[str]) -> GlyphTable:
+    """Code points of glyphs of the same width, one row per glyph.
+
+    ASCII glyphs take a byte per character, any other glyph takes two.
+    """
+    codes = [[ord(char) for char in glyph] for glyph in glyphs]
+    if all(glyph.isascii() for glyph in glyphs):
+        return np.array(codes, dtype=np.uint8)
+
+    return np.array(codes, dtype="<u2")
+
+
+def join_glyphs(table: GlyphTable, indexes: npt.NDArray[np.integer]) -> str:
+    """Text made of the glyphs on the given indexes of a table."""
+    encoding = "ascii" if table.dtype == np.uint8 else "utf-16-le"
+    text: str = table[indexes].tobytes().decode(encoding)
+    return text
+
+
+class TextRenderer(ABC):
+    """Renders a maze as text, row by row, through glyph tables.
+
+    Rows come as arrays with the 4-bit wall mask of each cell, using the
+    same bits as the passage masks. Glyph tables are indexed by wall
+    masks, so a whole line is rendered in a single lookup.
+    """
+
+    @abstractmethod
+    def render_row(self, walls: Walls) -> Iterator[str]:
+        """Lines of text for a row of the maze."""
+        ...
+
+    def render_bottom(self, walls: Walls) -> Iterator[str]:
+        """Lines of text closing the maze, below its last row."""
+        yield from ()
+
+
+class WallRenderer(TextRenderer):
+    """Renders each cell with its north and west walls.
+
+    Every row takes a line for the north walls, with the corners, and a
+    line for the west walls. The east and south borders close the maze.
+    """
+
+    corner: str
+    horizontal_wall: str
+    vertical_wall: str
+    space: str
+
+    def __init__(self) -> None:
+        top_glyphs = (self.corner + self.horizontal_wall, self.corner + self.space)
+        side_glyphs = (
+            self.vertical_wall + self.space,
+            " " * len(self.vertical_wall) + self.space,
+        )
+        self.tops = glyph_table(
+            [top_glyphs[0] if walls & NORTH else top_glyphs[1] for walls in range(16)]
+        )
+        self.sides = glyph_table(
+            [side_glyphs[0] if walls & WEST else side_glyphs[1] for walls in range(16)]
+        )
+        self.bottoms = glyph_table(
+            [top_glyphs[0] if walls & SOUTH else top_glyphs[1] for walls in range(16)]
+        )
+
+    def render_row(self, walls: Walls) -> Iterator[str]:
+        """Lines of text for a row of the maze."""
+        yield join_glyphs(self.tops, walls) + self.corner
+        yield join_glyphs(self.sides, walls) + self.vertical_wall
+
+    def render_bottom(self, walls: Walls) -> Iterator[str]:
+        """Lines of text closing the maze, below its last row."""
+        yield join_glyphs(self.bottoms, walls) + self.corner
+
+
+class AsciiRenderer(WallRenderer):
+    """Renders the maze with ASCII characters, 5 columns by 2 lines per cell."""
+
+    corner = "+"
+    horizontal_wall = "----"
+    vertical_wall = "|"
+    space = "    "
+
+
+class BlockRenderer(WallRenderer):
+    """Renders the maze with full blocks, 2 columns by 2 lines per cell."""
+
+    corner = "█"
+    horizontal_wall = "█"
+    vertical_wall = "█"
+    space = " "
+
+
+class UnicodeRenderer(TextRenderer):
+    """Renders the maze with box drawing characters, 4 columns by 2 lines per cell.
+
+    Every corner joins the walls meeting there, so the corner glyph is
+    looked up by a 4-bit mask of the walls going up, right, down and left.
+    Corners depend on the row above, whose vertical walls are kept.
+    """
+
+    def __init__(self) -> None:
+        self.tops = glyph_table(
+            [
+                BOX_DRAWINGS[corner] + ("───" if wall else "   ")
+                for wall in (False, True)
+                for corner in range(16)
+            ]
+        )
+        self.sides = glyph_table(
+            ["│   " if walls & WEST else "    " for walls in range(16)]
+        )
+        self.verticals_above: npt.NDArray[np.bool_] | None = None
+
+    def render_row(self, walls: Walls) -> Iterator[str]:
+        """Lines of text for a row of the maze."""
+        verticals = np.append((walls & WEST) != 0, True)
+        yield self.corner_line(self.verticals_above, verticals, (walls & NORTH) != 0)
+        yield join_glyphs(self.sides, walls) + "│"
+        self.verticals_above = verticals
+
+    def render_bottom(self, walls: Walls) -> Iterator[str]:
+        """Lines of text closing the maze, below its last row."""
+        yield self.corner_line(self.verticals_above, None, (walls & SOUTH) != 0)
+
+    def corner_line(
+        self,
+        verticals_above: npt.NDArray[np.bool_] | None,
+        verticals_below: npt.NDArray[np.bool_] | None,
+        horizontals: npt.NDArray[np.bool_],
+    ) -> str:
+        """Line of corners and horizontal walls between two rows of cells."""
+        corners = np.zeros(len(horizontals) + 1, dtype=np.uint8)
+        if verticals_above is not None:
+            corners |= verticals_above * np.uint8(NORTH)
+        if verticals_below is not None:
+            corners |= verticals_below * np.uint8(SOUTH)
+        corners[:-1] |= horizontals * np.uint8(EAST)
+        corners[1:] |= horizontals * np.uint8(WEST)
+
+        indexes = corners[:-1] | (horizontals * np.uint8(16))
+        return join_glyphs(self.tops, indexes) + BOX_DRAWINGS[corners[-1]]
+
+
+class CompactRenderer(TextRenderer):
+    """Renders each cell as a single box drawing character of its passages."""
+
+    def __init__(self) -> None:
+        self.cells = glyph_table([BOX_DRAWINGS[~walls & 15] for walls in range(16)])
+
+    def render_row(self, walls: Walls) -> Iterator[str]:
+        """Lines of text for a row of the maze."""
+        yield join_glyphs(self.cells, walls)
+
+
+def create_renderer(style: TextStyle) -> TextRenderer:
+    """Create a renderer for the given text style."""
+    match style:
+        case TextStyle.ASCII:
+            return AsciiRenderer()
+        case TextStyle.UNICODE:
+            return UnicodeRenderer()
+        case TextStyle.COMPACT:
+            return CompactRenderer()
+        case TextStyle.BLOCK:
+            return BlockRenderer()
@@ -0,0 +1,128 @@
+"""Tests for the maze builder contract."""
+import random
+from typing import Generator
+
+import numpy as np
+import pytest
+
+from mazy.builders.base_builder import MazeBuilder, random_streams
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeState
+
+
+class StepBuilder(MazeBuilder):
+    """Builder relying on the default building path."""
+
+    @property
+    def name(self) -> str:
+        """Builder name."""
+        return "step"
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Visit every cell, one step each."""
+        for cell in self.maze.traverse_by_cell():
+            self.visit(cell.row, cell.col)
+            yield self.maze
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+
+def test_base_builder_build_drains_generator_by_default() -> None:
+    """Should fall back to the building generator when not overridden."""
+    builder = StepBuilder(rows=2, cols=3)
+    maze = builder.build()
+
+    assert maze.state == MazeState.READY
+    assert all(cell.visited for cell in maze.traverse_by_cell())
+
+
+class LateBuilder(StepBuilder):
+    """Builder touching cells after its last step."""
+
+    def build_maze(self) -> Generator[MazeGrid, None, MazeGrid]:
+        """Visit every cell after a single step."""
+        yield self.maze
+
+        for cell in self.maze.traverse_by_cell():
+            self.visit(cell.row, cell.col)
+
+        self.maze.state = MazeState.READY
+        return self.maze
+
+
+def test_base_builder_build_steps_reports_touched_cells() -> None:
+    """Should produce the cells touched by each step, returning the maze."""
+    builder = StepBuilder(rows=2, cols=2)
+    steps = builder.build_steps()
+
+    assert list(next(steps) for _ in range(4)) == [
+        [(0, 0)],
+        [(0, 1)],
+        [(1, 0)],
+        [(1, 1)],
+    ]
+    with pytest.raises(StopIteration) as stop:
+        next(steps)
+    assert stop.value.value is builder.maze
+    assert builder.touched is None
+
+
+def test_base_builder_build_steps_reports_cells_touched_at_the_end() -> None:
+    """Cells touched after the last step should come in a step of their own."""
+    builder = LateBuilder(rows=1, cols=2)
+
+    assert list(builder.build_steps()) == [[], [(0, 0), (0, 1)]]
+
+
+def test_base_builder_touch_is_ignored_without_steps() -> None:
+    """Cells should not be tracked when building at once."""
+    builder = StepBuilder(rows=2, cols=3)
+    builder.build()
+
+    assert builder.touched is None
+
+
+def test_random_streams_from_seed_are_repeatable() -> None:
+    """The same seed, or seed sequence, should make the same generators."""
+    python_random, numpy_rng = random_streams(42)
+    sequence_random, sequence_rng = random_streams(np.random.SeedSequence(42))
+
+    assert python_random.random() == sequence_random.random()
+    assert numpy_rng.random() == sequence_rng.random()
+    assert random_streams(42)[0].random() != random_streams(43)[0].random()
+
+
+def test_random_streams_rejects_negative_seed() -> None:
+    """Seeds must be non-negative numbers."""
+    with pytest.raises(ValueError, match="Seed must be a non-negative number"):
+        random_streams(-1)
+
+
+def test_random_streams_use_given_generators() -> None:
+    """Given generators should be used as they are."""
+    python_random = random.Random(42)
+    assert random_streams(python_random)[0] is python_random
+
+    numpy_rng = np.random.default_rng(42)
+    assert random_streams(numpy_rng)[1] is numpy_rng
+
+
+def test_random_streams_without_seed_follow_the_random_module() -> None:
+    """Seeding the random module should still make repeatable generators."""
+    random.seed(42)
+    python_random, numpy_rng = random_streams()
+    random.seed(42)
+    other_random, other_rng = random_streams()
+
+    assert python_random.random() == other_random.random()
+    assert numpy_rng.random() == other_rng.random()
+
+
+def test_base_builder_seed() -> None:
+    """Builders should draw their random choices from their own generators."""
+    builder = StepBuilder(rows=2, cols=3, seed=7)
+    python_random, numpy_rng = random_streams(7)
+
+    assert builder.random.random() == python_random.random()
+    assert builder.rng.random() == numpy_rng.random()
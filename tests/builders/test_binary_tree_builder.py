@@ -1,7 +1,10 @@
 """Tests for the binary tree builder."""
+import random
+
 from mazy.builders.binary_tree_builder import BinaryTreeBuilder
 from mazy.models.builder import BuilderAlgorithm
-from mazy.models.maze import MazeState
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend, MazeState
 from mazy.utils import consume_generator
 
 
@@ -40,3 +43,36 @@ def test_binary_tree_builder_build_maze_manages_maze_states() -> None:
 
     assert next(maze_generator).state == MazeState.BUILDING
     assert consume_generator(maze_generator).state == MazeState.READY
+
+
+def test_binary_tree_builder_build_maze_compact_backend() -> None:
+    """Should build the maze on the compact backend as well."""
+    builder = BinaryTreeBuilder(rows=5, cols=8, backend=MazeBackend.COMPACT)
+    maze = consume_generator(builder.build_maze())
+
+    assert isinstance(maze, CompactMaze)
+    for cell in maze.traverse_by_cell():
+        assert 0 < cell.passage_count() <= 3
+        assert cell.visited is True
+
+
+def test_binary_tree_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    builder = BinaryTreeBuilder(rows=5, cols=8)
+    maze = builder.build()
+
+    assert maze is builder.maze
+    assert maze.state == MazeState.READY
+    for cell in maze.traverse_by_cell():
+        assert 0 < cell.passage_count() <= 3
+        assert cell.visited is False
+
+
+def test_binary_tree_builder_build_matches_build_maze() -> None:
+    """Both building paths must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = BinaryTreeBuilder(rows=5, cols=8).build()
+    random.seed(42)
+    generated_maze = consume_generator(BinaryTreeBuilder(rows=5, cols=8).build_maze())
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
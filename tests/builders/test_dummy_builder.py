@@ -1,7 +1,8 @@
 """Dummy builder."""
 from mazy.builders.dummy_builder import DummyBuilder
 from mazy.models.builder import BuilderAlgorithm
-from mazy.models.maze import MazeState
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend, MazeState
 from mazy.utils import consume_generator
 
 
@@ -40,3 +41,26 @@ def test_dummy_builder_build_maze_manages_maze_states() -> None:
 
     assert next(maze_generator).state == MazeState.BUILDING
     assert consume_generator(maze_generator).state == MazeState.READY
+
+
+def test_dummy_builder_build_maze_compact_backend() -> None:
+    """Should build the maze on the compact backend as well."""
+    builder = DummyBuilder(rows=5, cols=8, backend=MazeBackend.COMPACT)
+    maze = consume_generator(builder.build_maze())
+
+    assert isinstance(maze, CompactMaze)
+    for cell in maze.traverse_by_cell():
+        assert cell.passage_count() == 0
+        assert cell.visited is True
+
+
+def test_dummy_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    builder = DummyBuilder(rows=5, cols=8)
+    maze = builder.build()
+
+    assert maze is builder.maze
+    assert maze.state == MazeState.READY
+    for cell in maze.traverse_by_cell():
+        assert cell.passage_count() == 0
+        assert cell.visited is False
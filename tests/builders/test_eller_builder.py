@@ -0,0 +1,68 @@
+"""Tests for the Eller builder."""
+import random
+
+import pytest
+
+from mazy.builders.eller import EllerBuilder
+from mazy.models.builder import BuilderAlgorithm
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import consume_generator
+
+
+def test_eller_builder_default_values() -> None:
+    """Ensure default values are consistent."""
+    builder = EllerBuilder(rows=3, cols=5)
+
+    assert builder.name == BuilderAlgorithm.ELLER.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_eller_builder_build_maze(backend: MazeBackend, rows: int, cols: int) -> None:
+    """Should build a perfect maze on every backend."""
+    builder = EllerBuilder(rows, cols, backend)
+    maze = consume_generator(builder.build_maze())
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is True
+
+
+def test_eller_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    maze = EllerBuilder(rows=5, cols=8).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is False
+
+
+def test_eller_builder_build_rows_streams_without_maze() -> None:
+    """Streamed rows should form a perfect maze, never allocating the maze."""
+    rows, cols = 500, 9
+    builder = EllerBuilder(rows, cols)
+    maze = CompactMaze(rows, cols)
+
+    streamed_rows = 0
+    for row, row_mask in enumerate(builder.build_rows()):
+        assert len(row_mask) == cols
+        maze.passages[row * cols : (row + 1) * cols] = row_mask
+        streamed_rows += 1
+
+    assert streamed_rows == rows
+    assert "maze" not in builder.__dict__
+    assert is_perfect(maze)
+
+
+def test_eller_builder_build_matches_build_rows() -> None:
+    """Building and streaming must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = EllerBuilder(rows=6, cols=7).build()
+    random.seed(42)
+    streamed_mask = b"".join(EllerBuilder(rows=6, cols=7).build_rows())
+
+    assert built_maze.passage_mask() == streamed_mask
@@ -0,0 +1,174 @@
+"""Tests for the Growing Tree builder."""
+import random
+
+import pytest
+
+from mazy.builders.growing_tree import REMOVED, ActiveCells, GrowingTreeBuilder
+from mazy.models.builder import BuilderAlgorithm, CellSelection
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import consume_generator
+
+
+def test_growing_tree_builder_default_values() -> None:
+    """Ensure default values are consistent."""
+    builder = GrowingTreeBuilder(rows=3, cols=5)
+
+    assert builder.name == BuilderAlgorithm.GROWING_TREE.value
+    assert builder.selection == CellSelection.NEWEST
+    assert builder.mix == 0.5
+
+
+@pytest.mark.parametrize("mix", [-0.1, 1.5])
+def test_growing_tree_builder_rejects_invalid_mix(mix: float) -> None:
+    """The mix must be a probability."""
+    with pytest.raises(
+        ValueError, match=f"Mix must be a ratio between 0 and 1, got {mix}."
+    ):
+        GrowingTreeBuilder(rows=3, cols=5, mix=mix)
+
+
+@pytest.mark.parametrize("selection", [selection for selection in CellSelection])
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_growing_tree_builder_build_maze(
+    selection: CellSelection, backend: MazeBackend, rows: int, cols: int
+) -> None:
+    """Should build a perfect maze on every backend, with every policy."""
+    builder = GrowingTreeBuilder(rows, cols, backend, selection)
+    maze = consume_generator(builder.build_maze())
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is True
+
+
+@pytest.mark.parametrize("selection", [selection for selection in CellSelection])
+def test_growing_tree_builder_build(selection: CellSelection) -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    maze = GrowingTreeBuilder(rows=5, cols=8, selection=selection).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is False
+
+
+@pytest.mark.parametrize("selection", [selection for selection in CellSelection])
+def test_growing_tree_builder_build_matches_build_maze(
+    selection: CellSelection,
+) -> None:
+    """Both paths must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = GrowingTreeBuilder(6, 7, selection=selection).build()
+    random.seed(42)
+    generated_maze = consume_generator(
+        GrowingTreeBuilder(6, 7, selection=selection).build_maze()
+    )
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
+
+
+@pytest.mark.parametrize(
+    ("selection", "mix", "expected_position"),
+    [
+        (CellSelection.NEWEST, 0.5, 3),
+        (CellSelection.OLDEST, 0.5, 0),
+        (CellSelection.MIXED, 1.0, 3),
+    ],
+)
+def test_growing_tree_builder_select(
+    selection: CellSelection, mix: float, expected_position: int
+) -> None:
+    """Deterministic policies should pick the expected position."""
+    builder = GrowingTreeBuilder(rows=3, cols=5, selection=selection, mix=mix)
+    active = ActiveCells()
+    for index in (4, 7, 1, 9):
+        active.append(index)
+
+    assert builder.select(active) == expected_position
+
+
+def test_active_cells_remove() -> None:
+    """Should remove the newest, the oldest and any other cell."""
+    active = ActiveCells()
+    for index in range(6):
+        active.append(index)
+
+    active.remove(5)
+    active.remove(0)
+    active.remove(1)
+
+    assert len(active) == 3
+    assert list(active) == [1, 3, 4]
+    assert active[0] == 1
+    assert active[active.slots - 1] == 4
+
+
+def test_active_cells_remove_keeps_newest_on_the_tail() -> None:
+    """Removing the tail should skip the cells removed before it."""
+    active = ActiveCells()
+    for index in range(8):
+        active.append(index)
+
+    active.remove(5)
+    active.remove(6)
+    active.remove(7)
+
+    assert active[active.slots - 1] == 4
+    assert list(active) == [0, 1, 2, 3, 4]
+
+
+def test_active_cells_compacts_removed_cells() -> None:
+    """Removing cells from the middle should release their slots."""
+    active = ActiveCells()
+    for index in range(10):
+        active.append(index)
+
+    for position in range(1, 7):
+        active.remove(position)
+
+    assert active.slots < 10
+    assert list(active) == [0, 7, 8, 9]
+
+
+def test_active_cells_compacts_removed_prefix() -> None:
+    """Removing the oldest cells should release the space they took."""
+    active = ActiveCells()
+    for index in range(10):
+        active.append(index)
+
+    for _ in range(6):
+        active.remove(0)
+
+    assert len(active) == 4
+    assert len(active.cells) < 10
+    assert list(active) == [6, 7, 8, 9]
+
+
+def test_growing_tree_builder_mixed_selects_the_newest_cell() -> None:
+    """The newest cell should stay on the tail after removing any other."""
+    builder = GrowingTreeBuilder(rows=3, cols=5, selection=CellSelection.MIXED, mix=1)
+    active = ActiveCells()
+    for index in (4, 7, 1, 9, 12):
+        active.append(index)
+
+    active.remove(1)
+    active.remove(2)
+
+    assert active[builder.select(active)] == 12
+
+
+def test_growing_tree_builder_random_skips_removed_cells() -> None:
+    """Random picks should only land on active cells."""
+    builder = GrowingTreeBuilder(rows=3, cols=5, selection=CellSelection.RANDOM)
+    active = ActiveCells()
+    for index in range(8):
+        active.append(index)
+    for position in (2, 4):
+        active.remove(position)
+
+    picks = {active[builder.select(active)] for _ in range(200)}
+    assert picks == {0, 1, 3, 5, 6, 7}
+    assert REMOVED not in picks
@@ -0,0 +1,62 @@
+"""Tests for the Kruskal builder."""
+import pytest
+
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.models.builder import BuilderAlgorithm
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import consume_generator
+
+
+def test_kruskal_builder_default_values() -> None:
+    """Ensure default values are consistent."""
+    builder = KruskalBuilder(rows=3, cols=5)
+
+    assert builder.name == BuilderAlgorithm.KRUSKAL.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_kruskal_builder_build_maze(backend: MazeBackend, rows: int, cols: int) -> None:
+    """Should build a perfect maze on every backend."""
+    builder = KruskalBuilder(rows, cols, backend)
+    maze = consume_generator(builder.build_maze())
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+
+
+def test_kruskal_builder_build_maze_set_visited_flag() -> None:
+    """Should set the visited flag for each visited cell."""
+    builder = KruskalBuilder(rows=3, cols=5)
+    maze = consume_generator(builder.build_maze())
+
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is True
+
+
+def test_kruskal_builder_build_maze_steps() -> None:
+    """Should yield the initial state and then once per passage."""
+    maze_generator = KruskalBuilder(rows=3, cols=5).build_maze()
+
+    steps = sum(1 for _ in maze_generator)
+
+    assert steps == 15
+
+
+def test_kruskal_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    maze = KruskalBuilder(rows=5, cols=8).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is False
+
+
+def test_kruskal_builder_build_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Walls must be processed across all the shuffled chunks."""
+    monkeypatch.setattr("mazy.builders.kruskal.CHUNK_SIZE", 7)
+    maze = KruskalBuilder(rows=6, cols=9).build()
+
+    assert is_perfect(maze)
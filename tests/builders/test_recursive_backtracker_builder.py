@@ -0,0 +1,70 @@
+"""Tests for the recursive backtracker builder."""
+import random
+import sys
+
+import pytest
+
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.models.builder import BuilderAlgorithm
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import consume_generator
+
+
+def test_recursive_backtracker_builder_default_values() -> None:
+    """Ensure default values are consistent."""
+    builder = RecursiveBacktrackerBuilder(rows=3, cols=5)
+
+    assert builder.name == BuilderAlgorithm.RECURSIVE_BACKTRACKER.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_recursive_backtracker_builder_build_maze(
+    backend: MazeBackend, rows: int, cols: int
+) -> None:
+    """Should build a perfect maze on every backend."""
+    builder = RecursiveBacktrackerBuilder(rows, cols, backend)
+    maze = consume_generator(builder.build_maze())
+
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is True
+
+
+def test_recursive_backtracker_builder_build_maze_manages_maze_states() -> None:
+    """Ensure the builder set the correct state for each maze building step."""
+    maze_generator = RecursiveBacktrackerBuilder(rows=3, cols=5).build_maze()
+
+    assert next(maze_generator).state == MazeState.BUILDING
+    assert consume_generator(maze_generator).state == MazeState.READY
+
+
+def test_recursive_backtracker_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    maze = RecursiveBacktrackerBuilder(rows=5, cols=8).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is False
+
+
+def test_recursive_backtracker_builder_build_matches_build_maze() -> None:
+    """Both building paths must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = RecursiveBacktrackerBuilder(rows=5, cols=8).build()
+    random.seed(42)
+    generated_maze = consume_generator(
+        RecursiveBacktrackerBuilder(rows=5, cols=8).build_maze()
+    )
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
+
+
+def test_recursive_backtracker_builder_corridor_deeper_than_recursion_limit() -> None:
+    """A single corridor longer than the recursion limit must not overflow."""
+    cols = sys.getrecursionlimit() * 2
+    maze = RecursiveBacktrackerBuilder(1, cols, MazeBackend.COMPACT).build()
+
+    assert is_perfect(maze)
@@ -1,8 +1,10 @@
 """Tests for the binary tree builder."""
+import random
 
 from mazy.builders.sidewinder import SidewinderBuilder
 from mazy.models.builder import BuilderAlgorithm
-from mazy.models.maze import MazeState
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend, MazeState
 from mazy.utils import consume_generator
 
 
@@ -41,3 +43,36 @@ def test_sidewinder_builder_build_maze_manages_maze_states() -> None:
 
     assert next(maze_generator).state == MazeState.BUILDING
     assert consume_generator(maze_generator).state == MazeState.READY
+
+
+def test_sidewinder_builder_build_maze_compact_backend() -> None:
+    """Should build the maze on the compact backend as well."""
+    builder = SidewinderBuilder(rows=5, cols=8, backend=MazeBackend.COMPACT)
+    maze = consume_generator(builder.build_maze())
+
+    assert isinstance(maze, CompactMaze)
+    for cell in maze.traverse_by_cell():
+        assert 0 < cell.passage_count() <= 4
+        assert cell.visited is True
+
+
+def test_sidewinder_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    builder = SidewinderBuilder(rows=5, cols=8)
+    maze = builder.build()
+
+    assert maze is builder.maze
+    assert maze.state == MazeState.READY
+    for cell in maze.traverse_by_cell():
+        assert 0 < cell.passage_count() <= 4
+        assert cell.visited is False
+
+
+def test_sidewinder_builder_build_matches_build_maze() -> None:
+    """Both building paths must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = SidewinderBuilder(rows=5, cols=8).build()
+    random.seed(42)
+    generated_maze = consume_generator(SidewinderBuilder(rows=5, cols=8).build_maze())
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
@@ -0,0 +1,95 @@
+"""Tests for the vectorized (NumPy) builders."""
+from typing import Type
+
+import pytest
+
+from mazy.builders.vectorized_builder import (
+    VectorizedBinaryTreeBuilder,
+    VectorizedBuilder,
+    VectorizedSidewinderBuilder,
+)
+from mazy.models.builder import BuilderAlgorithm
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import consume_generator
+
+VECTORIZED_BUILDERS = [VectorizedBinaryTreeBuilder, VectorizedSidewinderBuilder]
+
+
+@pytest.mark.parametrize(
+    ("builder_class", "algorithm"),
+    [
+        (VectorizedBinaryTreeBuilder, BuilderAlgorithm.BINARY_TREE_NUMPY),
+        (VectorizedSidewinderBuilder, BuilderAlgorithm.SIDEWINDER_NUMPY),
+    ],
+)
+def test_vectorized_builder_default_values(
+    builder_class: Type[VectorizedBuilder], algorithm: BuilderAlgorithm
+) -> None:
+    """Ensure default values are consistent."""
+    builder = builder_class(rows=3, cols=5)
+
+    assert builder.name == algorithm.value
+    assert isinstance(builder.maze, CompactMaze)
+
+
+@pytest.mark.parametrize("builder_class", VECTORIZED_BUILDERS)
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_vectorized_builder_build(
+    builder_class: Type[VectorizedBuilder],
+    backend: MazeBackend,
+    rows: int,
+    cols: int,
+) -> None:
+    """Should build a perfect maze on every backend."""
+    maze = builder_class(rows, cols, backend).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+
+
+@pytest.mark.parametrize("builder_class", VECTORIZED_BUILDERS)
+def test_vectorized_builder_build_in_blocks(
+    builder_class: Type[VectorizedBuilder], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Passages must be stitched across the blocks of rows."""
+    monkeypatch.setattr("mazy.builders.vectorized_builder.CHUNK_SIZE", 20)
+    maze = builder_class(rows=12, cols=7).build()
+
+    assert is_perfect(maze)
+
+
+@pytest.mark.parametrize("builder_class", VECTORIZED_BUILDERS)
+def test_vectorized_builder_build_maze_one_row_per_step(
+    builder_class: Type[VectorizedBuilder],
+) -> None:
+    """Should yield once per row, marking the row as visited."""
+    maze_generator = builder_class(rows=4, cols=5).build_maze()
+
+    maze = next(maze_generator)
+    assert maze.state == MazeState.BUILDING
+    assert [cell.visited for cell in maze.traverse_by_cell()].count(True) == 5
+
+    maze = consume_generator(maze_generator)
+    assert maze.state == MazeState.READY
+    assert all(cell.visited for cell in maze.traverse_by_cell())
+    assert is_perfect(maze)
+
+
+@pytest.mark.parametrize("builder_class", VECTORIZED_BUILDERS)
+@pytest.mark.parametrize("seed", range(20))
+def test_vectorized_builder_build_matches_build_maze(
+    builder_class: Type[VectorizedBuilder],
+    seed: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The same seed must carve the same passages, whatever the blocks."""
+    generated_maze = consume_generator(builder_class(9, 7, seed=seed).build_maze())
+    built_maze = builder_class(9, 7, seed=seed).build()
+    monkeypatch.setattr("mazy.builders.vectorized_builder.CHUNK_SIZE", 20)
+    blocks_maze = builder_class(9, 7, seed=seed).build()
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
+    assert blocks_maze.passage_mask() == generated_maze.passage_mask()
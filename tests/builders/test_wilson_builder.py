@@ -0,0 +1,83 @@
+"""Tests for the Wilson builder."""
+import random
+
+import pytest
+
+from mazy.builders.wilson import WilsonBuilder
+from mazy.models.builder import BuilderAlgorithm
+from mazy.models.grid import is_perfect
+from mazy.models.maze import MazeBackend, MazeState
+from mazy.utils import Bitmap, consume_generator
+
+
+def test_wilson_builder_default_values() -> None:
+    """Ensure default values are consistent."""
+    builder = WilsonBuilder(rows=3, cols=5)
+
+    assert builder.name == BuilderAlgorithm.WILSON.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (1, 7), (7, 1), (9, 13)])
+def test_wilson_builder_build_maze(backend: MazeBackend, rows: int, cols: int) -> None:
+    """Should build a perfect maze on every backend."""
+    builder = WilsonBuilder(rows, cols, backend)
+    maze = consume_generator(builder.build_maze())
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is True
+
+
+def test_wilson_builder_build() -> None:
+    """Should build the final maze at once, skipping the visited flags."""
+    maze = WilsonBuilder(rows=5, cols=8).build()
+
+    assert maze.state == MazeState.READY
+    assert is_perfect(maze)
+    for cell in maze.traverse_by_cell():
+        assert cell.visited is False
+
+
+def test_wilson_builder_build_matches_build_maze() -> None:
+    """Both paths must carve the same passages for the same seed."""
+    random.seed(42)
+    built_maze = WilsonBuilder(rows=6, cols=7).build()
+    random.seed(42)
+    generated_maze = consume_generator(WilsonBuilder(rows=6, cols=7).build_maze())
+
+    assert built_maze.passage_mask() == generated_maze.passage_mask()
+
+
+def test_wilson_builder_grow_branch_erases_loops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Revisited cells keep only the last direction taken from them."""
+    builder = WilsonBuilder(rows=1, cols=4)
+    in_tree = Bitmap(4)
+    in_tree[3] = True
+    # Walk 0 -> 1 -> 0 -> 1 -> 2 -> 3, a loop between the first two cells.
+    steps = iter([1, 3, 1, 1, 1])
+    monkeypatch.setattr(builder.random, "getrandbits", lambda _: next(steps))
+
+    branch = builder.grow_branch(0, in_tree, bytearray(4))
+
+    assert branch == [0, 1, 2]
+    assert is_perfect(builder.maze)
+
+
+def test_wilson_builder_is_uniform() -> None:
+    """All the spanning trees of a 2x2 grid should be equally likely."""
+    random.seed(42)
+    counts: dict[bytes, int] = {}
+    for _ in range(4000):
+        mask = bytes(
+            WilsonBuilder(rows=2, cols=2, backend=MazeBackend.COMPACT)
+            .build()
+            .passage_mask()
+        )
+        counts[mask] = counts.get(mask, 0) + 1
+
+    assert len(counts) == 4
+    assert all(800 < count < 1200 for count in counts.values())
@@ -4,7 +4,7 @@ from typing import Optional
 import pytest
 
 from mazy.exceptions import DuplicatedNeighbor, MissingLink, NeighborhoodError
-from mazy.models.cell import Cell, Direction, Role, is_neighborhood_valid
+from mazy.models.cell import Cell, Direction, Neighbor, Role, is_neighborhood_valid
 
 
 def test_cell_default_values() -> None:
@@ -280,3 +280,81 @@ def test_cell_passage_count() -> None:
     cell.link_to(cell_on_south, passage=True, direction=Direction.SOUTH)
 
     assert cell.passage_count() == 2
+
+
+@pytest.mark.parametrize(
+    ("other_cell", "expected_direction"),
+    [
+        (Cell(row=0, col=1), Direction.NORTH),
+        (Cell(row=2, col=1), Direction.SOUTH),
+        (Cell(row=1, col=2), Direction.EAST),
+        (Cell(row=1, col=0), Direction.WEST),
+        (Cell(row=1, col=1), None),
+        (Cell(row=0, col=0), None),
+        (Cell(row=1, col=3), None),
+    ],
+)
+def test_cell_direction_to(
+    other_cell: Cell, expected_direction: Optional[Direction]
+) -> None:
+    """Should find the direction of adjacent cells only."""
+    assert Cell(row=1, col=1).direction_to(other_cell) == expected_direction
+
+
+def test_cell_lookups_compare_neighbors_by_identity() -> None:
+    """A cell on the same position but from elsewhere is not a neighbor."""
+    cell = Cell(row=0, col=0)
+    neighbor = Cell(row=0, col=1)
+    cell.link_to(neighbor, passage=True, direction=Direction.EAST)
+
+    lookalike = Cell(row=0, col=1)
+
+    assert cell.is_linked_to(neighbor) is True
+    assert cell.has_passage_to_cell(neighbor) is True
+    assert cell.is_linked_to(lookalike) is False
+    assert cell.has_passage_to_cell(lookalike) is False
+
+
+def test_cell_is_slotted() -> None:
+    """Cells and neighbors must not carry a per-instance dict."""
+    cell = Cell(row=0, col=0)
+    cell.link_to(Cell(row=0, col=1), passage=False, direction=Direction.EAST)
+
+    assert not hasattr(cell, "__dict__")
+    assert not hasattr(cell.neighbors[Direction.EAST], "__dict__")
+
+
+def test_cell_equality_and_hash_by_position() -> None:
+    """Cells should be compared and hashed by their position only."""
+    cell = Cell(row=0, col=0)
+    cell.link_to(Cell(row=0, col=1), passage=True, direction=Direction.EAST)
+    same_position = Cell(row=0, col=0, role=Role.ENTRANCE, visited=True)
+
+    assert cell == same_position
+    assert hash(cell) == hash(same_position)
+    assert cell != Cell(row=1, col=0)
+    assert len({cell, same_position, Cell(row=1, col=0)}) == 2
+    assert cell != (0, 0)
+
+
+def test_neighbor_equality_and_hash() -> None:
+    """Neighbors should be compared by cell position and passage."""
+    neighbor = Neighbor(cell=Cell(row=0, col=1), passage=True)
+
+    assert neighbor == Neighbor(cell=Cell(row=0, col=1), passage=True)
+    assert neighbor != Neighbor(cell=Cell(row=0, col=1), passage=False)
+    assert neighbor != Neighbor(cell=Cell(row=1, col=1), passage=True)
+    assert hash(neighbor) == hash(Neighbor(cell=Cell(row=0, col=1), passage=False))
+
+
+def test_cell_equality_doesnt_recurse_into_neighbors() -> None:
+    """Comparing linked cells must not walk the neighborhood."""
+    maze_cells = [[Cell(row, col) for col in range(50)] for row in range(50)]
+    for row in range(50):
+        for col in range(1, 50):
+            maze_cells[row][col].link_to(
+                maze_cells[row][col - 1], passage=True, direction=Direction.WEST
+            )
+
+    assert maze_cells[10][10] == Cell(row=10, col=10)
+    assert maze_cells[10][10] != maze_cells[10][11]
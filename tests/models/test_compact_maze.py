@@ -0,0 +1,133 @@
+"""Tests for the compact maze model."""
+import sys
+
+import pytest
+
+from mazy.exceptions import MissingLink
+from mazy.models.cell import Direction, Role
+from mazy.models.compact_maze import CompactCell, CompactMaze
+from mazy.models.maze import Maze, MazeState
+
+
+def test_compact_maze_init() -> None:
+    """Must generate a maze with a proper size, state and buffers."""
+    maze = CompactMaze(rows=2, cols=3)
+    assert maze.state == MazeState.BUILDING
+    assert maze.rows == 2
+    assert maze.cols == 3
+    assert len(maze.passages) == 6
+    assert len(maze.roles) == 6
+    assert len(maze.visited) == 6
+
+
+def test_compact_maze_cell_get_accessor() -> None:
+    """Ensure individual cells of the maze can be accessed by row and col."""
+    maze = CompactMaze(rows=2, cols=3)
+    cell = maze[0, 1]
+    assert isinstance(cell, CompactCell)
+    assert cell.row == 0
+    assert cell.col == 1
+
+
+@pytest.mark.parametrize(("row", "col"), [(-1, 0), (0, -1), (2, 0), (0, 3)])
+def test_compact_maze_cell_get_accessor_out_of_bounds(row: int, col: int) -> None:
+    """Must not wrap around negative or oversized indexes."""
+    maze = CompactMaze(rows=2, cols=3)
+    with pytest.raises(IndexError):
+        maze[row, col]
+
+
+def test_compact_maze_registry_roles() -> None:
+    """Must create exactly one entrance at the origin and one exit at the end."""
+    maze = CompactMaze(rows=3, cols=3)
+
+    assert maze[0, 0].role == Role.ENTRANCE
+    assert maze[2, 2].role == Role.EXIT
+    assert [cell.role for cell in maze.traverse_by_cell()].count(Role.NONE) == 7
+
+
+def test_compact_maze_cell_links_follow_frontiers() -> None:
+    """Frontier cells should not have links beyond the maze limits."""
+    maze = CompactMaze(rows=3, cols=3)
+
+    assert maze[0, 0].has_link_to_direction(Direction.EAST) is True
+    assert maze[0, 0].has_link_to_direction(Direction.SOUTH) is True
+    assert maze[0, 0].has_link_to_direction(Direction.NORTH) is False
+    assert maze[0, 0].has_link_to_direction(Direction.WEST) is False
+    assert maze[2, 2].has_link_to_direction(Direction.EAST) is False
+    assert maze[2, 2].has_link_to_direction(Direction.SOUTH) is False
+
+
+def test_compact_maze_cell_carve_passage_to_direction() -> None:
+    """Should carve the passage on both cells."""
+    maze = CompactMaze(rows=2, cols=2)
+
+    maze[0, 0].carve_passage_to_direction(Direction.SOUTH)
+
+    assert maze[0, 0].has_passage_to_direction(Direction.SOUTH) is True
+    assert maze[1, 0].has_passage_to_direction(Direction.NORTH) is True
+    assert maze[0, 0].passage_count() == 1
+    assert maze[1, 0].passage_count() == 1
+    assert maze[0, 1].passage_count() == 0
+
+
+def test_compact_maze_cell_carve_raises_when_link_doesnt_exist() -> None:
+    """Can not carve a passage beyond the maze limits."""
+    maze = CompactMaze(rows=2, cols=2)
+
+    with pytest.raises(
+        MissingLink,
+        match=r"There is no link from Cell\(row: 0, col: 1\) to the east direction.",
+    ):
+        maze[0, 1].carve_passage_to_direction(Direction.EAST)
+
+
+def test_compact_maze_cell_visited_flag() -> None:
+    """Should store the visited flag in the maze bitmap."""
+    maze = CompactMaze(rows=2, cols=5)
+    maze[1, 3].visited = True
+
+    assert maze[1, 3].visited is True
+    assert [cell.visited for cell in maze.traverse_by_cell()].count(True) == 1
+
+
+def test_compact_maze_passage_mask_matches_objects_maze() -> None:
+    """Both backends must describe the same passages with the same bitmask."""
+    compact_maze = CompactMaze(rows=3, cols=4)
+    objects_maze = Maze(rows=3, cols=4)
+
+    for maze in (compact_maze, objects_maze):
+        maze[0, 0].carve_passage_to_direction(Direction.EAST)
+        maze[1, 2].carve_passage_to_direction(Direction.NORTH)
+        maze[2, 3].carve_passage_to_direction(Direction.WEST)
+
+    assert compact_maze.passage_mask() == objects_maze.passage_mask()
+
+
+def test_compact_maze_memory_footprint() -> None:
+    """Must be at least one order of magnitude lighter than the objects maze."""
+    compact_maze = CompactMaze(rows=20, cols=20)
+    objects_maze = Maze(rows=20, cols=20)
+
+    compact_size = sum(
+        sys.getsizeof(buffer) for buffer in (compact_maze.passages, compact_maze.roles)
+    ) + sys.getsizeof(compact_maze.visited.bits)
+
+    objects_size = 0
+    for cell in objects_maze.traverse_by_cell():
+        objects_size += sys.getsizeof(cell) + sys.getsizeof(cell.neighbors)
+        objects_size += sum(
+            sys.getsizeof(neighbor) for neighbor in cell.neighbors.values()
+        )
+
+    assert objects_size > 10 * compact_size
+
+
+def test_compact_maze_cell_equality_and_hash() -> None:
+    """Views should be equal when pointing to the same cell of the same maze."""
+    maze = CompactMaze(rows=2, cols=2)
+
+    assert maze[0, 1] == maze[0, 1]
+    assert maze[0, 1] != maze[1, 0]
+    assert maze[0, 1] != CompactMaze(rows=2, cols=2)[0, 1]
+    assert len({maze[0, 1], maze[0, 1], maze[1, 1]}) == 2
@@ -0,0 +1,96 @@
+"""Tests for the maze grid contracts."""
+import pytest
+
+from mazy.exceptions import MissingLink
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import create_maze, fingerprint, is_perfect, mask_fingerprint
+from mazy.models.maze import Maze, MazeBackend
+
+
+@pytest.mark.parametrize(
+    ("backend", "expected_type"),
+    [
+        (MazeBackend.OBJECTS, Maze),
+        (MazeBackend.LAZY, Maze),
+        (MazeBackend.COMPACT, CompactMaze),
+    ],
+)
+def test_grid_create_maze(backend: MazeBackend, expected_type: type) -> None:
+    """Should create an empty maze using the requested backend."""
+    maze = create_maze(rows=2, cols=3, backend=backend)
+
+    assert isinstance(maze, expected_type)
+    assert maze.rows == 2
+    assert maze.cols == 3
+
+
+def test_grid_create_maze_default_backend() -> None:
+    """Should keep the objects backend as default."""
+    assert isinstance(create_maze(rows=2, cols=3), Maze)
+
+
+def test_grid_is_perfect() -> None:
+    """Should accept only connected mazes without loops."""
+    maze = create_maze(rows=2, cols=2)
+    assert is_perfect(maze) is False
+
+    maze.carve_passage(0, 0, Direction.EAST)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    assert is_perfect(maze) is False  # Cell (1, 1) is unreachable
+
+    maze.carve_passage(1, 1, Direction.NORTH)
+    assert is_perfect(maze) is True
+
+    maze.carve_passage(1, 1, Direction.WEST)
+    assert is_perfect(maze) is False  # Loop around the 4 cells
+
+
+def test_grid_is_perfect_single_cell() -> None:
+    """A single cell is a perfect maze on its own."""
+    assert is_perfect(create_maze(rows=1, cols=1)) is True
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+def test_grid_carve_passage(backend: MazeBackend) -> None:
+    """Should carve a bidirectional passage from a given position."""
+    maze = create_maze(rows=2, cols=2, backend=backend)
+    maze.carve_passage(1, 1, Direction.NORTH)
+
+    assert maze[1, 1].has_passage_to_direction(Direction.NORTH) is True
+    assert maze[0, 1].has_passage_to_direction(Direction.SOUTH) is True
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+def test_grid_carve_passage_raises_beyond_frontiers(backend: MazeBackend) -> None:
+    """Can not carve a passage beyond the maze limits."""
+    maze = create_maze(rows=2, cols=2, backend=backend)
+
+    with pytest.raises(
+        MissingLink,
+        match=r"There is no link from Cell\(row: 1, col: 1\) to the south direction.",
+    ):
+        maze.carve_passage(1, 1, Direction.SOUTH)
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+def test_grid_fingerprint_ignores_backend(backend: MazeBackend) -> None:
+    """Mazes with the same layout share the fingerprint."""
+    maze = create_maze(2, 3, backend)
+    maze.carve_passage(0, 0, Direction.EAST)
+    compact_maze = CompactMaze(2, 3)
+    compact_maze.carve_passage(0, 0, Direction.EAST)
+
+    assert fingerprint(maze) == fingerprint(compact_maze)
+    assert len(fingerprint(maze)) == 32
+
+
+def test_grid_fingerprint_changes_with_layout() -> None:
+    """Passages and dimensions are part of the fingerprint."""
+    maze = CompactMaze(2, 2)
+    fingerprints = {fingerprint(maze), fingerprint(CompactMaze(1, 4))}
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    fingerprints.add(fingerprint(maze))
+
+    assert len(fingerprints) == 3
+    assert fingerprint(maze) == mask_fingerprint(bytes([4, 0, 1, 0]), 2)
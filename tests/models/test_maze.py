@@ -1,5 +1,5 @@
 """Tests for the maze model."""
-from mazy.models.cell import Cell, Direction, Role
+from mazy.models.cell import DIRECTION_MASKS, Cell, Direction, Role
 from mazy.models.maze import Maze, MazeState
 
 
@@ -83,3 +83,80 @@ def test_maze_traverse_maze_by_cell() -> None:
         assert isinstance(cell, Cell)
 
     assert iter_count == 6
+
+
+def test_maze_passage_mask() -> None:
+    """Should pack the passages of every cell in a flat bitmask."""
+    maze = Maze(2, 2)
+    maze[0, 0].carve_passage_to_direction(Direction.EAST)
+    maze[0, 1].carve_passage_to_direction(Direction.SOUTH)
+
+    assert maze.passage_mask() == bytearray(
+        [
+            DIRECTION_MASKS[Direction.EAST],
+            DIRECTION_MASKS[Direction.WEST] | DIRECTION_MASKS[Direction.SOUTH],
+            0,
+            DIRECTION_MASKS[Direction.NORTH],
+        ]
+    )
+
+
+def test_maze_lazy_registry_neighbors() -> None:
+    """A lazy maze must not registry neighbors upfront, only entrance and exit."""
+    maze = Maze(rows=3, cols=3, lazy=True)
+
+    assert maze[0, 0].role == Role.ENTRANCE
+    assert maze[2, 2].role == Role.EXIT
+
+    for cell in maze.traverse_by_cell():
+        assert len(cell.neighbors) == 0
+
+
+def test_maze_lazy_links_follow_frontiers() -> None:
+    """Lazy cells should resolve links from the grid coordinates."""
+    maze = Maze(rows=3, cols=3, lazy=True)
+
+    assert maze[0, 0].has_link_to_direction(Direction.EAST) is True
+    assert maze[0, 0].has_link_to_direction(Direction.SOUTH) is True
+    assert maze[0, 0].has_link_to_direction(Direction.NORTH) is False
+    assert maze[0, 0].has_link_to_direction(Direction.WEST) is False
+    assert maze[2, 2].has_link_to_direction(Direction.EAST) is False
+    assert maze[0, 0].is_linked_to(maze[0, 1]) is True
+    assert maze[0, 0].is_linked_to(maze[1, 1]) is False
+
+
+def test_maze_lazy_carve_materializes_neighbors() -> None:
+    """Carving a passage should store the neighbors on both cells."""
+    maze = Maze(rows=2, cols=2, lazy=True)
+    maze[0, 0].carve_passage_to_direction(Direction.SOUTH)
+
+    assert maze[0, 0].neighbors[Direction.SOUTH].cell is maze[1, 0]
+    assert maze[1, 0].neighbors[Direction.NORTH].cell is maze[0, 0]
+    assert maze[0, 0].has_passage_to_direction(Direction.SOUTH) is True
+    assert maze[1, 0].has_passage_to_direction(Direction.NORTH) is True
+    assert maze[0, 0].has_passage_to_direction(Direction.EAST) is False
+    assert maze[0, 0].has_passage_to_cell(maze[1, 0]) is True
+    assert len(maze[0, 1].neighbors) == 0
+
+
+def test_maze_lazy_passage_mask_matches_eager_maze() -> None:
+    """Lazy and eager mazes must describe the same passages."""
+    lazy_maze = Maze(rows=3, cols=4, lazy=True)
+    eager_maze = Maze(rows=3, cols=4)
+
+    for maze in (lazy_maze, eager_maze):
+        maze[0, 0].carve_passage_to_direction(Direction.EAST)
+        maze[1, 2].carve_passage_to_direction(Direction.NORTH)
+        maze[2, 3].carve_passage_to_direction(Direction.WEST)
+
+    assert lazy_maze.passage_mask() == eager_maze.passage_mask()
+
+
+def test_maze_neighbor_of() -> None:
+    """Should find the cell next to another one, if any."""
+    maze = Maze(rows=2, cols=2)
+
+    assert maze.neighbor_of(maze[0, 0], Direction.EAST) is maze[0, 1]
+    assert maze.neighbor_of(maze[0, 0], Direction.SOUTH) is maze[1, 0]
+    assert maze.neighbor_of(maze[0, 0], Direction.NORTH) is None
+    assert maze.neighbor_of(maze[1, 1], Direction.EAST) is None
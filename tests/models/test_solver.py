@@ -0,0 +1,16 @@
+"""Tests for the solver models."""
+from mazy.models.solver import Solution
+
+
+def test_solution_length() -> None:
+    """The length should count the steps, not the cells."""
+    solution = Solution(path=[0, 1, 4], distances=[0, 1, -1, -1, 2])
+
+    assert solution.length == 2
+
+
+def test_solution_length_without_path() -> None:
+    """An unreachable exit has a negative length."""
+    solution = Solution(path=[], distances=[0, -1])
+
+    assert solution.length == -1
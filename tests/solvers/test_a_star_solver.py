@@ -0,0 +1,97 @@
+"""Tests for the A* solver."""
+import random
+
+import pytest
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.builders.sidewinder import SidewinderBuilder
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend
+from mazy.models.solver import SolverAlgorithm
+from mazy.solvers.a_star_solver import AStarSolver
+from mazy.solvers.bfs_solver import BFSSolver
+
+
+def braided_maze(seed: int) -> CompactMaze:
+    """Recursive Backtracker maze with extra random passages, making loops."""
+    random.seed(seed)
+    maze = RecursiveBacktrackerBuilder(12, 15, MazeBackend.COMPACT).build()
+    assert isinstance(maze, CompactMaze)
+    for row in range(11):
+        for col in range(14):
+            if random.random() < 0.1:
+                maze.carve_passage(row, col, Direction.EAST)
+            if random.random() < 0.1:
+                maze.carve_passage(row, col, Direction.SOUTH)
+
+    return maze
+
+
+def test_a_star_solver_default_values() -> None:
+    """Ensure default values are consistent."""
+    assert AStarSolver().name == SolverAlgorithm.A_STAR.value
+
+
+@pytest.mark.parametrize(
+    "builder_class",
+    [BinaryTreeBuilder, SidewinderBuilder, KruskalBuilder, RecursiveBacktrackerBuilder],
+)
+def test_a_star_solver_solve(builder_class: type[MazeBuilder]) -> None:
+    """Should find the same path as the breadth-first search on perfect mazes."""
+    maze = builder_class(9, 13, MazeBackend.COMPACT).build()
+    solution = AStarSolver().solve(maze)
+
+    assert solution.path == BFSSolver().solve(maze).path
+    for index in solution.path:
+        assert solution.distances[index] == solution.path.index(index)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_a_star_solver_solve_shortest_path(seed: int) -> None:
+    """Should find a shortest path through mazes with loops."""
+    maze = braided_maze(seed)
+    solution = AStarSolver().solve(maze)
+    mask = maze.passage_mask()
+
+    assert solution.length == BFSSolver().solve(maze).length
+    assert solution.path[0] == 0
+    assert solution.path[-1] == 12 * 15 - 1
+    for index, next_index in zip(solution.path, solution.path[1:]):
+        assert mask[index] & {-15: 1, 1: 2, 15: 4, -1: 8}[next_index - index]
+
+
+def test_a_star_solver_solve_single_cell() -> None:
+    """The only cell of the maze is both the entrance and the exit."""
+    solution = AStarSolver().solve(CompactMaze(1, 1))
+
+    assert solution.path == [0]
+
+
+def test_a_star_solver_solve_unreachable_exit() -> None:
+    """Should give up without a path."""
+    maze = CompactMaze(2, 2)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    solution = AStarSolver().solve(maze)
+
+    assert solution.path == []
+
+
+def test_a_star_solver_solve_stats() -> None:
+    """The heuristic should lead straight to the exit of an open maze."""
+    maze = CompactMaze(8, 8)
+    for row in range(8):
+        for col in range(8):
+            if col < 7:
+                maze.carve_passage(row, col, Direction.EAST)
+            if row < 7:
+                maze.carve_passage(row, col, Direction.SOUTH)
+    solution = AStarSolver().solve(maze)
+
+    assert solution.length == 14
+    assert solution.stats.expanded == 15
+    assert solution.stats.peak_frontier > 0
+    assert solution.stats.elapsed > 0
@@ -0,0 +1,60 @@
+"""Tests for the maze solver helpers."""
+import pytest
+
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import create_maze
+from mazy.models.maze import MazeBackend
+from mazy.solvers.base_solver import find_ends, passage_steps, trace_path
+
+
+def test_passage_steps() -> None:
+    """Should map each passage bitmask to the offsets of its neighbors."""
+    steps = passage_steps(cols=5)
+
+    assert len(steps) == 16
+    assert steps[0] == ()
+    assert steps[1] == (-5,)
+    assert steps[2 | 8] == (1, -1)
+    assert steps[15] == (-5, 1, 5, -1)
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(
+    ("rows", "cols", "expected_ends"), [(1, 1, (0, 0)), (1, 2, (0, 1)), (3, 4, (0, 11))]
+)
+def test_find_ends(
+    backend: MazeBackend, rows: int, cols: int, expected_ends: tuple[int, int]
+) -> None:
+    """Should find the entrance and the exit on every backend."""
+    maze = create_maze(rows, cols, backend)
+
+    assert find_ends(maze) == expected_ends
+
+
+def test_find_ends_without_exit() -> None:
+    """A maze without an exit can't be solved."""
+    maze = CompactMaze(2, 2)
+    maze.roles[-1] = 0
+
+    with pytest.raises(ValueError, match="The maze must have an entrance and an exit."):
+        find_ends(maze)
+
+
+def test_trace_path() -> None:
+    """Should follow decreasing distances back to the start."""
+    maze = CompactMaze(2, 2)
+    maze.carve_passage(0, 0, Direction.EAST)
+    maze.carve_passage(0, 1, Direction.SOUTH)
+    maze.carve_passage(1, 1, Direction.WEST)
+
+    path = trace_path(maze.passage_mask(), 2, [0, 1, 3, 2], 2)
+
+    assert path == [0, 1, 3, 2]
+
+
+def test_trace_path_to_unreachable_cell() -> None:
+    """Should return an empty path for cells out of the search."""
+    maze = CompactMaze(1, 2)
+
+    assert trace_path(maze.passage_mask(), 2, [0, -1], 1) == []
@@ -0,0 +1,81 @@
+"""Tests for the breadth-first search solver."""
+import pytest
+
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend
+from mazy.models.solver import SolverAlgorithm
+from mazy.solvers.bfs_solver import BFSSolver
+
+
+def test_bfs_solver_default_values() -> None:
+    """Ensure default values are consistent."""
+    assert BFSSolver().name == SolverAlgorithm.BFS.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+def test_bfs_solver_solve(backend: MazeBackend) -> None:
+    """Should find a path made of adjacent connected cells, on every backend."""
+    maze = KruskalBuilder(rows=9, cols=13, backend=backend).build()
+    solution = BFSSolver().solve(maze)
+    mask = maze.passage_mask()
+
+    assert solution.path[0] == 0
+    assert solution.path[-1] == 9 * 13 - 1
+    assert solution.length == solution.distances[-1]
+    assert min(solution.distances) == 0
+    for index, next_index in zip(solution.path, solution.path[1:]):
+        assert next_index - index in (-13, 1, 13, -1)
+        assert mask[index] & {-13: 1, 1: 2, 13: 4, -1: 8}[next_index - index]
+
+
+def test_bfs_solver_solve_stats() -> None:
+    """Should expand every reachable cell, one level at a time."""
+    solution = BFSSolver().solve(KruskalBuilder(rows=9, cols=13).build())
+
+    assert solution.stats.expanded == 9 * 13
+    assert 1 <= solution.stats.peak_frontier < 9 * 13
+    assert solution.stats.elapsed > 0
+
+
+def test_bfs_solver_solve_binary_tree() -> None:
+    """Binary Tree mazes have a straight corridor on the last row."""
+    maze = BinaryTreeBuilder(rows=4, cols=6).build()
+    solution = BFSSolver().solve(maze)
+
+    assert solution.length == 4 - 1 + 6 - 1
+
+
+def test_bfs_solver_solve_shortest_path() -> None:
+    """Should prefer the shortest of the paths through a maze with loops."""
+    maze = CompactMaze(5, 5)
+    for row in range(5):
+        for col in range(5):
+            if col < 4:
+                maze.carve_passage(row, col, Direction.EAST)
+            if row < 4:
+                maze.carve_passage(row, col, Direction.SOUTH)
+    solution = BFSSolver().solve(maze)
+
+    assert solution.length == 8
+    assert solution.distances == [row + col for row in range(5) for col in range(5)]
+
+
+def test_bfs_solver_solve_single_cell() -> None:
+    """The only cell of the maze is both the entrance and the exit."""
+    solution = BFSSolver().solve(CompactMaze(1, 1))
+
+    assert solution.path == [0]
+    assert solution.distances == [0]
+
+
+def test_bfs_solver_solve_unreachable_exit() -> None:
+    """Should provide the distance map, but no path."""
+    maze = CompactMaze(2, 2)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    solution = BFSSolver().solve(maze)
+
+    assert solution.path == []
+    assert solution.distances == [0, -1, 1, -1]
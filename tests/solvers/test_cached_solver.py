@@ -0,0 +1,144 @@
+"""Tests for the cached breadth-first search solver."""
+
+import pytest
+
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.grid import MazeGrid
+from mazy.models.maze import MazeBackend
+from mazy.models.solver import SolverAlgorithm
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.cached_solver import CachedSolver
+
+
+def seeded_maze(
+    seed: int, rows: int = 6, cols: int = 7, backend: MazeBackend = MazeBackend.COMPACT
+) -> MazeGrid:
+    """Maze with a repeatable layout for a given seed, on any backend."""
+    return RecursiveBacktrackerBuilder(rows, cols, backend, seed).build()
+
+
+def test_cached_solver_default_values() -> None:
+    """Ensure default values are consistent."""
+    solver = CachedSolver()
+
+    assert solver.name == SolverAlgorithm.CACHED_BFS.value
+    assert solver.max_bytes == 64 * 2**20
+    assert (solver.hits, solver.misses, solver.nbytes, len(solver)) == (0, 0, 0, 0)
+
+
+def test_cached_solver_rejects_negative_memory_cap() -> None:
+    """The memory cap can't be negative."""
+    with pytest.raises(ValueError, match="Memory cap must not be negative, got -1."):
+        CachedSolver(max_bytes=-1)
+
+
+def test_cached_solver_solve() -> None:
+    """Should solve like the breadth-first search, computing the map once."""
+    maze = seeded_maze(1)
+    expected_solution = BFSSolver().solve(maze)
+    solver = CachedSolver()
+
+    solution = solver.solve(maze)
+    cached_solution = solver.solve(maze)
+
+    assert solution.path == cached_solution.path == expected_solution.path
+    assert list(cached_solution.distances) == expected_solution.distances
+    assert solution.stats.expanded == 6 * 7
+    assert cached_solution.stats.expanded == 0
+    assert (solver.hits, solver.misses, len(solver)) == (1, 1, 1)
+    assert solver.nbytes == 4 * (6 * 7 + len(solution.path))
+
+
+def test_cached_solver_solve_returns_copies() -> None:
+    """Changing a solution must not corrupt the cache."""
+    maze = seeded_maze(1)
+    solver = CachedSolver()
+
+    solution = solver.solve(maze)
+    solution.path.clear()
+    solution.distances[0] = 99  # type: ignore[index]
+
+    cached_solution = solver.solve(maze)
+    assert cached_solution.path == BFSSolver().solve(maze).path
+    assert cached_solution.distances[0] == 0
+
+
+@pytest.mark.parametrize("backend", [MazeBackend.OBJECTS, MazeBackend.LAZY])
+def test_cached_solver_solve_same_layout_on_other_backend(
+    backend: MazeBackend,
+) -> None:
+    """The layout identifies the maze, not the backend storing it."""
+    solver = CachedSolver()
+
+    solver.solve(seeded_maze(1))
+    solution = solver.solve(seeded_maze(1, backend=backend))
+
+    assert (solver.hits, solver.misses) == (1, 1)
+    assert solution.path == BFSSolver().solve(seeded_maze(1)).path
+
+
+def test_cached_solver_search_other_target() -> None:
+    """Paths to other targets are traced on the cached distance map."""
+    maze = seeded_maze(1)
+    mask = maze.passage_mask()
+    solver = CachedSolver()
+
+    solver.solve(maze)
+    solution = solver.search(mask, 7, 0, 20)
+
+    assert solution.path == BFSSolver().search(mask, 7, 0, 20).path
+    assert (solver.hits, solver.misses, len(solver)) == (1, 1, 1)
+
+
+def test_cached_solver_search_other_source() -> None:
+    """Distance maps are cached by source cell."""
+    maze = seeded_maze(1)
+    mask = maze.passage_mask()
+    solver = CachedSolver()
+
+    solver.solve(maze)
+    solver.search(mask, 7, 41, 0)
+
+    assert (solver.hits, solver.misses, len(solver)) == (0, 2, 2)
+
+
+def test_cached_solver_evicts_least_recently_used() -> None:
+    """Should drop the oldest maps to stay within the memory cap."""
+    # Layouts whose paths are long enough not to fit three maps in the cap.
+    mazes = [seeded_maze(seed, rows=10, cols=10) for seed in (1, 3, 5)]
+    # Room for two maps of 100 cells and their paths, not three.
+    solver = CachedSolver(max_bytes=2 * 4 * (100 + 100))
+
+    solver.solve(mazes[0])
+    solver.solve(mazes[1])
+    solver.solve(mazes[0])
+    solver.solve(mazes[2])
+
+    assert len(solver) == 2
+    assert solver.nbytes <= solver.max_bytes
+    solver.solve(mazes[0])
+    assert solver.hits == 2
+    solver.solve(mazes[1])
+    assert solver.misses == 4
+
+
+def test_cached_solver_skips_maps_over_memory_cap() -> None:
+    """Maps too big for the cap are solved, but never cached."""
+    solver = CachedSolver(max_bytes=10)
+
+    solution = solver.solve(CompactMaze(3, 3))
+    solver.solve(CompactMaze(3, 3))
+
+    assert solution.path == []
+    assert (solver.hits, solver.misses, solver.nbytes, len(solver)) == (0, 2, 0, 0)
+
+
+def test_cached_solver_clear() -> None:
+    """Should drop the cached maps, keeping the counters."""
+    solver = CachedSolver()
+    solver.solve(seeded_maze(1))
+
+    solver.clear()
+
+    assert (solver.hits, solver.misses, solver.nbytes, len(solver)) == (0, 1, 0, 0)
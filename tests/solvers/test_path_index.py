@@ -0,0 +1,129 @@
+"""Tests for the path index."""
+import random
+
+import numpy as np
+import pytest
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.builders.sidewinder import SidewinderBuilder
+from mazy.exceptions import ImperfectMaze
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.path_index import PathIndex
+
+BUILDERS = [
+    BinaryTreeBuilder,
+    SidewinderBuilder,
+    KruskalBuilder,
+    RecursiveBacktrackerBuilder,
+]
+
+
+def random_pairs(size: int, count: int) -> list[tuple[int, int]]:
+    """Random pairs of cells, seeded for repeatable tests."""
+    random.seed(42)
+    return [(random.randrange(size), random.randrange(size)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("builder_class", BUILDERS)
+@pytest.mark.parametrize(("rows", "cols"), [(1, 9), (9, 1), (11, 14)])
+def test_path_index_path(
+    builder_class: type[MazeBuilder], rows: int, cols: int
+) -> None:
+    """Should find the same paths as the breadth-first search."""
+    maze = builder_class(rows, cols, MazeBackend.COMPACT).build()
+    mask = maze.passage_mask()
+    index = PathIndex(maze)
+
+    assert len(index) == rows * cols
+    for cell, other_cell in random_pairs(rows * cols, 30):
+        path = BFSSolver().search(mask, cols, cell, other_cell).path
+        assert index.path(cell, other_cell) == path
+        assert index.path_length(cell, other_cell) == len(path) - 1
+
+
+@pytest.mark.parametrize("builder_class", BUILDERS)
+def test_path_index_path_lengths(builder_class: type[MazeBuilder]) -> None:
+    """Batch queries should match the single ones."""
+    maze = builder_class(13, 17, MazeBackend.COMPACT).build()
+    index = PathIndex(maze)
+    pairs = random_pairs(13 * 17, 200)
+    cells = np.array([cell for cell, _ in pairs])
+    other_cells = np.array([other_cell for _, other_cell in pairs])
+
+    lengths = index.path_lengths(cells, other_cells)
+
+    assert lengths.tolist() == [index.path_length(*pair) for pair in pairs]
+    assert cells.tolist() == [cell for cell, _ in pairs]
+
+
+def test_path_index_common_ancestor() -> None:
+    """The common ancestor is taken on the tree rooted at the first cell.
+
+    +----+----+----+
+    |              |
+    +    +----+    +
+    |    |    |    |
+    +----+----+----+
+    """
+    maze = CompactMaze(2, 3)
+    maze.carve_passage(0, 0, Direction.EAST)
+    maze.carve_passage(0, 1, Direction.EAST)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    maze.carve_passage(0, 2, Direction.SOUTH)
+    maze.carve_passage(1, 1, Direction.NORTH)
+    index = PathIndex(maze)
+
+    assert index.common_ancestor(3, 5) == 0
+    assert index.common_ancestor(4, 5) == 1
+    assert index.common_ancestor(5, 2) == 2
+    assert index.common_ancestors(
+        np.array([3, 4, 5]), np.array([5, 5, 2])
+    ).tolist() == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_path_index_single_cell() -> None:
+    """A single cell maze has a single empty path."""
+    index = PathIndex(CompactMaze(1, 1))
+
+    assert index.path(0, 0) == [0]
+    assert index.path_length(0, 0) == 0
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+def test_path_index_on_every_backend(backend: MazeBackend) -> None:
+    """Should index mazes regardless of how the cells are stored."""
+    maze = KruskalBuilder(5, 6, backend).build()
+
+    assert PathIndex(maze).path_length(0, 29) == BFSSolver().solve(maze).length
+
+
+def test_path_index_rejects_maze_with_loops() -> None:
+    """A maze with loops has more than one path between some cells."""
+    maze = BinaryTreeBuilder(4, 4, MazeBackend.COMPACT).build()
+    maze.carve_passage(0, 0, Direction.EAST)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    maze.carve_passage(1, 1, Direction.NORTH)
+    maze.carve_passage(1, 1, Direction.WEST)
+
+    with pytest.raises(ImperfectMaze, match="The path index requires a perfect maze."):
+        PathIndex(maze)
+
+
+def test_path_index_rejects_disconnected_maze() -> None:
+    """Every cell must be reachable."""
+    maze = CompactMaze(2, 2)
+    maze.carve_passage(0, 0, Direction.EAST)
+    maze.carve_passage(1, 0, Direction.EAST)
+
+    with pytest.raises(ImperfectMaze, match="The path index requires a perfect maze."):
+        PathIndex(maze)
@@ -0,0 +1,66 @@
+"""Tests for the reduced graph solver."""
+import pytest
+
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.sidewinder import SidewinderBuilder
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend
+from mazy.models.solver import SolverAlgorithm
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.reduced_graph_solver import ReducedGraphSolver
+
+
+def test_reduced_graph_solver_default_values() -> None:
+    """Ensure default values are consistent."""
+    assert ReducedGraphSolver().name == SolverAlgorithm.REDUCED_GRAPH.value
+
+
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
+@pytest.mark.parametrize(
+    "builder_class", [BinaryTreeBuilder, SidewinderBuilder, KruskalBuilder]
+)
+def test_reduced_graph_solver_solve(
+    backend: MazeBackend, builder_class: type[MazeBuilder]
+) -> None:
+    """Should find the same path as the breadth-first search on perfect mazes."""
+    maze = builder_class(9, 13, backend).build()
+    solution = ReducedGraphSolver().solve(maze)
+
+    assert solution.path == BFSSolver().solve(maze).path
+    assert solution.stats.expanded == 2
+    assert [solution.distances[index] for index in solution.path] == list(
+        range(len(solution.path))
+    )
+
+
+def test_reduced_graph_solver_solve_maze_with_loops() -> None:
+    """Should find the shortest of the paths around the loops."""
+    maze = CompactMaze(5, 5)
+    for row in range(5):
+        for col in range(5):
+            if col < 4:
+                maze.carve_passage(row, col, Direction.EAST)
+            if row < 4:
+                maze.carve_passage(row, col, Direction.SOUTH)
+    solution = ReducedGraphSolver().solve(maze)
+
+    assert solution.length == 8
+
+
+def test_reduced_graph_solver_solve_single_cell() -> None:
+    """The only cell of the maze is both the entrance and the exit."""
+    solution = ReducedGraphSolver().solve(CompactMaze(1, 1))
+
+    assert solution.path == [0]
+
+
+def test_reduced_graph_solver_solve_unreachable_exit() -> None:
+    """Should give up without a path."""
+    maze = CompactMaze(2, 2)
+    maze.carve_passage(0, 0, Direction.SOUTH)
+    solution = ReducedGraphSolver().solve(maze)
+
+    assert solution.path == []
@@ -0,0 +1,124 @@
+"""Tests for the maze reductions."""
+import random
+
+import pytest
+
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.models.cell import Direction
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import MazeBackend
+from mazy.solvers.bfs_solver import BFSSolver
+from mazy.solvers.reduction import ReducedGraph, fill_dead_ends
+
+
+def comb_maze() -> CompactMaze:
+    """3x4 maze: a corridor along the first row with teeth going south.
+
+    +----+----+----+----+
+    |                   |
+    +    +----+    +----+
+    |    |    |    |    |
+    +    +----+    +----+
+    |    |    |    |    |
+    +----+----+----+----+
+    """
+    maze = CompactMaze(3, 4)
+    for col in range(3):
+        maze.carve_passage(0, col, Direction.EAST)
+    for col in (0, 2):
+        maze.carve_passage(0, col, Direction.SOUTH)
+        maze.carve_passage(1, col, Direction.SOUTH)
+
+    return maze
+
+
+def test_fill_dead_ends() -> None:
+    """Should fill the teeth, leaving the path between the kept cells."""
+    maze = comb_maze()
+
+    pruned = fill_dead_ends(maze.passage_mask(), 4, keep=(0, 3))
+
+    assert list(pruned[:4]) == [2, 10, 10, 8]
+    assert not any(pruned[4:])
+    assert list(maze.passage_mask()[:4]) == [6, 10, 14, 8]
+
+
+def test_fill_dead_ends_keeps_cells() -> None:
+    """Kept cells are never filled, neither the paths leading to them."""
+    pruned = fill_dead_ends(comb_maze().passage_mask(), 4, keep=(0, 10))
+
+    assert [index for index, cell_mask in enumerate(pruned) if cell_mask] == [
+        0,
+        1,
+        2,
+        6,
+        10,
+    ]
+
+
+def test_fill_dead_ends_perfect_maze() -> None:
+    """Only the path between the kept cells survives on a perfect maze."""
+    maze = RecursiveBacktrackerBuilder(15, 20, MazeBackend.COMPACT).build()
+    mask = maze.passage_mask()
+
+    pruned = fill_dead_ends(mask, 20, keep=(0, 299))
+
+    path = BFSSolver().search(mask, 20, 0, 299).path
+    assert sorted(index for index, cell_mask in enumerate(pruned) if cell_mask) == (
+        sorted(path)
+    )
+
+
+def test_reduced_graph() -> None:
+    """Corridors should collapse into weighted edges between junctions."""
+    graph = ReducedGraph(comb_maze().passage_mask(), 4, terminals=(0,))
+
+    assert len(graph) == 5
+    assert sorted(graph.edges) == [0, 2, 3, 8, 10]
+    assert sorted(graph.edges[0]) == [(2, 2, 2), (8, 2, 4)]
+    assert sorted(graph.edges[2]) == [(0, 2, 8), (3, 1, 2), (10, 2, 4)]
+
+
+def test_reduced_graph_shortest_path() -> None:
+    """Should expand the corridors of the path found between the nodes.
+
+    The junction on the first row and the three dead ends are the only nodes.
+    """
+    graph = ReducedGraph(comb_maze().passage_mask(), 4)
+
+    path, stats = graph.shortest_path(8, 10)
+
+    assert path == [8, 4, 0, 1, 2, 6, 10]
+    assert stats.expanded == 4
+    assert stats.peak_frontier >= 1
+
+
+def test_reduced_graph_shortest_path_same_node() -> None:
+    """A path from a node to itself has a single cell."""
+    graph = ReducedGraph(comb_maze().passage_mask(), 4)
+
+    assert graph.shortest_path(2, 2)[0] == [2]
+
+
+def test_reduced_graph_shortest_path_unreachable() -> None:
+    """Should return an empty path when the end can't be reached."""
+    maze = CompactMaze(2, 3)
+    maze.carve_passage(0, 0, Direction.EAST)
+    graph = ReducedGraph(maze.passage_mask(), 3, terminals=(5,))
+
+    assert graph.shortest_path(0, 5)[0] == []
+
+
+@pytest.mark.parametrize("cols", [1, 2, 17])
+def test_reduced_graph_repeated_queries(cols: int) -> None:
+    """Queries between any terminals should match the breadth-first search."""
+    maze = KruskalBuilder(13, cols, MazeBackend.COMPACT).build()
+    mask = maze.passage_mask()
+    random.seed(42)
+    terminals = [random.randrange(13 * cols) for _ in range(8)]
+    graph = ReducedGraph(fill_dead_ends(mask, cols, terminals), cols, terminals)
+
+    for start, end in zip(terminals, terminals[1:]):
+        path, _ = graph.shortest_path(start, end)
+        assert path == BFSSolver().search(mask, cols, start, end).path
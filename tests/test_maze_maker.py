@@ -1,20 +1,37 @@
 """Tests for the command line CLI."""
+import json
+import random
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from _pytest.capture import CaptureFixture
 from faker import Faker
 
+from mazy.builders.growing_tree import GrowingTreeBuilder
 from mazy.exceptions import InvalidBuilder, InvalidViewer
 from mazy.maze_maker import (
+    DEFAULT_BACKPRESSURE,
+    DEFAULT_JOBS,
     DEFAULT_MAZE_BUILDER,
     DEFAULT_MAZE_VIEWER,
+    DEFAULT_MIX,
     DEFAULT_NUMBER_OF_COLS,
     DEFAULT_NUMBER_OF_ROWS,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_SELECTION,
+    DEFAULT_STRIDE,
+    DEFAULT_TEXT_STYLE,
+    MANIFEST_FILE,
+    create_builder,
     make_maze,
     validate_args,
 )
-from mazy.models.builder import BuilderAlgorithm
+from mazy.models.builder import BuilderAlgorithm, CellSelection
+from mazy.models.compact_maze import CompactMaze
+from mazy.models.maze import Maze, MazeBackend
+from mazy.viewers.build_worker import DEFAULT_QUEUE_SIZE
+from mazy.viewers.geometry import CELL_SIZE
 
 
 @pytest.mark.parametrize(
@@ -24,6 +41,9 @@ from mazy.models.builder import BuilderAlgorithm
         pytest.param("-c", "--cols", 30, id="Number of columns"),
         pytest.param("-b", "--builder", "binary-tree", id="Binary Tree Builder"),
         pytest.param("-v", "--viewer", "graphical", id="Graphical Viewer"),
+        pytest.param("-m", "--backend", "compact", id="Compact Backend"),
+        pytest.param("-o", "--output", "maze.txt", id="Output File"),
+        pytest.param("-e", "--seed", 42, id="Seed"),
     ],
 )
 def test_maze_maker_validate_args(
@@ -65,7 +85,147 @@ def test_maze_maker_validate_args_without_args() -> None:
     assert getattr(args_namespace, "cols", None) == DEFAULT_NUMBER_OF_COLS
     assert getattr(args_namespace, "builder", None) == DEFAULT_MAZE_BUILDER
     assert getattr(args_namespace, "viewer", None) == DEFAULT_MAZE_VIEWER
+    assert getattr(args_namespace, "backend", None) is None
+    assert getattr(args_namespace, "output", None) is None
+    assert getattr(args_namespace, "text_style", None) == DEFAULT_TEXT_STYLE
+    assert getattr(args_namespace, "cell_size", None) == CELL_SIZE
+    assert getattr(args_namespace, "seed", None) is None
+    assert getattr(args_namespace, "selection", None) == DEFAULT_SELECTION
+    assert getattr(args_namespace, "mix", None) == DEFAULT_MIX
     assert getattr(args_namespace, "animated", None) is False
+    assert getattr(args_namespace, "stride", None) == DEFAULT_STRIDE
+    assert getattr(args_namespace, "frame_budget", None) is None
+    assert getattr(args_namespace, "worker", None) is False
+    assert getattr(args_namespace, "queue_size", None) == DEFAULT_QUEUE_SIZE
+    assert getattr(args_namespace, "backpressure", None) == DEFAULT_BACKPRESSURE
+    assert getattr(args_namespace, "count", None) is None
+    assert getattr(args_namespace, "jobs", None) == DEFAULT_JOBS
+    assert getattr(args_namespace, "output_dir", None) == DEFAULT_OUTPUT_DIR
+
+
+@pytest.mark.parametrize("arg_name", ["-t", "--text-style"])
+def test_maze_maker_validate_text_style_arg(arg_name: str) -> None:
+    """Should parse the text style (short and long)."""
+    args_namespace = validate_args([arg_name, "unicode"])
+    assert args_namespace.text_style == "unicode"
+
+
+@pytest.mark.parametrize(
+    ("arg_short_name", "arg_name", "attribute", "arg_value"),
+    [
+        pytest.param("-s", "--stride", "stride", 50, id="Stride"),
+        pytest.param("-f", "--frame-budget", "frame_budget", 12.5, id="Frame Budget"),
+    ],
+)
+def test_maze_maker_validate_pacing_args(
+    arg_short_name: str, arg_name: str, attribute: str, arg_value: float
+) -> None:
+    """Should parse the animation pacing (short and long)."""
+    for name in (arg_short_name, arg_name):
+        args_namespace = validate_args([name, str(arg_value)])
+        assert getattr(args_namespace, attribute) == arg_value
+
+
+def test_maze_maker_validate_worker_args() -> None:
+    """Should parse the background worker options (short and long)."""
+    for args in (
+        ["-w", "-q", "8", "-p", "coalesce"],
+        ["--worker", "--queue-size", "8", "--backpressure", "coalesce"],
+    ):
+        args_namespace = validate_args(args)
+        assert args_namespace.worker is True
+        assert args_namespace.queue_size == 8
+        assert args_namespace.backpressure == "coalesce"
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        pytest.param(
+            ["-e", "-1"],
+            "argument -e/--seed: must be a non-negative number, got -1",
+            id="Negative seed",
+        ),
+        pytest.param(
+            ["-e", "x"], "argument -e/--seed: invalid int value: 'x'", id="Bad seed"
+        ),
+        pytest.param(
+            ["-z", "1"],
+            "argument -z/--cell-size: must be at least 2 pixels, got 1",
+            id="Tiny cells",
+        ),
+        pytest.param(
+            ["-n", "0"],
+            "argument -n/--count: must be a positive number, got 0",
+            id="No mazes",
+        ),
+        pytest.param(
+            ["-n", "1", "-j", "0"],
+            "argument -j/--jobs: must be a positive number, got 0",
+            id="No jobs",
+        ),
+    ],
+)
+def test_maze_maker_validate_out_of_range_args(
+    args: list[str], message: str, capsys: CaptureFixture[str]
+) -> None:
+    """Should reject numbers out of range when parsing."""
+    with pytest.raises(SystemExit):
+        validate_args(args)
+
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("args", "maze_class"),
+    [
+        pytest.param(["-b", "binary-tree-numpy"], CompactMaze, id="Numpy default"),
+        pytest.param(["-b", "sidewinder-numpy"], CompactMaze, id="Numpy sidewinder"),
+        pytest.param(["-b", "binary-tree"], Maze, id="Objects default"),
+        pytest.param(["-b", "binary-tree-numpy", "-m", "objects"], Maze, id="Given"),
+    ],
+)
+def test_maze_maker_builder_keeps_its_default_backend(
+    args: list[str], maze_class: type[object]
+) -> None:
+    """Should only override the backend of the builder when one is given."""
+    builder = create_builder(validate_args(args))
+
+    assert isinstance(builder.maze, maze_class)
+
+
+def test_maze_maker_validate_growing_tree_args() -> None:
+    """Should pass the cell selection and mix to the growing-tree builder."""
+    for args in (
+        ["-b", "growing-tree", "-l", "mixed", "-x", "0.75"],
+        ["-b", "growing-tree", "--selection", "mixed", "--mix", "0.75"],
+    ):
+        builder = create_builder(validate_args(args))
+        assert isinstance(builder, GrowingTreeBuilder)
+        assert builder.selection == CellSelection.MIXED
+        assert builder.mix == 0.75
+
+
+def test_maze_maker_validate_batch_args() -> None:
+    """Should parse the batch mode options (short and long)."""
+    for args in (
+        ["-n", "10", "-j", "3", "-d", "catalog"],
+        ["--count", "10", "--jobs", "3", "--output-dir", "catalog"],
+    ):
+        args_namespace = validate_args(args)
+        assert args_namespace.count == 10
+        assert args_namespace.jobs == 3
+        assert args_namespace.output_dir == "catalog"
+
+
+def test_maze_maker_validate_pacing_args_are_exclusive(
+    capsys: CaptureFixture[str],
+) -> None:
+    """Should not accept both a stride and a frame budget."""
+    with pytest.raises(SystemExit):
+        validate_args(["--stride", "5", "--frame-budget", "10"])
+
+    assert "not allowed with argument" in capsys.readouterr().err
 
 
 def test_maze_maker_validate_invalid_args(
@@ -108,13 +268,17 @@ def test_maze_maker_raise_when_invalid_viewer(
         make_maze(args_namespace)
 
 
+@pytest.mark.parametrize("backend", [backend for backend in MazeBackend])
 @pytest.mark.parametrize("builder_algorithm", [algo for algo in BuilderAlgorithm])
 def test_maze_maker_build_maze(
     builder_algorithm: BuilderAlgorithm,
+    backend: MazeBackend,
     capsys: CaptureFixture[str],
 ) -> None:
-    """Should create a valid maze for every builder algorithm."""
-    args_namespace = validate_args(["-b", builder_algorithm.value, "-v", "text"])
+    """Should create a valid maze for every builder algorithm and backend."""
+    args_namespace = validate_args(
+        ["-b", builder_algorithm.value, "-v", "text", "-m", backend.value]
+    )
     make_maze(args_namespace)
     captured = capsys.readouterr()
 
@@ -129,6 +293,27 @@ def test_maze_maker_build_maze(
     assert "Maze created." in captured.out
 
 
+@pytest.mark.parametrize("builder_algorithm", [algo for algo in BuilderAlgorithm])
+def test_maze_maker_seed_builds_the_same_maze(
+    builder_algorithm: BuilderAlgorithm, tmp_path: Path
+) -> None:
+    """Should build the same maze for the same seed, whatever the global state."""
+    mazes = []
+    for seed, global_seed in ((42, 1), (42, 2), (43, 1)):
+        output = tmp_path / f"maze-{seed}-{global_seed}.txt"
+        random.seed(global_seed)
+        args_namespace = validate_args(
+            ["-r", "8", "-c", "9", "-b", builder_algorithm.value]
+            + ["-v", "text", "-e", str(seed), "-o", str(output)]
+        )
+        make_maze(args_namespace)
+        mazes.append(output.read_text())
+
+    assert mazes[0] == mazes[1]
+    if builder_algorithm != BuilderAlgorithm.DUMMY:
+        assert mazes[0] != mazes[2]
+
+
 @patch("mazy.maze_maker.MazeGraphicalViewer")
 def test_maze_maker_make_maze_ascii_viewer(
     maze_graphical_viewer_mock: Mock,
@@ -168,3 +353,170 @@ def test_maze_maker_make_maze_graphical_viewer(
     assert "Graphical viewer loaded." in captured.out
     assert "Maze created." in captured.out
     maze_graphical_viewer_mock.assert_called()
+
+
+def test_maze_maker_make_maze_text_output_file(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Should stream the text maze to the output file."""
+    output = tmp_path / "maze.txt"
+    args_namespace = validate_args(
+        ["-r", "5", "-c", "8", "-b", "eller", "-v", "text", "-o", str(output)]
+    )
+    make_maze(args_namespace)
+    captured = capsys.readouterr()
+
+    assert "Maze created." in captured.out
+    assert "+----+" not in captured.out
+    assert len(output.read_text().splitlines()) == 11
+
+
+def test_maze_maker_make_maze_svg_output_file(
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Should stream the SVG maze to the output file."""
+    output = tmp_path / "maze.svg"
+    args_namespace = validate_args(
+        ["-r", "5", "-c", "8", "-b", "eller", "-v", "svg", "-o", str(output)]
+    )
+    make_maze(args_namespace)
+    captured = capsys.readouterr()
+
+    assert "Svg viewer loaded." in captured.out
+    assert "<svg" not in captured.out
+    assert output.read_text().startswith("<svg")
+
+
+@pytest.mark.parametrize(
+    ("cell_size_args", "header"),
+    [
+        pytest.param([], b"P6\n322 226\n255\n", id="Default cell size"),
+        pytest.param(["-z", "4"], b"P6\n41 29\n255\n", id="Thumbnail"),
+        pytest.param(["--cell-size", "4"], b"P6\n41 29\n255\n", id="Long name"),
+    ],
+)
+def test_maze_maker_make_maze_raster_output_file(
+    cell_size_args: list[str],
+    header: bytes,
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Should paint the maze to the output image, with the given cell size."""
+    output = tmp_path / "maze.ppm"
+    args_namespace = validate_args(
+        ["-r", "5", "-c", "8", "-v", "raster", "-o", str(output), *cell_size_args]
+    )
+    make_maze(args_namespace)
+    captured = capsys.readouterr()
+
+    assert "Raster viewer loaded." in captured.out
+    assert output.read_bytes().startswith(header)
+
+
+@patch("mazy.maze_maker.MazeGraphicalViewer")
+def test_maze_maker_make_maze_graphical_viewer_pacing(
+    maze_graphical_viewer_mock: Mock,
+) -> None:
+    """Should pass the animation pacing to the graphical viewer."""
+    args_namespace = validate_args(["-v", "graphical", "-a", "-f", "12.5"])
+    make_maze(args_namespace)
+
+    _, animated, stride, frame_budget, *_ = maze_graphical_viewer_mock.call_args.args
+    assert (animated, stride, frame_budget) == (True, DEFAULT_STRIDE, 12.5)
+
+
+@pytest.mark.parametrize(
+    ("viewer", "extension", "jobs"),
+    [
+        pytest.param("text", "txt", 1, id="Text in process"),
+        pytest.param("svg", "svg", 2, id="SVG on a pool"),
+        pytest.param("raster", "png", 2, id="Raster on a pool"),
+    ],
+)
+def test_maze_maker_make_batch(
+    viewer: str,
+    extension: str,
+    jobs: int,
+    tmp_path: Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Should write every maze of the batch and a manifest with their metadata."""
+    args_namespace = validate_args(
+        ["-n", "12", "-j", str(jobs), "-v", viewer, "-d", str(tmp_path / "batch")]
+    )
+    make_maze(args_namespace)
+    captured = capsys.readouterr()
+
+    assert (
+        f"Building 12 3x4 mazes using {DEFAULT_MAZE_BUILDER} algorithm "
+        f"on {jobs} processes..." in captured.out
+    )
+    assert "Built 12 mazes" in captured.out
+
+    lines = (tmp_path / "batch" / MANIFEST_FILE).read_text().splitlines()
+    results = [json.loads(line) for line in lines]
+    assert [result["index"] for result in results] == list(range(12))
+    assert results[3]["file"] == f"maze-03.{extension}"
+    assert len({result["seed"] for result in results}) == 12
+    for result in results:
+        path = tmp_path / "batch" / result["file"]
+        assert path.stat().st_size == result["size"] > 0
+        assert result["seconds"] > 0
+
+
+def test_maze_maker_make_batch_is_repeatable(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    """The same batch seed should build the same mazes, on any number of jobs.
+
+    Each maze should be built again from the seed in the manifest.
+    """
+    for jobs in (1, 2):
+        args_namespace = validate_args(
+            ["-n", "6", "-j", str(jobs), "-b", "wilson", "-v", "text", "-e", "7"]
+            + ["-d", str(tmp_path / f"batch-{jobs}")]
+        )
+        make_maze(args_namespace)
+
+    lines = (tmp_path / "batch-1" / MANIFEST_FILE).read_text().splitlines()
+    for result in map(json.loads, lines):
+        maze = (tmp_path / "batch-1" / result["file"]).read_text()
+        assert (tmp_path / "batch-2" / result["file"]).read_text() == maze
+
+        output = tmp_path / "maze.txt"
+        args_namespace = validate_args(
+            ["-b", "wilson", "-v", "text", "-e", str(result["seed"])]
+            + ["-o", str(output)]
+        )
+        make_maze(args_namespace)
+        assert output.read_text() == maze
+
+
+@pytest.mark.parametrize(
+    ("args", "error", "message"),
+    [
+        pytest.param(
+            ["-n", "1", "-v", "graphical"],
+            InvalidViewer,
+            "Invalid batch viewer: graphical",
+            id="Graphical viewer",
+        ),
+        pytest.param(
+            ["-n", "1", "-v", "text", "-b", "nope"],
+            InvalidBuilder,
+            "Invalid builder: nope",
+            id="Invalid builder",
+        ),
+    ],
+)
+def test_maze_maker_make_batch_invalid_args(
+    args: list[str], error: type[Exception], message: str, tmp_path: Path
+) -> None:
+    """Should raise an error before building a batch with invalid args."""
+    args_namespace = validate_args([*args, "-d", str(tmp_path / "batch")])
+    with pytest.raises(error, match=message):
+        make_maze(args_namespace)
+
+    assert not (tmp_path / "batch").exists()
@@ -1,7 +1,7 @@
 """Tests for the utility functions."""
 from typing import Generator
 
-from mazy.utils import consume_generator
+from mazy.utils import Bitmap, DisjointSet, consume_generator
 
 
 def test_utils_consume_generator() -> None:
@@ -13,3 +13,45 @@ def test_utils_consume_generator() -> None:
 
     max_number = 3
     assert consume_generator(numbers(max_number)) == max_number
+
+
+def test_utils_bitmap() -> None:
+    """Should set and clear individual flags without touching the others."""
+    bitmap = Bitmap(20)
+    assert len(bitmap) == 20
+    assert len(bitmap.bits) == 3
+    assert not any(bitmap[index] for index in range(20))
+
+    bitmap[3] = True
+    bitmap[19] = True
+    assert [index for index in range(20) if bitmap[index]] == [3, 19]
+
+    bitmap[3] = False
+    assert [index for index in range(20) if bitmap[index]] == [19]
+
+
+def test_utils_disjoint_set() -> None:
+    """Should merge sets and tell whether items share a set."""
+    sets = DisjointSet(6)
+    assert len({sets.find(item) for item in range(6)}) == 6
+
+    assert sets.union(0, 1) is True
+    assert sets.union(2, 3) is True
+    assert sets.union(1, 3) is True
+    assert sets.union(0, 2) is False
+
+    assert sets.find(0) == sets.find(3)
+    assert sets.find(4) != sets.find(0)
+    assert len({sets.find(item) for item in range(6)}) == 3
+
+
+def test_utils_disjoint_set_compresses_paths() -> None:
+    """Every item should point straight to its root after a find."""
+    sets = DisjointSet(5)
+    for item in range(4):
+        sets.parent[item] = item + 1
+
+    root = sets.find(0)
+
+    assert root == 4
+    assert all(sets.parent[item] == root for item in range(5))
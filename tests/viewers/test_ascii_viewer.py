@@ -1,7 +1,15 @@
 """Tests for the text (ASCII) viewer."""
+import io
+import random
+import tracemalloc
+from pathlib import Path
+
 import pytest
 
 from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.eller import EllerBuilder
+from mazy.models.cell import Direction
 from mazy.viewers.ascii_viewer import MazeTextViewer
 
 ROW_SIZE = 2
@@ -40,3 +48,95 @@ def test_ascii_viewer_maze_to_maze(
 
     for row in str_rows:
         assert len(row) == COL_SIZE * cols + 1
+
+
+def test_ascii_viewer_maze_to_str_layout() -> None:
+    """Should draw the walls left between the passages of the maze."""
+    builder = DummyBuilder(rows=2, cols=3)
+    builder.maze.carve_passage(0, 0, Direction.EAST)
+    builder.maze.carve_passage(0, 1, Direction.SOUTH)
+    builder.maze.carve_passage(1, 0, Direction.EAST)
+    builder.maze.carve_passage(1, 1, Direction.EAST)
+    builder.maze.carve_passage(0, 2, Direction.SOUTH)
+
+    assert MazeTextViewer(builder).maze_to_str() == (
+        "+    +----+----+\n"
+        "|         |    |\n"
+        "+----+    +    +\n"
+        "|              |\n"
+        "+----+----+    +"
+    )
+
+
+def test_ascii_viewer_maze_to_str_single_cell() -> None:
+    """A single cell maze only has the exit open."""
+    maze_str = MazeTextViewer(DummyBuilder(rows=1, cols=1)).maze_to_str()
+
+    assert maze_str == "+----+\n|    |\n+    +"
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (2, 3), (4, 2)])
+def test_ascii_viewer_write_maze_matches_maze_to_str(rows: int, cols: int) -> None:
+    """Writing the maze line by line should match the full representation."""
+    random.seed(42)
+    maze_str = MazeTextViewer(BinaryTreeBuilder(rows, cols)).maze_to_str()
+    random.seed(42)
+    file = io.StringIO()
+    MazeTextViewer(BinaryTreeBuilder(rows, cols)).write_maze(file)
+
+    assert file.getvalue() == maze_str + "\n"
+
+
+def test_ascii_viewer_show_maze_streams_to_stdout(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Should print the maze line by line."""
+    random.seed(42)
+    maze_str = MazeTextViewer(BinaryTreeBuilder(rows=3, cols=4)).maze_to_str()
+    random.seed(42)
+    MazeTextViewer(BinaryTreeBuilder(rows=3, cols=4)).show_maze()
+
+    assert capsys.readouterr().out == maze_str + "\n"
+
+
+def test_ascii_viewer_write_maze_holds_a_row_in_memory() -> None:
+    """Peak memory should stay far below the size of the whole rendering."""
+
+    class CountingFile(io.StringIO):
+        """File counting the characters written, without keeping them."""
+
+        written = 0
+
+        def write(self, text: str) -> int:
+            self.written += len(text)
+            return len(text)
+
+    file = CountingFile()
+    tracemalloc.start()
+    MazeTextViewer(EllerBuilder(rows=2000, cols=20)).write_maze(file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert file.written > 400_000
+    assert peak < file.written / 10
+
+
+def test_ascii_viewer_write_maze_streams_rows() -> None:
+    """Streaming builders should be written without allocating the maze."""
+    builder = EllerBuilder(rows=50, cols=4)
+    file = io.StringIO()
+    MazeTextViewer(builder).write_maze(file)
+
+    assert len(file.getvalue().splitlines()) == ROW_SIZE * 50 + 1
+    assert "maze" not in builder.__dict__
+
+
+def test_ascii_viewer_show_maze_to_output_file(tmp_path: Path) -> None:
+    """Should write the maze to the output file instead of printing it."""
+    output = tmp_path / "maze.txt"
+    MazeTextViewer(BinaryTreeBuilder(rows=3, cols=4), str(output)).show_maze()
+
+    lines = output.read_text().splitlines()
+    assert len(lines) == ROW_SIZE * 3 + 1
+    assert lines[0].startswith("+    +")
+    assert lines[-1].endswith("+    +")
@@ -0,0 +1,75 @@
+"""Tests for the background building of a maze."""
+import time
+
+import pytest
+
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.models.maze import MazeState
+from mazy.models.viewer import BackpressurePolicy
+from mazy.viewers.build_worker import BuildWorker, Delta
+
+TIMEOUT = 10
+
+
+def drain_until_finished(worker: BuildWorker) -> Delta:
+    """Drain the worker until the building is over."""
+    touched: Delta = set()
+    deadline = time.monotonic() + TIMEOUT
+    while time.monotonic() < deadline:
+        delta, finished = worker.drain()
+        touched |= delta
+        if finished:
+            return touched
+        time.sleep(0.001)
+
+    raise TimeoutError("The building did not finish in time.")
+
+
+@pytest.mark.parametrize("policy", [policy for policy in BackpressurePolicy])
+def test_build_worker_reports_every_cell(policy: BackpressurePolicy) -> None:
+    """Every cell of the maze should come in the deltas."""
+    builder = BinaryTreeBuilder(rows=6, cols=7)
+    worker = BuildWorker(builder.build_steps(), queue_size=2, policy=policy)
+    worker.start()
+
+    assert drain_until_finished(worker) == {
+        (row, col) for row in range(6) for col in range(7)
+    }
+    assert builder.maze.state == MazeState.READY
+    assert worker.step_count == 42
+    worker.stop()
+
+
+def test_build_worker_blocks_when_the_queue_is_full() -> None:
+    """The blocking policy should pace the building to the viewer."""
+    builder = BinaryTreeBuilder(rows=6, cols=7)
+    worker = BuildWorker(builder.build_steps(), queue_size=2)
+    worker.start()
+    time.sleep(0.2)
+
+    assert worker.step_count <= 3
+    assert builder.maze.state == MazeState.BUILDING
+    worker.stop()
+    assert not worker.thread.is_alive()
+
+
+def test_build_worker_coalesces_when_the_queue_is_full() -> None:
+    """The coalescing policy should keep building, merging the deltas."""
+    builder = BinaryTreeBuilder(rows=6, cols=7)
+    worker = BuildWorker(
+        builder.build_steps(), queue_size=1, policy=BackpressurePolicy.COALESCE
+    )
+    worker.start()
+    deadline = time.monotonic() + TIMEOUT
+    while builder.maze.state != MazeState.READY and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    assert builder.maze.state == MazeState.READY
+    assert len(drain_until_finished(worker)) == 42
+    worker.stop()
+
+
+def test_build_worker_invalid_queue_size() -> None:
+    """Should raise an error when the queue can't hold a delta."""
+    with pytest.raises(ValueError, match="Queue size must be a positive number"):
+        BuildWorker(iter([]), queue_size=0)
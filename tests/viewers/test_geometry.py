@@ -0,0 +1,133 @@
+"""Tests for the geometry of the maze shapes."""
+import random
+
+import pytest
+
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.models.cell import DIRECTION_MASKS, Direction, Role
+from mazy.viewers.geometry import (
+    CELL_SIZE,
+    EXTERNAL_SIZE,
+    MazeGeometry,
+    Point,
+    Segment,
+    merge_segments,
+)
+
+EAST = DIRECTION_MASKS[Direction.EAST]
+SOUTH = DIRECTION_MASKS[Direction.SOUTH]
+
+
+def segment_length(segment: Segment) -> int:
+    """Length of a horizontal or vertical segment."""
+    start, end = segment
+    return abs(end.x - start.x) + abs(end.y - start.y)
+
+
+def test_geometry_size() -> None:
+    """Should include the external margins on both sides."""
+    geometry = MazeGeometry(rows=2, cols=3)
+
+    assert geometry.delta_y == 2 * CELL_SIZE + EXTERNAL_SIZE
+    assert geometry.width == 3 * CELL_SIZE + 2 * EXTERNAL_SIZE
+    assert geometry.height == 2 * CELL_SIZE + 2 * EXTERNAL_SIZE
+
+
+@pytest.mark.parametrize(
+    ("row", "col", "passages", "role", "expected_walls"),
+    [
+        pytest.param(0, 0, 0, Role.ENTRANCE, 3, id="Entrance without passages"),
+        pytest.param(0, 0, EAST | SOUTH, Role.NONE, 2, id="Top left corner"),
+        pytest.param(1, 1, EAST | SOUTH, Role.NONE, 0, id="Inner cell"),
+        pytest.param(1, 1, 0, Role.NONE, 2, id="Inner cell without passages"),
+        pytest.param(2, 2, 0, Role.EXIT, 1, id="Exit"),
+        pytest.param(2, 2, 0, Role.NONE, 2, id="Bottom right corner"),
+    ],
+)
+def test_geometry_cell_points(
+    row: int, col: int, passages: int, role: Role, expected_walls: int
+) -> None:
+    """Should draw the walls on the north and west borders and between cells."""
+    points, center = MazeGeometry(rows=3, cols=3).cell_points(row, col, passages, role)
+
+    assert len(points) == 2 * expected_walls
+    assert center == Point(
+        EXTERNAL_SIZE + col * CELL_SIZE + CELL_SIZE // 2,
+        EXTERNAL_SIZE + (3 - row) * CELL_SIZE - CELL_SIZE // 2,
+    )
+
+
+def test_geometry_row_walls_single_cell() -> None:
+    """A single cell maze only has the exit open."""
+    walls = list(MazeGeometry(rows=1, cols=1).row_walls(0, bytes(1)))
+
+    assert len(walls) == 3
+    assert (Point(32, 32), Point(64, 32)) not in walls
+
+
+def test_merge_segments_without_passages() -> None:
+    """A maze without passages should be drawn with a line per grid line."""
+    geometry = MazeGeometry(rows=3, cols=4)
+    merged = list(merge_segments(geometry.row_walls(row, bytes(4)) for row in range(3)))
+
+    horizontals = [segment for segment in merged if segment[0].y == segment[1].y]
+    verticals = [segment for segment in merged if segment[0].x == segment[1].x]
+    assert len(horizontals) == 4
+    assert len(verticals) == 5
+    assert all(segment_length(segment) == 3 * CELL_SIZE for segment in verticals)
+
+
+def test_merge_segments_keeps_gaps() -> None:
+    """Walls apart from each other should not be merged."""
+    geometry = MazeGeometry(rows=1, cols=3)
+    merged = list(merge_segments([geometry.row_walls(0, bytes([EAST, 0, 0]))]))
+
+    inner_verticals = [
+        segment for segment in merged if segment[0].x == segment[1].x == 96
+    ]
+    assert inner_verticals == [(Point(96, 64), Point(96, 32))]
+    assert (Point(64, 64), Point(64, 32)) not in merged
+
+
+def test_merge_segments_keeps_walls() -> None:
+    """Merged lines should cover the same walls, with far fewer lines."""
+    random.seed(42)
+    builder = RecursiveBacktrackerBuilder(rows=20, cols=30)
+    geometry = MazeGeometry(builder.rows, builder.cols)
+    row_masks = list(builder.build_rows())
+    walls = [
+        segment
+        for row, row_mask in enumerate(row_masks)
+        for segment in geometry.row_walls(row, row_mask)
+    ]
+    merged = list(
+        merge_segments(
+            geometry.row_walls(row, row_mask) for row, row_mask in enumerate(row_masks)
+        )
+    )
+
+    assert sum(map(segment_length, merged)) == sum(map(segment_length, walls))
+    assert len(merged) < len(walls) / 2
+
+
+def test_graphical_geometry_matches_row_walls() -> None:
+    """The same walls should be drawn from the cells and from the row masks."""
+    builder = DummyBuilder(rows=2, cols=2)
+    builder.maze.carve_passage(0, 0, Direction.EAST)
+    geometry = MazeGeometry(rows=2, cols=2)
+    mask = builder.maze.passage_mask()
+
+    cell_walls: list[Segment] = []
+    for cell in builder.maze.traverse_by_cell():
+        points, _ = geometry.cell_points(
+            cell.row, cell.col, mask[cell.row * 2 + cell.col], cell.role
+        )
+        cell_walls.extend(zip(points[::2], points[1::2]))
+
+    row_walls = [
+        segment
+        for row in range(2)
+        for segment in geometry.row_walls(row, bytes(mask[row * 2 : row * 2 + 2]))
+    ]
+    assert cell_walls == row_walls
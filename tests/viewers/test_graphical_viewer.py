@@ -1,18 +1,40 @@
 """Tests for the graphical viewer."""
+import random
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
 from mazy.builders.binary_tree_builder import BinaryTreeBuilder
 from mazy.models.maze import MazeState
+from mazy.builders.base_builder import MazeBuilder
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.eller import EllerBuilder
+from mazy.builders.growing_tree import GrowingTreeBuilder
+from mazy.builders.kruskal import KruskalBuilder
+from mazy.builders.recursive_backtracker import RecursiveBacktrackerBuilder
+from mazy.builders.sidewinder import SidewinderBuilder
+from mazy.builders.vectorized_builder import (
+    VectorizedBinaryTreeBuilder,
+    VectorizedSidewinderBuilder,
+)
+from mazy.builders.wilson import WilsonBuilder
+from mazy.models.maze import MazeBackend
+from mazy.models.viewer import BackpressurePolicy
+from mazy.viewers.geometry import CELL_SIZE, EXTERNAL_SIZE
 from mazy.viewers.graphical_viewer import (
     MazeGraphicalProcessor,
     MazeGraphicalViewer,
-    CELL_SIZE,
-    EXTERNAL_SIZE,
+    contiguous_runs,
 )
 
 
+def filled_cells(processor: MazeGraphicalProcessor) -> int:
+    """Number of cells drawn with a fill."""
+    fills = processor.fill_vertices
+    return int((fills != fills[:, :1]).any(axis=(1, 2)).sum())
+
+
 def test_graphical_viewer_default_values() -> None:
     """Ensure default values are consistent."""
     viewer = MazeGraphicalViewer(BinaryTreeBuilder(rows=2, cols=2))
@@ -46,29 +68,169 @@ def test_graphical_processor_animated() -> None:
     assert processor.maze.state == MazeState.BUILDING
 
     for _ in range(maze_size + 1):
-        processor.process_maze()
+        processor.process_changes()
 
     assert processor.maze.state == MazeState.READY  # type: ignore[comparison-overlap]
+    assert processor.process_changes() == []
 
 
-@pytest.mark.parametrize(("rows", "cols", "expected_centers"), [(2, 2, 3), (2, 3, 5)])
-def test_graphical_processor_process_maze(
+@pytest.mark.parametrize(("rows", "cols", "expected_fills"), [(2, 2, 3), (2, 3, 5)])
+def test_graphical_processor_process_changes(
     rows: int,
     cols: int,
-    expected_centers: int,
+    expected_fills: int,
 ) -> None:
-    """Should return a list of cell coordinate points."""
+    """Should fill the unvisited cells until all of them are visited."""
     builder = BinaryTreeBuilder(rows=rows, cols=cols)
     processor = MazeGraphicalProcessor(builder, animated=True)
-    border_points, center_points = processor.process_maze()
 
-    assert len(border_points) > 0
-    assert len(center_points) == expected_centers  # Only the the first cell visited
+    assert processor.process_changes() == [0]
+    assert filled_cells(processor) == expected_fills  # Only the first cell visited
 
     for _ in range(rows * cols):
-        border_points, center_points = processor.process_maze()
+        processor.process_changes()
+
+    assert filled_cells(processor) == 0  # All cell visited
+
+
+def test_graphical_processor_not_animated_has_no_changes() -> None:
+    """A maze already built should be drawn once, without changes."""
+    processor = MazeGraphicalProcessor(BinaryTreeBuilder(rows=2, cols=3))
+
+    assert processor.process_changes() == []
+    assert filled_cells(processor) == 0
+    assert (processor.wall_vertices != 0).any()
+
+
+def test_graphical_processor_stride() -> None:
+    """Should advance a stride of building steps per frame."""
+    builder = BinaryTreeBuilder(rows=3, cols=4)
+    processor = MazeGraphicalProcessor(builder, animated=True, stride=5)
+
+    assert processor.process_changes() == [0, 1, 2, 3, 4]
+    assert processor.steps == 5
+    assert filled_cells(processor) == 7
+
+    for _ in range(3):
+        processor.process_changes()
+
+    assert processor.finished
+    assert processor.steps == 12
+    assert processor.steps_per_second > 0
+
+
+def test_graphical_processor_frame_budget() -> None:
+    """Should advance as many building steps as fit in the frame budget."""
+    builder = BinaryTreeBuilder(rows=10, cols=10)
+    processor = MazeGraphicalProcessor(builder, animated=True, frame_budget=60_000)
+
+    assert len(processor.process_changes()) == 100
+    assert processor.finished
+    assert processor.steps == 100
+    assert filled_cells(processor) == 0
+
+
+def test_graphical_processor_not_animated_is_finished() -> None:
+    """A maze already built should not take any building step."""
+    processor = MazeGraphicalProcessor(BinaryTreeBuilder(rows=2, cols=3))
+
+    assert processor.finished
+    assert processor.steps_per_second == 0
+
 
-    assert len(center_points) == 0  # All cell visited
+@pytest.mark.parametrize(
+    ("stride", "frame_budget", "message"),
+    [
+        (0, None, "Stride must be a positive number, got 0."),
+        (1, 0, "Frame budget must be positive, got 0."),
+        (1, -5.0, "Frame budget must be positive, got -5.0."),
+    ],
+)
+def test_graphical_processor_invalid_pacing(
+    stride: int, frame_budget: float | None, message: str
+) -> None:
+    """Should raise an error for an invalid stride or frame budget."""
+    with pytest.raises(ValueError, match=message):
+        MazeGraphicalProcessor(
+            BinaryTreeBuilder(rows=2, cols=2),
+            animated=True,
+            stride=stride,
+            frame_budget=frame_budget,
+        )
+
+
+@pytest.mark.parametrize("backend", [MazeBackend.OBJECTS, MazeBackend.COMPACT])
+@pytest.mark.parametrize(
+    "builder_class",
+    [
+        BinaryTreeBuilder,
+        SidewinderBuilder,
+        VectorizedBinaryTreeBuilder,
+        VectorizedSidewinderBuilder,
+        RecursiveBacktrackerBuilder,
+        KruskalBuilder,
+        EllerBuilder,
+        WilsonBuilder,
+        GrowingTreeBuilder,
+        DummyBuilder,
+    ],
+)
+def test_graphical_processor_patches_match_full_update(
+    builder_class: type[MazeBuilder], backend: MazeBackend
+) -> None:
+    """Patching the changed cells of each step should match a full update."""
+    random.seed(7)
+    processor = MazeGraphicalProcessor(builder_class(5, 6, backend), animated=True)
+    everything = range(5 * 6)
+
+    while processor.maze.state != MazeState.READY:
+        processor.process_changes()
+        walls, fills = processor.wall_vertices.copy(), processor.fill_vertices.copy()
+        processor.update_cells(everything)
+
+        assert (processor.wall_vertices == walls).all()
+        assert (processor.fill_vertices == fills).all()
+
+    processor.process_changes()
+    assert filled_cells(processor) == 0
+
+
+@pytest.mark.parametrize("policy", [policy for policy in BackpressurePolicy])
+def test_graphical_processor_threaded(policy: BackpressurePolicy) -> None:
+    """A background build should end with the same vertices as a full update."""
+    random.seed(7)
+    builder = RecursiveBacktrackerBuilder(rows=8, cols=9)
+    processor = MazeGraphicalProcessor(
+        builder, animated=True, threaded=True, queue_size=4, policy=policy
+    )
+    deadline = time.monotonic() + 10
+    while not processor.finished and time.monotonic() < deadline:
+        processor.process_changes()
+
+    walls, fills = processor.wall_vertices.copy(), processor.fill_vertices.copy()
+    processor.update_cells(range(8 * 9))
+    processor.stop()
+
+    assert processor.finished
+    assert processor.steps > 0
+    assert filled_cells(processor) == 0
+    assert (processor.wall_vertices == walls).all()
+    assert (processor.fill_vertices == fills).all()
+
+
+@pytest.mark.parametrize(
+    ("indexes", "expected_runs"),
+    [
+        ([], []),
+        ([3], [(3, 4)]),
+        ([0, 1, 2, 5, 7, 8], [(0, 3), (5, 6), (7, 9)]),
+    ],
+)
+def test_contiguous_runs(
+    indexes: list[int], expected_runs: list[tuple[int, int]]
+) -> None:
+    """Should group consecutive indexes."""
+    assert list(contiguous_runs(indexes)) == expected_runs
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,128 @@
+"""Tests for the raster viewer."""
+import random
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.eller import EllerBuilder
+from mazy.viewers.raster_viewer import (
+    DEFAULT_RASTER_OUTPUT,
+    PALETTE,
+    PNG_SIGNATURE,
+    MazeRasterViewer,
+)
+
+WHITE = [255, 255, 255]
+BLACK = [0, 0, 0]
+
+
+def read_ppm(path: Path) -> npt.NDArray[np.uint8]:
+    """RGB pixels of a binary PPM file."""
+    magic, size, depth, data = path.read_bytes().split(b"\n", 3)
+    width, height = map(int, size.split())
+    assert (magic, depth) == (b"P6", b"255")
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+
+def read_png(path: Path) -> npt.NDArray[np.uint8]:
+    """RGB pixels of a 1-bit palette PNG file, checking its chunks."""
+    content = path.read_bytes()
+    assert content.startswith(PNG_SIGNATURE)
+
+    chunks: dict[bytes, bytes] = {}
+    position = len(PNG_SIGNATURE)
+    while position < len(content):
+        (length,) = struct.unpack(">I", content[position : position + 4])
+        kind = content[position + 4 : position + 8]
+        data = content[position + 8 : position + 8 + length]
+        (checksum,) = struct.unpack(">I", content[position + 8 + length :][:4])
+        assert checksum == zlib.crc32(kind + data)
+        chunks[kind] = chunks.get(kind, b"") + data
+        position += 12 + length
+
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, color_type) == (1, 3)
+    palette = np.frombuffer(chunks[b"PLTE"], dtype=np.uint8).reshape(-1, 3)
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8)
+    scanlines = raw.reshape(height, -1)
+    assert not scanlines[:, 0].any()
+    indexes = np.unpackbits(scanlines[:, 1:], axis=1)[:, :width]
+    return palette[indexes]
+
+
+def test_raster_viewer_default_values() -> None:
+    """Ensure default values are consistent."""
+    viewer = MazeRasterViewer(BinaryTreeBuilder(rows=2, cols=3))
+    assert viewer.name == "raster"
+    assert viewer.output == DEFAULT_RASTER_OUTPUT
+    assert (viewer.width, viewer.height) == (3 * 32 + 66, 2 * 32 + 66)
+
+
+def test_raster_viewer_scales_thumbnails() -> None:
+    """Smaller cells should scale the margins and the walls."""
+    viewer = MazeRasterViewer(BinaryTreeBuilder(rows=2, cols=3), cell_size=4)
+    assert (viewer.margin, viewer.wall_width) == (4, 1)
+    assert (viewer.width, viewer.height) == (3 * 4 + 9, 2 * 4 + 9)
+
+
+def test_raster_viewer_invalid_cell_size() -> None:
+    """Should raise an error when cells can't fit their walls."""
+    with pytest.raises(ValueError, match="Cell size must be at least 2 pixels"):
+        MazeRasterViewer(BinaryTreeBuilder(rows=2, cols=2), cell_size=1)
+
+
+def test_raster_viewer_unknown_format(tmp_path: Path) -> None:
+    """Should raise an error for files of unknown image formats."""
+    viewer = MazeRasterViewer(BinaryTreeBuilder(2, 2), str(tmp_path / "maze.gif"))
+    with pytest.raises(ValueError, match="'gif' is not a valid RasterFormat"):
+        viewer.show_maze()
+
+
+def test_raster_viewer_ppm_pixels(tmp_path: Path) -> None:
+    """Should paint the walls left between the passages of the maze."""
+    output = tmp_path / "maze.ppm"
+    MazeRasterViewer(DummyBuilder(rows=2, cols=2), str(output), 8).show_maze()
+    pixels = read_ppm(output)
+
+    assert pixels.shape == (2 * 8 + 17, 2 * 8 + 17, 3)
+    # Margins
+    assert (pixels[:8] == WHITE).all()
+    assert (pixels[:, -8:] == WHITE).all()
+    # Entrance on the north of the first cell, with the corners around it
+    assert (pixels[8, 9:16] == WHITE).all()
+    assert (pixels[8, [8, 16]] == BLACK).all()
+    # Walls between cells, and the west border
+    assert (pixels[16, 8:25] == BLACK).all()
+    assert (pixels[8:25, [8, 16, 24]] == BLACK).all()
+    # Exit on the south of the last cell
+    assert (pixels[24, 8:17] == BLACK).all()
+    assert (pixels[24, 17:24] == WHITE).all()
+
+
+def test_raster_viewer_png_matches_ppm(tmp_path: Path) -> None:
+    """Both image formats should have the same pixels."""
+    for extension in ("png", "ppm"):
+        random.seed(42)
+        builder = BinaryTreeBuilder(rows=7, cols=5)
+        MazeRasterViewer(builder, str(tmp_path / f"maze.{extension}")).show_maze()
+
+    png, ppm = read_png(tmp_path / "maze.png"), read_ppm(tmp_path / "maze.ppm")
+    assert (png == ppm).all()
+    assert set(map(tuple, png.reshape(-1, 3))) == set(map(tuple, PALETTE))
+
+
+def test_raster_viewer_streams_rows(tmp_path: Path) -> None:
+    """Streaming builders should be painted without allocating the maze."""
+    output = tmp_path / "maze.png"
+    builder = EllerBuilder(rows=300, cols=5)
+    viewer = MazeRasterViewer(builder, str(output), cell_size=4)
+    viewer.show_maze()
+
+    assert read_png(output).shape == (viewer.height, viewer.width, 3)
+    assert "maze" not in builder.__dict__
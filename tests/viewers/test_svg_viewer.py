@@ -0,0 +1,75 @@
+"""Tests for the SVG viewer."""
+import io
+import random
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+
+import pytest
+
+from mazy.builders.binary_tree_builder import BinaryTreeBuilder
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.builders.eller import EllerBuilder
+from mazy.viewers import svg_viewer
+from mazy.viewers.svg_viewer import MazeSVGViewer
+
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+def test_svg_viewer_default_values() -> None:
+    """Ensure default values are consistent."""
+    viewer = MazeSVGViewer(BinaryTreeBuilder(rows=2, cols=2))
+    assert viewer.name == "svg"
+    assert viewer.output is None
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(1, 1), (2, 3), (5, 4)])
+def test_svg_viewer_maze_to_str_is_valid_svg(rows: int, cols: int) -> None:
+    """Should create a well-formed SVG document with the maze size."""
+    root = ElementTree.fromstring(
+        MazeSVGViewer(BinaryTreeBuilder(rows, cols)).maze_to_str()
+    )
+
+    assert root.tag == f"{SVG_NAMESPACE}svg"
+    assert root.get("width") == str(cols * 32 + 64)
+    assert root.get("height") == str(rows * 32 + 64)
+    assert len(root.findall(f".//{SVG_NAMESPACE}path")) > 0
+
+
+def test_svg_viewer_maze_to_str_merges_walls() -> None:
+    """A maze without passages should be drawn with a line per grid line."""
+    svg = MazeSVGViewer(DummyBuilder(rows=2, cols=3)).maze_to_str()
+
+    assert svg.count("<path") == 1
+    assert svg.count("M") == 7
+    assert "M32 32v64" in svg
+    assert "M32 64h96" in svg
+
+
+def test_svg_viewer_splits_long_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Should spread the walls over path elements of bounded size."""
+    monkeypatch.setattr(svg_viewer, "PATH_SEGMENTS", 10)
+    svg = MazeSVGViewer(DummyBuilder(rows=30, cols=40)).maze_to_str()
+
+    assert svg.count("M") == 72
+    assert svg.count("<path") == 8
+
+
+def test_svg_viewer_write_maze_matches_maze_to_str() -> None:
+    """Writing the maze line by line should match the full representation."""
+    random.seed(42)
+    svg = MazeSVGViewer(BinaryTreeBuilder(rows=4, cols=6)).maze_to_str()
+    random.seed(42)
+    file = io.StringIO()
+    MazeSVGViewer(BinaryTreeBuilder(rows=4, cols=6)).write_maze(file)
+
+    assert file.getvalue() == svg + "\n"
+
+
+def test_svg_viewer_show_maze_streams_rows(tmp_path: Path) -> None:
+    """Streaming builders should be written without allocating the maze."""
+    output = tmp_path / "maze.svg"
+    builder = EllerBuilder(rows=50, cols=4)
+    MazeSVGViewer(builder, str(output)).show_maze()
+
+    assert ElementTree.parse(output).getroot().tag == f"{SVG_NAMESPACE}svg"
+    assert "maze" not in builder.__dict__
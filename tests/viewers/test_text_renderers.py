@@ -0,0 +1,96 @@
+"""Tests for the text renderers of each style."""
+import numpy as np
+import pytest
+
+from mazy.builders.dummy_builder import DummyBuilder
+from mazy.models.cell import Direction
+from mazy.models.viewer import TextStyle
+from mazy.viewers.ascii_viewer import MazeTextViewer
+from mazy.viewers.text_renderers import (
+    AsciiRenderer,
+    BlockRenderer,
+    CompactRenderer,
+    UnicodeRenderer,
+    create_renderer,
+    glyph_table,
+    join_glyphs,
+)
+
+
+def layout_builder() -> DummyBuilder:
+    """Builder of a fixed 2x3 maze."""
+    builder = DummyBuilder(rows=2, cols=3)
+    builder.maze.carve_passage(0, 0, Direction.EAST)
+    builder.maze.carve_passage(0, 1, Direction.SOUTH)
+    builder.maze.carve_passage(1, 0, Direction.EAST)
+    builder.maze.carve_passage(1, 1, Direction.EAST)
+    builder.maze.carve_passage(0, 2, Direction.SOUTH)
+    return builder
+
+
+@pytest.mark.parametrize(
+    ("style", "renderer_class"),
+    [
+        (TextStyle.ASCII, AsciiRenderer),
+        (TextStyle.UNICODE, UnicodeRenderer),
+        (TextStyle.COMPACT, CompactRenderer),
+        (TextStyle.BLOCK, BlockRenderer),
+    ],
+)
+def test_create_renderer(style: TextStyle, renderer_class: type) -> None:
+    """Should create the renderer of each style."""
+    assert isinstance(create_renderer(style), renderer_class)
+
+
+def test_glyph_table_ascii_glyphs_take_a_byte() -> None:
+    """ASCII glyphs should be stored as bytes, other glyphs as UTF-16."""
+    assert glyph_table(["+--", "+  "]).dtype == np.uint8
+    assert glyph_table(["┼──", "╵  "]).dtype == np.dtype("<u2")
+
+
+def test_join_glyphs() -> None:
+    """Should join the glyphs of each index."""
+    indexes = np.array([1, 0, 1], dtype=np.uint8)
+
+    assert join_glyphs(glyph_table(["+--", "+  "]), indexes) == "+  +--+  "
+    assert join_glyphs(glyph_table(["┼─", "╵ "]), indexes) == "╵ ┼─╵ "
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    [
+        pytest.param(
+            TextStyle.UNICODE,
+            "╷   ╶───┬───┐\n"
+            "│       │   │\n"
+            "├───╴   ╵   │\n"
+            "│           │\n"
+            "└───────╴   ╵",
+            id="unicode",
+        ),
+        pytest.param(TextStyle.COMPACT, "└┐╷\n╶┴┤", id="compact"),
+        pytest.param(
+            TextStyle.BLOCK,
+            "█ █████\n█   █ █\n███ █ █\n█     █\n█████ █",
+            id="block",
+        ),
+    ],
+)
+def test_text_styles_layout(style: TextStyle, expected: str) -> None:
+    """Should draw the walls left between the passages in each style."""
+    assert MazeTextViewer(layout_builder(), style=style).maze_to_str() == expected
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    [
+        pytest.param(TextStyle.UNICODE, "┌───┐\n│   │\n╵   ╵", id="unicode"),
+        pytest.param(TextStyle.COMPACT, "╷", id="compact"),
+        pytest.param(TextStyle.BLOCK, "███\n█ █\n█ █", id="block"),
+    ],
+)
+def test_text_styles_single_cell(style: TextStyle, expected: str) -> None:
+    """A single cell maze only has the exit open, in each style."""
+    viewer = MazeTextViewer(DummyBuilder(rows=1, cols=1), style=style)
+
+    assert viewer.maze_to_str() == expected